@@ -13,11 +13,28 @@
 # limitations under the License.
 from __future__ import annotations
 
+import sys
+from typing import TYPE_CHECKING
+
 import rich_click as click
-from rich.traceback import install as rich_click_traceback_install
 from rich_click.patch import patch as rich_click_patch
 
-rich_click_traceback_install(suppress=["click", "rich_click", "rich"])
+if TYPE_CHECKING:
+    from types import TracebackType
+
+
+def _rich_excepthook(exc_type: type[BaseException], exc_value: BaseException, traceback: TracebackType | None) -> None:
+    """Install the rich traceback handler on the first uncaught exception, and let it print that exception.
+
+    Importing ``rich.traceback`` loads the syntax highlighting lexers, which would slow down every invocation.
+    """
+    from rich.traceback import install as rich_click_traceback_install  # noqa: PLC0415
+
+    rich_click_traceback_install(suppress=["click", "rich_click", "rich"])
+    sys.excepthook(exc_type, exc_value, traceback)
+
+
+sys.excepthook = _rich_excepthook
 rich_click_patch()
 click.rich_click.text_markup = "markdown"
 click.rich_click.SHOW_ARGUMENTS = True
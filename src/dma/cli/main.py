@@ -25,16 +25,16 @@ from rich.table import Table
 
 from dma.__about__ import __version__ as current_version
 from dma.cli._utils import console
-from dma.collector.dependencies import provide_canonical_queries
-from dma.collector.workflows.collection_extractor.base import CollectionExtractor
-from dma.collector.workflows.readiness_check.base import ReadinessCheck
-from dma.lib.db.base import SourceInfo
-from dma.lib.db.local import get_duckdb_connection
 
 if TYPE_CHECKING:
     from click import Context
     from rich.console import Console
 
+    from dma.lib.db.base import SourceInfo
+
+# The workflows import the database drivers, DuckDB, Arrow and the collection queries, so they are only imported by
+# the commands using them, keeping `dma --help` and argument errors fast.
+
 __all__ = ("app",)
 
 
@@ -116,6 +116,141 @@ def app(ctx: Context) -> None:
     required=False,
     show_default=False,
 )
+@click.option(
+    "--collection-concurrency",
+    "-cc",
+    help="The number of collection queries to execute concurrently against the source database.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--max-concurrent-databases",
+    "-mcd",
+    help="The maximum number of databases to collect in parallel when gathering per database details.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--async-collection",
+    help="Collect data with the async pipeline, overlapping the network round-trips of independent queries.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--batch-size",
+    "-bs",
+    help="Stream result sets through server-side cursors and load them into the local database in batches of this many rows.  Applies to sequential collection.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--statement-timeout",
+    "-st",
+    help="The maximum number of seconds a single collection query may run.  Queries exceeding it are skipped and recorded in `collection_query_status`.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--lock-timeout",
+    "-lt",
+    help="The maximum number of seconds a collection query may wait for a lock before it is skipped.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--collection-deadline",
+    "-cdl",
+    help="The number of seconds after which no further collection query is started.  Running queries are cancelled when it is reached.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--dry-run",
+    help="Only estimate the cost of the collection queries on the source with `EXPLAIN`, without running them.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--max-source-load",
+    "-msl",
+    help="Throttle concurrent collection queries to keep the active sessions (PostgreSQL) or running threads (MySQL) of the source below this number.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--load-sample-interval",
+    "-lsi",
+    help="The number of seconds between two samples of the source load when throttling with `--max-source-load`.",
+    default=5,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--pipeline-per-db",
+    help="Send the per database queries of each database in a single pipelined round-trip.  Applies to PostgreSQL.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--sample-interval",
+    "-si",
+    help="The number of seconds between two samples of the cumulative workload counters.",
+    default=60,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--sample-count",
+    "-sc",
+    help="The number of samples of the cumulative workload counters to gather after the collection.  Per second rates are calculated when more than one sample is gathered.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--duckdb-threads",
+    "-dt",
+    help="The number of threads of the local DuckDB database.  Defaults to `DMA_DUCKDB_THREADS`, or to the cores available to the process.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--duckdb-memory-limit",
+    "-dml",
+    help="The memory limit of the local DuckDB database, such as `4GB`.  Defaults to `DMA_DUCKDB_MEMORY_LIMIT`, or to 75% of the memory available to the process.",
+    default=None,
+    type=str,
+    required=False,
+    show_default=False,
+)
 def collect_data(
     no_prompt: bool,
     db_type: Literal["mysql", "postgres", "mssql", "oracle"],
@@ -125,6 +260,21 @@ def collect_data(
     port: int | None = None,
     database: str | None = None,
     collection_identifier: str | None = None,
+    collection_concurrency: int = 1,
+    max_concurrent_databases: int = 1,
+    async_collection: bool = False,
+    batch_size: int | None = None,
+    statement_timeout: float | None = None,
+    lock_timeout: float | None = None,
+    collection_deadline: float | None = None,
+    sample_interval: float = 60,
+    sample_count: int = 1,
+    pipeline_per_db: bool = False,
+    max_source_load: int | None = None,
+    load_sample_interval: float = 5,
+    dry_run: bool = False,
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
 ) -> None:
     """Process a collection of advisor extracts."""
     print_app_info()
@@ -141,6 +291,8 @@ def collect_data(
         password = prompt.Prompt.ask("Please enter a password", password=True)
     input_confirmed = True if no_prompt else prompt.Confirm.ask("Are you ready to start the assessment?")
     if input_confirmed:
+        from dma.lib.db.base import SourceInfo  # noqa: PLC0415
+
         _collect_data(
             console=console,
             src_info=SourceInfo(
@@ -152,6 +304,21 @@ def collect_data(
             ),
             database=database,
             collection_identifier=collection_identifier,
+            collection_concurrency=collection_concurrency,
+            max_concurrent_databases=max_concurrent_databases,
+            batch_size=batch_size,
+            statement_timeout=statement_timeout,
+            lock_timeout=lock_timeout,
+            collection_deadline=collection_deadline,
+            sample_interval=sample_interval,
+            sample_count=sample_count,
+            pipeline_per_db=pipeline_per_db,
+            max_source_load=max_source_load,
+            load_sample_interval=load_sample_interval,
+            dry_run=dry_run,
+            async_collection=async_collection,
+            duckdb_threads=duckdb_threads,
+            duckdb_memory_limit=duckdb_memory_limit,
         )
     else:
         console.rule("Skipping execution until input is confirmed", align="left")
@@ -165,21 +332,74 @@ def _collect_data(
     working_path: Path | None = None,
     export_path: Path | None = None,
     export_delimiter: str = "|",
+    export_format: Literal["csv", "parquet"] = "csv",
+    export_compression: Literal["zstd", "snappy", "gzip", "uncompressed"] = "zstd",
+    export_row_group_size: int | None = None,
+    export_partitioned: bool = False,
+    export_archive: Literal["zip", "tar.zst"] | None = None,
+    collection_concurrency: int = 1,
+    max_concurrent_databases: int = 1,
+    async_collection: bool = False,
+    batch_size: int | None = None,
+    statement_timeout: float | None = None,
+    lock_timeout: float | None = None,
+    collection_deadline: float | None = None,
+    sample_interval: float = 60,
+    sample_count: int = 1,
+    pipeline_per_db: bool = False,
+    max_source_load: int | None = None,
+    load_sample_interval: float = 5,
+    dry_run: bool = False,
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
 ) -> None:
     _execution_id = f"{src_info.db_type}_{current_version!s}_{datetime.now(tz=timezone.utc).strftime('%y%m%d%H%M%S')}"
-    with get_duckdb_connection(working_path=working_path, export_path=export_path) as local_db:
+    from dma.collector.dependencies import provide_canonical_queries  # noqa: PLC0415
+    from dma.collector.workflows.collection_extractor.base import (  # noqa: PLC0415
+        AsyncCollectionExtractor,
+        CollectionExtractor,
+    )
+    from dma.lib.db.local import get_duckdb_connection  # noqa: PLC0415
+
+    with get_duckdb_connection(
+        working_path=working_path,
+        export_path=export_path,
+        threads=duckdb_threads,
+        memory_limit=duckdb_memory_limit,
+    ) as local_db:
         canonical_query_manager = next(provide_canonical_queries(local_db=local_db, working_path=working_path))
-        collection_extractor = CollectionExtractor(
+        extractor_class = AsyncCollectionExtractor if async_collection else CollectionExtractor
+        collection_extractor = extractor_class(
             local_db=local_db,
             src_info=src_info,
             database=database,
             canonical_query_manager=canonical_query_manager,
             console=console,
             collection_identifier=collection_identifier,
+            collection_concurrency=collection_concurrency,
+            max_concurrent_databases=max_concurrent_databases,
+            batch_size=batch_size,
+            statement_timeout=statement_timeout,
+            lock_timeout=lock_timeout,
+            collection_deadline=collection_deadline,
+            sample_interval=sample_interval,
+            sample_count=sample_count,
+            pipeline_per_db=pipeline_per_db,
+            max_source_load=max_source_load,
+            load_sample_interval=load_sample_interval,
+            dry_run=dry_run,
         )
         collection_extractor.execute()
         if collection_extractor is not None and export_path is not None:
-            collection_extractor.dump_database(export_path=export_path, delimiter=export_delimiter)
+            collection_extractor.dump_database(
+                export_path=export_path,
+                delimiter=export_delimiter,
+                export_format=export_format,
+                compression=export_compression,
+                row_group_size=export_row_group_size,
+                partition_by_collection=export_partitioned,
+                archive_format=export_archive,
+            )
         console.rule("Assessment complete.", align="left")
 
 
@@ -269,6 +489,51 @@ def _collect_data(
     required=False,
     show_default=False,
 )
+@click.option(
+    "--export-format",
+    "-ef",
+    help="The format of the exported tables.  Parquet exports are compressed, and faster to write and to load back.",
+    default="csv",
+    type=click.Choice(["csv", "parquet"]),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--export-compression",
+    "-ec",
+    help="The compression codec of Parquet exports.",
+    default="zstd",
+    type=click.Choice(["zstd", "snappy", "gzip", "uncompressed"]),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--export-row-group-size",
+    "-ergs",
+    help="The number of rows of each row group of Parquet exports.  Defaults to the DuckDB row group size.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--export-partitioned",
+    help="Hive partition the tables of Parquet exports by collection key.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--export-archive",
+    "-ea",
+    help="Write the export to a single `zip` or `tar.zst` archive, with a manifest of the SHA-256 hash of every file, instead of a directory of files.",
+    default=None,
+    type=click.Choice(["zip", "tar.zst"]),
+    required=False,
+    show_default=False,
+)
 @click.option(
     "--working-path",
     "-wp",
@@ -278,6 +543,150 @@ def _collect_data(
     required=False,
     show_default=False,
 )
+@click.option(
+    "--collection-concurrency",
+    "-cc",
+    help="The number of collection queries to execute concurrently against the source database.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--max-concurrent-databases",
+    "-mcd",
+    help="The maximum number of databases to collect in parallel when gathering per database details.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--async-collection",
+    help="Collect data with the async pipeline, overlapping the network round-trips of independent queries.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--batch-size",
+    "-bs",
+    help="Stream result sets through server-side cursors and load them into the local database in batches of this many rows.  Applies to sequential collection.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--statement-timeout",
+    "-st",
+    help="The maximum number of seconds a single collection query may run.  Queries exceeding it are skipped and recorded in `collection_query_status`.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--lock-timeout",
+    "-lt",
+    help="The maximum number of seconds a collection query may wait for a lock before it is skipped.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--collection-deadline",
+    "-cdl",
+    help="The number of seconds after which no further collection query is started.  Running queries are cancelled when it is reached.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--dry-run",
+    help="Only estimate the cost of the collection queries on the source with `EXPLAIN`, without running them.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--max-source-load",
+    "-msl",
+    help="Throttle concurrent collection queries to keep the active sessions (PostgreSQL) or running threads (MySQL) of the source below this number.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--load-sample-interval",
+    "-lsi",
+    help="The number of seconds between two samples of the source load when throttling with `--max-source-load`.",
+    default=5,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--pipeline-per-db",
+    help="Send the per database queries of each database in a single pipelined round-trip.  Applies to PostgreSQL.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--sample-interval",
+    "-si",
+    help="The number of seconds between two samples of the cumulative workload counters.",
+    default=60,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--sample-count",
+    "-sc",
+    help="The number of samples of the cumulative workload counters to gather after the collection.  Per second rates are calculated when more than one sample is gathered.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--resume",
+    help="Resume the latest collection found in the working `assessment.db`, only running the queries it has not completed.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--duckdb-threads",
+    "-dt",
+    help="The number of threads of the local DuckDB database.  Defaults to `DMA_DUCKDB_THREADS`, or to the cores available to the process.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--duckdb-memory-limit",
+    "-dml",
+    help="The memory limit of the local DuckDB database, such as `4GB`.  Defaults to `DMA_DUCKDB_MEMORY_LIMIT`, or to 75% of the memory available to the process.",
+    default=None,
+    type=str,
+    required=False,
+    show_default=False,
+)
 def readiness_assessment(
     no_prompt: bool,
     db_type: Literal["mysql", "postgres", "mssql", "oracle"],
@@ -288,7 +697,28 @@ def readiness_assessment(
     database: str | None = None,
     collection_identifier: str | None = None,
     export: str | None = None,
+    export_format: Literal["csv", "parquet"] = "csv",
+    export_compression: Literal["zstd", "snappy", "gzip", "uncompressed"] = "zstd",
+    export_row_group_size: int | None = None,
+    export_partitioned: bool = False,
+    export_archive: Literal["zip", "tar.zst"] | None = None,
     working_path: str | None = None,
+    collection_concurrency: int = 1,
+    max_concurrent_databases: int = 1,
+    async_collection: bool = False,
+    batch_size: int | None = None,
+    statement_timeout: float | None = None,
+    lock_timeout: float | None = None,
+    collection_deadline: float | None = None,
+    resume: bool = False,
+    sample_interval: float = 60,
+    sample_count: int = 1,
+    pipeline_per_db: bool = False,
+    max_source_load: int | None = None,
+    load_sample_interval: float = 5,
+    dry_run: bool = False,
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
 ) -> None:
     """Process a collection of advisor extracts."""
     print_app_info()
@@ -305,6 +735,8 @@ def readiness_assessment(
         password = prompt.Prompt.ask("Please enter a password", password=True)
     input_confirmed = True if no_prompt else prompt.Confirm.ask("Are you ready to start the assessment?")
     if input_confirmed:
+        from dma.lib.db.base import SourceInfo  # noqa: PLC0415
+
         _readiness_check(
             console=console,
             src_info=SourceInfo(
@@ -318,6 +750,27 @@ def readiness_assessment(
             collection_identifier=collection_identifier,
             working_path=Path(working_path) if working_path else None,
             export_path=Path(export) if export else None,
+            export_format=export_format,
+            export_compression=export_compression,
+            export_row_group_size=export_row_group_size,
+            export_partitioned=export_partitioned,
+            export_archive=export_archive,
+            collection_concurrency=collection_concurrency,
+            max_concurrent_databases=max_concurrent_databases,
+            batch_size=batch_size,
+            statement_timeout=statement_timeout,
+            lock_timeout=lock_timeout,
+            collection_deadline=collection_deadline,
+            resume=resume,
+            sample_interval=sample_interval,
+            sample_count=sample_count,
+            pipeline_per_db=pipeline_per_db,
+            max_source_load=max_source_load,
+            load_sample_interval=load_sample_interval,
+            dry_run=dry_run,
+            async_collection=async_collection,
+            duckdb_threads=duckdb_threads,
+            duckdb_memory_limit=duckdb_memory_limit,
         )
     else:
         console.rule("Skipping execution until input is confirmed", align="left")
@@ -331,9 +784,42 @@ def _readiness_check(
     working_path: Path | None = None,
     export_path: Path | None = None,
     export_delimiter: str = "|",
+    export_format: Literal["csv", "parquet"] = "csv",
+    export_compression: Literal["zstd", "snappy", "gzip", "uncompressed"] = "zstd",
+    export_row_group_size: int | None = None,
+    export_partitioned: bool = False,
+    export_archive: Literal["zip", "tar.zst"] | None = None,
+    collection_concurrency: int = 1,
+    max_concurrent_databases: int = 1,
+    async_collection: bool = False,
+    batch_size: int | None = None,
+    statement_timeout: float | None = None,
+    lock_timeout: float | None = None,
+    collection_deadline: float | None = None,
+    resume: bool = False,
+    sample_interval: float = 60,
+    sample_count: int = 1,
+    pipeline_per_db: bool = False,
+    max_source_load: int | None = None,
+    load_sample_interval: float = 5,
+    dry_run: bool = False,
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
 ) -> None:
     _execution_id = f"{src_info.db_type}_{current_version!s}_{datetime.now(tz=timezone.utc).strftime('%y%m%d%H%M%S')}"
-    with get_duckdb_connection(working_path=working_path, export_path=export_path) as local_db:
+    if resume and export_path is None:
+        console.print(
+            "[yellow]Collections can only be resumed from an exported `assessment.db`; starting a new one.[/]"
+        )
+    from dma.collector.workflows.readiness_check.base import ReadinessCheck  # noqa: PLC0415
+    from dma.lib.db.local import get_duckdb_connection  # noqa: PLC0415
+
+    with get_duckdb_connection(
+        working_path=working_path,
+        export_path=export_path,
+        threads=duckdb_threads,
+        memory_limit=duckdb_memory_limit,
+    ) as local_db:
         workflow = ReadinessCheck(
             local_db=local_db,
             src_info=src_info,
@@ -341,16 +827,297 @@ def _readiness_check(
             console=console,
             collection_identifier=collection_identifier,
             working_path=working_path,
+            collection_concurrency=collection_concurrency,
+            max_concurrent_databases=max_concurrent_databases,
+            batch_size=batch_size,
+            statement_timeout=statement_timeout,
+            lock_timeout=lock_timeout,
+            collection_deadline=collection_deadline,
+            resume=resume,
+            sample_interval=sample_interval,
+            sample_count=sample_count,
+            pipeline_per_db=pipeline_per_db,
+            max_source_load=max_source_load,
+            load_sample_interval=load_sample_interval,
+            dry_run=dry_run,
+            async_collection=async_collection,
         )
         workflow.execute()
         console.print(Padding("", 1, expand=True))
         console.rule("Processing collected data.", align="left")
         workflow.print_summary()
         if workflow.collection_extractor is not None and export_path is not None:
-            workflow.collection_extractor.dump_database(export_path=export_path, delimiter=export_delimiter)
+            workflow.collection_extractor.dump_database(
+                export_path=export_path,
+                delimiter=export_delimiter,
+                export_format=export_format,
+                compression=export_compression,
+                row_group_size=export_row_group_size,
+                partition_by_collection=export_partitioned,
+                archive_format=export_archive,
+            )
         console.rule("Assessment complete.", align="left")
 
 
+@app.command(
+    name="fleet",
+    no_args_is_help=True,
+    short_help="Run the readiness check across every instance listed in an inventory file.",
+)
+@click.option(
+    "--inventory",
+    "-i",
+    help="A CSV or TOML file listing the instances to assess.",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    required=True,
+    show_default=False,
+)
+@click.option(
+    "--export-path",
+    "-o",
+    help="The directory holding one sub directory, with its own `assessment.db`, per instance.",
+    default=Path("fleet"),
+    type=click.Path(file_okay=False, path_type=Path),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--max-workers",
+    "-w",
+    help="The number of worker processes collecting instances in parallel.  Defaults to the number of CPUs.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--max-per-host",
+    "-mph",
+    help="The maximum number of instances of the same host to collect at a time.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--collect-only",
+    help="Only collect the instances, skipping the readiness check.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--collection-concurrency",
+    "-cc",
+    help="The number of collection queries to execute concurrently against each instance.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--max-concurrent-databases",
+    "-mcd",
+    help="The maximum number of databases of each instance to collect in parallel when gathering per database details.",
+    default=1,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--statement-timeout",
+    "-st",
+    help="The maximum number of seconds a single collection query may run.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--lock-timeout",
+    "-lt",
+    help="The maximum number of seconds a collection query may wait for a lock before it is skipped.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--collection-deadline",
+    "-cdl",
+    help="The number of seconds after which no further collection query is started on an instance.",
+    default=None,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--max-source-load",
+    "-msl",
+    help="Throttle concurrent collection queries to keep the active sessions (PostgreSQL) or running threads (MySQL) of the source below this number.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--load-sample-interval",
+    "-lsi",
+    help="The number of seconds between two samples of the source load when throttling with `--max-source-load`.",
+    default=5,
+    type=click.FloatRange(min=0, min_open=True),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--pipeline-per-db",
+    help="Send the per database queries of each database in a single pipelined round-trip.  Applies to PostgreSQL.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--resume",
+    help="Resume the latest collection of each instance found in its `assessment.db`.",
+    type=bool,
+    default=False,
+    required=False,
+    show_default=True,
+    is_flag=True,
+)
+@click.option(
+    "--duckdb-threads",
+    "-dt",
+    help="The number of threads of the local DuckDB database.  Defaults to `DMA_DUCKDB_THREADS`, or to the cores available to the process.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--duckdb-memory-limit",
+    "-dml",
+    help="The memory limit of the local DuckDB database, such as `4GB`.  Defaults to `DMA_DUCKDB_MEMORY_LIMIT`, or to 75% of the memory available to the process.",
+    default=None,
+    type=str,
+    required=False,
+    show_default=False,
+)
+def fleet(
+    inventory: Path,
+    export_path: Path = Path("fleet"),
+    max_workers: int | None = None,
+    max_per_host: int = 1,
+    collect_only: bool = False,
+    collection_concurrency: int = 1,
+    max_concurrent_databases: int = 1,
+    statement_timeout: float | None = None,
+    lock_timeout: float | None = None,
+    collection_deadline: float | None = None,
+    resume: bool = False,
+    pipeline_per_db: bool = False,
+    max_source_load: int | None = None,
+    load_sample_interval: float = 5,
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
+) -> None:
+    """Assess a fleet of database instances in parallel."""
+    from dma.collector.workflows.fleet import FleetCollection, load_inventory  # noqa: PLC0415
+
+    print_app_info()
+    instances = load_inventory(inventory)
+    console.rule(f"Starting the collection of {len(instances)} instances", align="left")
+    workflow = FleetCollection(
+        instances=instances,
+        export_path=export_path,
+        console=console,
+        max_workers=max_workers,
+        max_per_host=max_per_host,
+        readiness_check=not collect_only,
+        collection_options={
+            "collection_concurrency": collection_concurrency,
+            "max_concurrent_databases": max_concurrent_databases,
+            "statement_timeout": statement_timeout,
+            "lock_timeout": lock_timeout,
+            "collection_deadline": collection_deadline,
+            "resume": resume,
+            "pipeline_per_db": pipeline_per_db,
+            "max_source_load": max_source_load,
+            "load_sample_interval": load_sample_interval,
+            "duckdb_threads": duckdb_threads,
+            "duckdb_memory_limit": duckdb_memory_limit,
+        },
+    )
+    results = workflow.execute()
+    workflow.print_summary(results)
+    console.rule("Fleet assessment complete.", align="left")
+
+
+@app.command(
+    name="merge",
+    no_args_is_help=True,
+    short_help="Consolidate many assessment databases into a single fleet database.",
+)
+@click.argument(
+    "sources",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, path_type=Path),
+)
+@click.option(
+    "--output",
+    "-o",
+    help="The fleet database to merge the assessments into.  It is created if it does not exist.",
+    default=Path("fleet.db"),
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=False,
+    show_default=True,
+)
+@click.option(
+    "--duckdb-threads",
+    "-dt",
+    help="The number of threads of the local DuckDB database.  Defaults to `DMA_DUCKDB_THREADS`, or to the cores available to the process.",
+    default=None,
+    type=click.IntRange(min=1),
+    required=False,
+    show_default=False,
+)
+@click.option(
+    "--duckdb-memory-limit",
+    "-dml",
+    help="The memory limit of the local DuckDB database, such as `4GB`.  Defaults to `DMA_DUCKDB_MEMORY_LIMIT`, or to 75% of the memory available to the process.",
+    default=None,
+    type=str,
+    required=False,
+    show_default=False,
+)
+def merge(
+    sources: tuple[Path, ...],
+    output: Path = Path("fleet.db"),
+    duckdb_threads: int | None = None,
+    duckdb_memory_limit: str | None = None,
+) -> None:
+    """Merge assessment databases, or directories containing them, into a fleet database."""
+    from dma.collector.workflows.fleet import FleetMerge, find_assessment_databases  # noqa: PLC0415
+    from dma.lib.db.local import get_duckdb_connection  # noqa: PLC0415
+
+    print_app_info()
+    databases = find_assessment_databases(list(sources))
+    if not databases:
+        console.print("[yellow]No assessment databases were found.[/]")
+        return
+    with get_duckdb_connection(
+        database=str(output.absolute()), threads=duckdb_threads, memory_limit=duckdb_memory_limit
+    ) as local_db:
+        FleetMerge(local_db=local_db, console=console).execute(databases)
+    console.rule(f"Fleet database written to '{output!s}'.", align="left")
+
+
 def print_app_info() -> None:
     table = Table(show_header=False)
     table.add_column("title", style="cyan", width=80)
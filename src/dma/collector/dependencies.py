@@ -13,9 +13,10 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from dma.collector.query_managers.base import CanonicalQueryManager
+from dma.collector.query_managers.base import AsyncCollectionQueryManager, CanonicalQueryManager
+from dma.collector.query_managers.registry import get_queries
 from dma.lib.db.local import get_duckdb_connection
 from dma.lib.exceptions import ApplicationError
 
@@ -23,77 +24,124 @@ if TYPE_CHECKING:
     from collections.abc import Generator, Iterator
     from pathlib import Path
 
+    import anyio
     import duckdb
-    from sqlalchemy.orm import Session
+    from aiosql.queries import Queries
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
 
     from dma.collector.query_managers.base import CollectionQueryManager
+    from dma.types import SupportedSources
 
 
 def provide_collection_query_manager(
-    db_session: Session,
+    connection: Any,
+    db_type: SupportedSources,
     execution_id: str | None = None,
     source_id: str | None = None,
     manual_id: str | None = None,
+    connection_pool: ConnectionPool | None = None,
+    collection_concurrency: int = 1,
 ) -> Iterator[CollectionQueryManager]:
     """Provide collection query manager.
 
-    Uses SQLAlchemy Connection management to establish and retrieve a valid database session.
-
-    The driver dialect is detected from the session and the underlying raw DBAPI connection is fetched and passed to the Query Manager.
+    The driver connection, as opened by :func:`dma.lib.db.base.get_connection`, is passed to the Query Manager of
+    the source type.  An optional connection pool enables concurrent execution of the collection queries.
     """
-    dialect = db_session.bind.dialect if db_session.bind is not None else db_session.get_bind().dialect
-    db_connection = db_session.connection()
-
-    raw_connection = db_connection.engine.raw_connection()
-    if not raw_connection.driver_connection:
-        msg = "Unable to fetch raw connection from session."
-        raise ApplicationError(msg)
-    rdbms_type = dialect.name
-    if rdbms_type == "postgresql":
-        from psycopg.rows import dict_row  # noqa: PLC0415
-
+    if db_type == "POSTGRES":
         from dma.collector.query_managers.postgres import PostgresCollectionQueryManager  # noqa: PLC0415
 
-        raw_connection.driver_connection.row_factory = dict_row
         query_manager: CollectionQueryManager = PostgresCollectionQueryManager(
-            connection=raw_connection.driver_connection,
+            connection=connection,
             manual_id=manual_id,
             source_id=source_id,
             execution_id=execution_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
-    elif rdbms_type == "mysql":
+    elif db_type == "MYSQL":
         from dma.collector.query_managers.mysql import MySQLCollectionQueryManager  # noqa: PLC0415
 
         query_manager = MySQLCollectionQueryManager(
-            connection=raw_connection.driver_connection,
+            connection=connection,
             manual_id=manual_id,
             source_id=source_id,
             execution_id=execution_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
-    elif rdbms_type == "oracle":
+    elif db_type == "ORACLE":
         from dma.collector.query_managers.oracle import OracleCollectionQueryManager  # noqa: PLC0415
 
         query_manager = OracleCollectionQueryManager(
-            connection=raw_connection.driver_connection,
+            connection=connection,
             manual_id=manual_id,
             source_id=source_id,
             execution_id=execution_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
-    elif rdbms_type == "mssql":
+    elif db_type == "MSSQL":
         from dma.collector.query_managers.mssql import SQLServerCollectionQueryManager  # noqa: PLC0415
 
         query_manager = SQLServerCollectionQueryManager(
-            connection=raw_connection.driver_connection,
+            connection=connection,
             manual_id=manual_id,
             source_id=source_id,
             execution_id=execution_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
     else:
-        msg = "Unable to identify driver adapter from dialect."
+        msg = f"{db_type} is not a supported engine."
         raise ApplicationError(msg)
     yield query_manager
 
 
+def provide_async_collection_query_manager(
+    db_type: SupportedSources,
+    connection_pool: AsyncConnectionPool,
+    limiter: anyio.CapacityLimiter | None = None,
+    execution_id: str | None = None,
+    source_id: str | None = None,
+    manual_id: str | None = None,
+    db_version: str | None = None,
+    collection_concurrency: int = 1,
+) -> Iterator[AsyncCollectionQueryManager]:
+    """Provide an async collection query manager.
+
+    The query plan is resolved by the synchronous query manager for the source type while the queries are executed
+    with the matching async aiosql driver adapter over the supplied connection pool.
+    """
+    if db_type == "POSTGRES":
+        from dma.collector.query_managers.postgres import PostgresCollectionQueryManager  # noqa: PLC0415
+
+        query_manager: CollectionQueryManager = PostgresCollectionQueryManager(
+            connection=None,
+            manual_id=manual_id,
+            source_id=source_id,
+            execution_id=execution_id,
+            collection_concurrency=collection_concurrency,
+        )
+    else:
+        msg = f"Async collection is not supported for {db_type}."
+        raise ApplicationError(msg)
+    query_manager.db_version = db_version
+    yield AsyncCollectionQueryManager(
+        query_manager=query_manager,
+        queries=_get_async_queries(db_type),
+        connection_pool=connection_pool,
+        limiter=limiter,
+    )
+
+
+def _get_async_queries(db_type: SupportedSources) -> Queries:
+    """Return the source queries for the async driver adapter, parsed once per process."""
+    if db_type == "POSTGRES":
+        return get_queries("postgres", "apsycopg")
+    msg = f"Async collection is not supported for {db_type}."
+    raise ApplicationError(msg)
+
+
 def provide_canonical_queries(
     local_db: duckdb.DuckDBPyConnection | None = None,
     working_path: Path | None = None,
@@ -13,21 +13,58 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+import contextlib
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, cast
 
-import aiosql
-import psycopg
+import anyio
+import pyarrow as pa
 from rich.padding import Padding
 
 from dma.cli._utils import console
-from dma.lib.db.query_manager import QueryManager
+from dma.collector.query_managers.registry import get_queries
+from dma.lib.db.query_manager import QueryManager, rows_to_record_batch
+from dma.lib.db.throttle import AdaptiveLimiter
 from dma.lib.exceptions import ApplicationError
-from dma.utils import module_to_os_path
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from aiosql.queries import Queries
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+    from rich.console import Console
+    from rich.status import Status
+
+    from dma.collector.query_managers.manifest import QueryManifest
+    from dma.lib.db.schema import SchemaRegistry
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class QueryTimeouts:
+    """Run time bounds of the collection queries.
+
+    ``statement_timeout`` and ``lock_timeout`` are in seconds and apply to each query.  ``deadline`` is a
+    :func:`time.monotonic` timestamp after which no query is started; the statement timeout of a running query is
+    capped to it.
+    """
+
+    statement_timeout: float | None = None
+    lock_timeout: float | None = None
+    deadline: float | None = None
 
-_root_path = module_to_os_path("dma")
+    def get_statement_timeout(self) -> tuple[float | None, bool]:
+        """Return the statement timeout of the next query and whether it is bound by the deadline."""
+        if self.deadline is None:
+            return self.statement_timeout, False
+        remaining = self.deadline - time.monotonic()
+        if self.statement_timeout is None or remaining < self.statement_timeout:
+            return remaining, True
+        return self.statement_timeout, False
 
 
 class CanonicalQueryManager(QueryManager):
@@ -39,32 +76,45 @@ class CanonicalQueryManager(QueryManager):
         execution_id: str | None = None,
         source_id: str | None = None,
         manual_id: str | None = None,
-        queries: Queries = aiosql.from_path(
-            sql_path=f"{_root_path}/collector/sql/canonical/",
-            driver_adapter="duckdb",
-            mandatory_parameters=False,
-        ),
+        queries: Queries | None = None,
     ) -> None:
         self.execution_id = execution_id
         self.source_id = source_id
         self.manual_id = manual_id
-        super().__init__(connection, queries)
+        self.console: Console = console
+        """The console the progress of the scripts is printed to."""
+        super().__init__(connection, queries if queries is not None else get_queries("canonical", "duckdb"))
 
-    def execute_ddl_scripts(self, *args: Any, **kwargs: Any) -> None:
-        """Execute pre-processing queries."""
-        console.print(Padding("CANONICAL DATA MODEL", 1, style="bold", expand=True), width=80)
-        with console.status("[bold green]Creating tables...[/]") as status:
+    def execute_ddl_scripts(self, *args: Any, exclude: str | None = None, **kwargs: Any) -> None:
+        """Execute pre-processing queries.
+
+        Scripts starting with ``exclude`` are not run, leaving their tables and data in place.
+        """
+        self.console.print(Padding("CANONICAL DATA MODEL", 1, style="bold", expand=True), width=80)
+        with self.console.status("[bold green]Creating tables...[/]") as status:
             for script in self.available_queries("ddl"):
+                if exclude is not None and script.startswith(exclude):
+                    status.console.print(rf" [dim grey]:heavy_check_mark: Kept [bold magenta]`{script}`[/][/]")
+                    continue
                 status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
                 self.execute(script)
                 status.console.print(rf" [green]:heavy_check_mark:[/] Created [bold magenta]`{script}`[/]")
             if not self.available_queries("ddl"):
-                console.print(" [dim grey]:heavy_check_mark: No DDL scripts to load[/]")
+                self.console.print(" [dim grey]:heavy_check_mark: No DDL scripts to load[/]")
 
 
 class CollectionQueryManager(QueryManager):
     """Collection Query Manager"""
 
+    load_statement: ClassVar[str | None] = None
+    """A query returning the current load of the source, used to throttle concurrent collection."""
+    explain_prefix: ClassVar[str | None] = None
+    """The prefix turning a collection query into one returning its ``FORMAT JSON`` query plan."""
+    manifest: ClassVar[QueryManifest | None] = None
+    """The collection queries of the source and the versions they apply to."""
+    sample_query_suffixes: ClassVar[tuple[str, ...]] = ()
+    """The suffixes of the collection queries returning cumulative counters, re-run when sampling workload rates."""
+
     def __init__(
         self,
         connection: Any,
@@ -74,14 +124,122 @@ class CollectionQueryManager(QueryManager):
         manual_id: str | None = None,
         db_version: str | None = None,
         expected_queries: set[str] | None = None,
+        connection_pool: ConnectionPool | None = None,
+        collection_concurrency: int = 1,
     ) -> None:
         self.execution_id = execution_id
         self.source_id = source_id
         self.manual_id = manual_id
         self.db_version = db_version
         self.expected_collection_queries = expected_queries
+        self.connection_pool = connection_pool
+        self.collection_concurrency = max(collection_concurrency, 1)
+        self.batch_size: int | None = None
+        self.batch_sink: Callable[[str, pa.RecordBatch], None] | None = None
+        self.result_sink: Callable[[str, Any], None] | None = None
+        """Called with the result set of each query as soon as it finishes, instead of returning it with the others."""
+        self.schema_registry: SchemaRegistry | None = None
+        self.timeouts = QueryTimeouts()
+        self.query_status: list[dict[str, Any]] = []
+        self.completed_queries: set[str] = set()
+        self.finished_queries: set[str] = set()
+        self.pipeline_per_db = False
+        self.load_ceiling: int | None = None
+        self.load_sample_interval: float = 5
+        self.console: Console = console
+        """The console the progress of the queries is printed to."""
         super().__init__(connection, queries)
 
+    def get_target_schema(self, script: str) -> pa.Schema | None:
+        """Return the schema of the table a query is loaded into, if known."""
+        return self.schema_registry.get(script) if self.schema_registry is not None else None
+
+    def enable_streaming(self, sink: Callable[[str, pa.RecordBatch], None], batch_size: int) -> None:
+        """Stream sequentially executed result sets to ``sink`` in batches of ``batch_size`` rows.
+
+        Streamed scripts are reported with an empty result set, so the memory held by a collection is bounded by the
+        batch size rather than by the size of the source catalog.
+        """
+        self.batch_sink = sink
+        self.batch_size = batch_size
+
+    def _add_result(self, results: dict[str, Any], script: str, script_result: Any) -> None:
+        """Add the result set of a finished query to ``results``, or hand it to the result sink when there is one."""
+        if self.result_sink is not None:
+            self.result_sink(script, script_result)
+        else:
+            results[script] = script_result
+
+    def set_timeouts(
+        self,
+        statement_timeout: float | None = None,
+        lock_timeout: float | None = None,
+        deadline: float | None = None,
+    ) -> None:
+        """Bound the run time of the collection queries.
+
+        Queries hitting any of these limits are skipped and recorded in :attr:`query_status`.  See
+        :class:`QueryTimeouts`.
+        """
+        self.timeouts = QueryTimeouts(statement_timeout=statement_timeout, lock_timeout=lock_timeout, deadline=deadline)
+
+    @staticmethod
+    def get_timeout_statement(
+        statement_timeout: float | None,  # noqa: ARG004
+        lock_timeout: float | None,  # noqa: ARG004
+    ) -> tuple[str, tuple[Any, ...]] | None:
+        """Return the statement setting the session timeouts, or ``None`` when the source does not support them."""
+        return None
+
+    @staticmethod
+    def get_timeout_reason(error: Exception) -> str | None:  # noqa: ARG004
+        """Return the timeout that cancelled a query when ``error`` was raised by one, otherwise ``None``."""
+        return None
+
+    @staticmethod
+    def reset_connection(connection: Any) -> None:
+        """Make a connection usable again after one of its queries was cancelled."""
+
+    def record_query_status(self, script: str, reason: str, elapsed: float) -> None:
+        """Record a query skipped because of a timeout."""
+        self.console.print(rf" [yellow]:warning:[/] Skipped [bold magenta]`{script}`[/] ({reason.replace('_', ' ')})")
+        self.query_status.append({
+            "pkey": self.execution_id,
+            "dma_source_id": self.source_id,
+            "dma_manual_id": self.manual_id,
+            "query_name": script,
+            "status": "skipped",
+            "reason": reason,
+            "elapsed_seconds": round(elapsed, 3),
+        })
+
+    def _run_with_timeouts(self, script: str, connection: Any, run: Callable[[], T]) -> T | None:
+        """Run a query under the configured timeouts, returning ``None`` when it was skipped."""
+        statement_timeout, bound_by_deadline = self.timeouts.get_statement_timeout()
+        if bound_by_deadline and cast("float", statement_timeout) <= 0:
+            self.record_query_status(script, "deadline", 0)
+            return None
+        timeout_statement = self.get_timeout_statement(statement_timeout, self.timeouts.lock_timeout)
+        if timeout_statement is not None and (statement_timeout is not None or self.timeouts.lock_timeout is not None):
+            with contextlib.closing(connection.cursor()) as cursor:
+                cursor.execute(*timeout_statement)
+        started = time.monotonic()
+        try:
+            result = run()
+        except Exception as exc:
+            reason = self.get_timeout_reason(exc)
+            if reason is None:
+                raise
+            self.reset_connection(connection)
+            self.record_query_status(
+                script,
+                "deadline" if bound_by_deadline and reason == "statement_timeout" else reason,
+                time.monotonic() - started,
+            )
+            return None
+        self.finished_queries.add(script)
+        return result
+
     def get_collection_queries(self) -> set[str]:
         if self.db_version is None:
             msg = "Database Version was not set.  Ensure the initialization step complete successfully."
@@ -99,6 +257,21 @@ class CollectionQueryManager(QueryManager):
         msg = "Implement this execution method."
         raise NotImplementedError(msg)
 
+    def execute_sample_queries(self) -> dict[str, Any]:
+        """Re-run the collection queries returning cumulative counters, to sample workload rates.
+
+        The queries run under the configured timeouts; the ones that are skipped are left out of the results.
+        """
+        results: dict[str, Any] = {}
+        if not self.sample_query_suffixes:
+            return results
+        for script in sorted(self.get_collection_queries()):
+            if script.endswith(self.sample_query_suffixes):
+                script_result = self._collect_script(script)
+                if script_result is not None:
+                    results[script] = script_result
+        return results
+
     def get_db_version(self) -> str:
         if self.db_version is None:
             msg = "Database Version was not set.  Ensure the initialization step complete successfully."
@@ -148,8 +321,8 @@ class CollectionQueryManager(QueryManager):
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Execute pre-processing queries."""
-        console.print(Padding("SCRIPT INITIALIZATION QUERIES", 1, style="bold", expand=True), width=80)
-        with console.status("[bold green]Executing queries...[/]") as status:
+        self.console.print(Padding("SCRIPT INITIALIZATION QUERIES", 1, style="bold", expand=True), width=80)
+        with self.console.status("[bold green]Executing queries...[/]") as status:
             results: dict[str, Any] = {}
             for script in self.available_queries("init"):
                 status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
@@ -172,20 +345,117 @@ class CollectionQueryManager(QueryManager):
     ) -> dict[str, Any]:
         """Execute pre-processing queries."""
         self.set_identifiers(execution_id=execution_id, source_id=source_id, manual_id=manual_id)
-        console.print(Padding("COLLECTION QUERIES", 1, style="bold", expand=True), width=80)
-        with console.status("[bold green]Executing queries...[/]") as status:
+        self.console.print(Padding("COLLECTION QUERIES", 1, style="bold", expand=True), width=80)
+        with self.console.status("[bold green]Executing queries...[/]") as status:
+            if self.connection_pool is not None and self.collection_concurrency > 1:
+                return self.execute_concurrently(self.get_collection_queries() - self.completed_queries, status=status)
             results: dict[str, Any] = {}
-            for script in self.get_collection_queries():
+            for script in self._order_by_cost(self.get_collection_queries() - self.completed_queries):
                 status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
-                script_result = self.select(
-                    script, PKEY=self.execution_id, DMA_SOURCE_ID=self.source_id, DMA_MANUAL_ID=self.manual_id
-                )
-                results[script] = script_result
-                status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
+                script_result = self._collect_script(script)
+                if script_result is not None:
+                    self._add_result(results, script, script_result)
+                    status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
             if not self.get_collection_queries():
                 status.console.print(" [dim grey]:heavy_check_mark: No collection queries for this database type[/]")
             return results
 
+    def execute_concurrently(self, scripts: set[str], status: Status) -> dict[str, Any]:
+        """Execute independent collection queries in parallel over the connection pool.
+
+        Each script runs on its own pooled connection.  Results are merged into a single dictionary keyed by script
+        name, identical to the one produced by the sequential execution.
+        """
+        if self.connection_pool is None:
+            msg = "A connection pool is required for concurrent execution."
+            raise ApplicationError(msg)
+        results: dict[str, Any] = {}
+        if not scripts:
+            status.console.print(" [dim grey]:heavy_check_mark: No collection queries for this database type[/]")
+            return results
+        status.update(
+            rf" [yellow]*[/] Executing [bold]{len(scripts)}[/] queries over [bold]{self.collection_concurrency}[/] connections"
+        )
+        limiter = self._get_limiter()
+        with ThreadPoolExecutor(
+            max_workers=self.collection_concurrency, thread_name_prefix="dma-collection"
+        ) as executor:
+            futures = {
+                executor.submit(self._select_from_pool, script, limiter): script
+                for script in self._order_by_cost(scripts)
+            }
+            pending = set(futures)
+            while pending:
+                if limiter is not None:
+                    self._throttle(limiter, status)
+                done, pending = wait(
+                    pending,
+                    timeout=limiter.sample_interval if limiter is not None else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    script = futures[future]
+                    script_result = future.result()
+                    if script_result is not None:
+                        self._add_result(results, script, script_result)
+                        status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
+        return results
+
+    def _order_by_cost(self, scripts: set[str]) -> list[str]:
+        """Order queries from the most to the least expensive, so that the longest ones start first."""
+        return self.manifest.order_by_cost(scripts) if self.manifest is not None else sorted(scripts)
+
+    def _get_limiter(self) -> AdaptiveLimiter | None:
+        """Return a limiter keeping the load of the source under the load ceiling, if one is configured."""
+        if self.load_ceiling is None or self.load_statement is None:
+            return None
+        return AdaptiveLimiter(
+            max_limit=self.collection_concurrency,
+            load_ceiling=self.load_ceiling,
+            sample_load=self._sample_load,
+            sample_interval=self.load_sample_interval,
+        )
+
+    @staticmethod
+    def _throttle(limiter: AdaptiveLimiter, status: Status) -> None:
+        limit = limiter.limit
+        if limiter.adjust() != limit and limiter.last_load is not None:
+            status.console.print(
+                rf" [dim grey]Running up to {limiter.limit} queries at a time (source load {limiter.last_load})[/]"
+            )
+
+    def _sample_load(self) -> int | None:
+        """Sample the load of the source on the main connection, which is idle during concurrent collection."""
+        try:
+            with contextlib.closing(self.connection.cursor()) as cursor:
+                cursor.execute(self.load_statement)
+                row = cursor.fetchone()
+        except Exception:  # noqa: BLE001
+            # throttling is best effort, a failed sample keeps the current limit
+            return None
+        if row is None:
+            return None
+        return int(list(row.values())[-1] if isinstance(row, dict) else row[-1])
+
+    def _select_from_pool(self, script: str, limiter: AdaptiveLimiter | None = None) -> pa.Table | None:
+        """Run a single collection query on a connection checked out from the pool, once the limiter allows it."""
+
+        def _select(pooled_connection: Any) -> pa.Table:
+            with contextlib.closing(self.tuple_cursor(pooled_connection)) as cursor:
+                cursor.execute(
+                    self.fn(script).sql,
+                    {"PKEY": self.execution_id, "DMA_SOURCE_ID": self.source_id, "DMA_MANUAL_ID": self.manual_id},
+                )
+                return pa.Table.from_batches([
+                    rows_to_record_batch(cursor.description, cursor.fetchall(), self.get_target_schema(script))
+                ])
+
+        with (
+            limiter.slot() if limiter is not None else contextlib.nullcontext(),
+            cast("ConnectionPool", self.connection_pool).connection() as pooled_connection,
+        ):
+            return self._run_with_timeouts(script, pooled_connection, lambda: _select(pooled_connection))
+
     def execute_extended_collection_queries(
         self,
         execution_id: str | None = None,
@@ -199,18 +469,19 @@ class CollectionQueryManager(QueryManager):
         Returns: None
         """
         self.set_identifiers(execution_id=execution_id, source_id=source_id, manual_id=manual_id)
-        console.print(Padding("EXTENDED COLLECTION QUERIES", 1, style="bold", expand=True), width=80)
-        with console.status("[bold green]Executing queries...[/]") as status:
+        self.console.print(Padding("EXTENDED COLLECTION QUERIES", 1, style="bold", expand=True), width=80)
+        with self.console.status("[bold green]Executing queries...[/]") as status:
             results: dict[str, Any] = {}
-            for script in self.get_extended_collection_queries():
+            for script in self.get_extended_collection_queries() - self.completed_queries:
                 status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
-                script_result = self.select(
-                    script, PKEY=self.execution_id, DMA_SOURCE_ID=self.source_id, DMA_MANUAL_ID=self.manual_id
-                )
-                results[script] = script_result
-                status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
+                script_result = self._collect_script(script)
+                if script_result is not None:
+                    self._add_result(results, script, script_result)
+                    status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
             if not self.get_extended_collection_queries():
-                console.print(" [dim grey]:heavy_check_mark: No extended collection queries for this database type[/]")
+                self.console.print(
+                    " [dim grey]:heavy_check_mark: No extended collection queries for this database type[/]"
+                )
             return results
 
     def execute_per_db_collection_queries(
@@ -223,23 +494,237 @@ class CollectionQueryManager(QueryManager):
     ) -> dict[str, Any]:
         """Execute per DB pre-processing queries."""
         self.set_identifiers(execution_id=execution_id, source_id=source_id, manual_id=manual_id)
-        console.print(Padding("PER DB QUERIES", 1, style="bold", expand=True), width=80)
-        with console.status("[bold green]Executing queries...[/]") as status:
-            results: dict[str, Any] = {}
-            for script in self.get_per_db_collection_queries():
-                status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
-                try:
-                    script_result = self.select(
-                        script, PKEY=self.execution_id, DMA_SOURCE_ID=self.source_id, DMA_MANUAL_ID=self.manual_id
-                    )
-                    results[script] = script_result
-                    status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
-                except psycopg.errors.UndefinedTable:
-                    status.console.print(rf"Skipped `{script}` as the table doesn't exist")
-                except psycopg.errors.InsufficientPrivilege:
-                    status.console.print(rf"Skipped `{script}` due to insufficient privileges.")
+        self.console.print(Padding("PER DB QUERIES", 1, style="bold", expand=True), width=80)
+        with self.console.status("[bold green]Executing queries...[/]") as status:
+            results = self._execute_per_db_scripts(
+                self.get_per_db_collection_queries() - self.completed_queries, status
+            )
             if not self.get_per_db_collection_queries():
                 status.console.print(
                     " [dim grey]:heavy_check_mark: No DB specific collection queries for this database type[/]"
                 )
             return results
+
+    def collect_per_db_collection_queries(self) -> dict[str, Any]:
+        """Execute the per DB queries without a progress display.
+
+        Used by workers that collect several databases in parallel, where only the coordinating thread may own the
+        console status.
+        """
+        return self._execute_per_db_scripts(self.get_per_db_collection_queries() - self.completed_queries)
+
+    def _execute_per_db_scripts(self, scripts: set[str], status: Status | None = None) -> dict[str, Any]:
+        """Execute per DB queries one at a time, reporting progress on ``status`` when given."""
+        results: dict[str, Any] = {}
+        for script in scripts:
+            if status is not None:
+                status.update(rf" [yellow]*[/] Executing [bold magenta]`{script}`[/]")
+            script_result = self._select_per_db_script(script)
+            if script_result is not None:
+                self._add_result(results, script, script_result)
+                if status is not None:
+                    status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
+        return results
+
+    def _select_per_db_script(self, script: str) -> pa.Table | list[dict[str, Any]] | None:
+        """Execute a per DB query, returning ``None`` when it cannot be run on this database."""
+        import psycopg  # noqa: PLC0415
+
+        try:
+            return self._collect_script(script)
+        except (psycopg.errors.UndefinedTable, psycopg.errors.InsufficientPrivilege) as e:
+            self._skip_per_db_script(script, e)
+        return None
+
+    def _skip_per_db_script(self, script: str, error: Exception) -> None:
+        import psycopg  # noqa: PLC0415
+
+        if isinstance(error, psycopg.errors.UndefinedTable):
+            self.console.print(rf"Skipped `{script}` as the table doesn't exist")
+        else:
+            self.console.print(rf"Skipped `{script}` due to insufficient privileges.")
+        # the query cannot run on this database, re-running it would not collect anything more
+        self.finished_queries.add(script)
+
+    def _collect_script(self, script: str) -> pa.Table | list[dict[str, Any]] | None:
+        """Execute a collection query as Arrow, streaming it to the batch sink when streaming is enabled.
+
+        Returns ``None`` when the query was skipped because of a timeout.
+        """
+        binds = {"PKEY": self.execution_id, "DMA_SOURCE_ID": self.source_id, "DMA_MANUAL_ID": self.manual_id}
+        if self.batch_sink is None or self.batch_size is None:
+            return self._run_with_timeouts(
+                script,
+                self.connection,
+                lambda: self.select_arrow(script, schema=self.get_target_schema(script), **binds),
+            )
+        return self._run_with_timeouts(script, self.connection, lambda: self._stream_script(script, **binds))
+
+    def _stream_script(self, script: str, **binds: Any) -> list[dict[str, Any]]:
+        for batch in self.select_batches(
+            script, batch_size=self.batch_size or 10_000, schema=self.get_target_schema(script), **binds
+        ):
+            cast("Callable[[str, pa.RecordBatch], None]", self.batch_sink)(script, batch)
+        return []
+
+
+class AsyncCollectionQueryManager:
+    """Async Collection Query Manager
+
+    Executes the query plan of a :class:`CollectionQueryManager` through an async aiosql driver adapter.  Independent
+    queries run concurrently, each on its own pooled connection, so that their network round-trips overlap.  The
+    number of in-flight queries is bounded by a capacity limiter that may be shared between several managers.
+    """
+
+    def __init__(
+        self,
+        query_manager: CollectionQueryManager,
+        queries: Queries,
+        connection_pool: AsyncConnectionPool,
+        limiter: anyio.CapacityLimiter | None = None,
+    ) -> None:
+        self.query_manager = query_manager
+        self.queries = queries
+        self.connection_pool = connection_pool
+        self.limiter = limiter or anyio.CapacityLimiter(query_manager.collection_concurrency)
+
+    @property
+    def execution_id(self) -> str | None:
+        return self.query_manager.execution_id
+
+    @property
+    def source_id(self) -> str | None:
+        return self.query_manager.source_id
+
+    def get_db_version(self) -> str:
+        return self.query_manager.get_db_version()
+
+    def fn(self, method: str) -> Any:
+        try:
+            return getattr(self.queries, method)
+        except AttributeError as exc:
+            msg = "%s was not found"
+            raise ApplicationError(msg, method) from exc
+
+    async def select_arrow(self, method: str, connection: Any, **binds: Any) -> pa.Table:
+        async with self.fn(f"{method}_cursor")(conn=connection, **binds) as cursor:
+            rows = await cursor.fetchall()
+            return pa.Table.from_batches([
+                rows_to_record_batch(cursor.description, rows, self.query_manager.get_target_schema(method))
+            ])
+
+    async def select_one_value(self, method: str, connection: Any, **binds: Any) -> Any:
+        return await self.fn(method)(conn=connection, **binds)
+
+    async def set_identifiers(
+        self,
+        execution_id: str | None = None,
+        source_id: str | None = None,
+        manual_id: str | None = None,
+        db_version: str | None = None,
+    ) -> None:
+        """Resolve the execution identifiers, running the initialization queries only when needed."""
+        execution_id = execution_id or self.query_manager.execution_id
+        source_id = source_id or self.query_manager.source_id
+        db_version = db_version or self.query_manager.db_version
+        if execution_id is None or source_id is None or db_version is None:
+            init_results = await self.execute_init_queries()
+            execution_id = execution_id or cast("str | None", init_results.get("init_get_execution_id", None))
+            source_id = source_id or cast("str | None", init_results.get("init_get_source_id", None))
+            db_version = db_version or cast("str | None", init_results.get("init_get_db_version", None))
+        self.query_manager.set_identifiers(
+            execution_id=execution_id, source_id=source_id, manual_id=manual_id, db_version=db_version
+        )
+
+    async def execute_init_queries(self) -> dict[str, Any]:
+        """Execute pre-processing queries."""
+        results: dict[str, Any] = {}
+
+        async def _execute(script: str) -> None:
+            async with self.limiter, self.connection_pool.connection() as connection:
+                results[script] = await self.select_one_value(script, connection)
+
+        async with anyio.create_task_group() as tg:
+            for script in self.query_manager.available_queries("init"):
+                tg.start_soon(_execute, script)
+        return results
+
+    async def execute_collection_queries(self) -> dict[str, Any]:
+        """Execute collection queries."""
+        results = await self._execute_scripts(
+            self.query_manager.get_collection_queries() - self.query_manager.completed_queries
+        )
+        self.query_manager.console.print(
+            rf" [green]:heavy_check_mark:[/] Gathered [bold]{len(results)}[/] collection queries"
+        )
+        return results
+
+    async def execute_extended_collection_queries(self) -> dict[str, Any]:
+        """Execute extended collection queries."""
+        results = await self._execute_scripts(
+            self.query_manager.get_extended_collection_queries() - self.query_manager.completed_queries
+        )
+        self.query_manager.console.print(
+            rf" [green]:heavy_check_mark:[/] Gathered [bold]{len(results)}[/] extended collection queries"
+        )
+        return results
+
+    async def execute_per_db_collection_queries(self) -> dict[str, Any]:
+        """Execute per DB queries, skipping the ones that cannot be run on this database."""
+        return await self._execute_scripts(
+            self.query_manager.get_per_db_collection_queries() - self.query_manager.completed_queries, per_db=True
+        )
+
+    async def _execute_scripts(self, scripts: set[str], per_db: bool = False) -> dict[str, Any]:
+        import psycopg  # noqa: PLC0415
+
+        results: dict[str, Any] = {}
+        binds = {
+            "PKEY": self.query_manager.execution_id,
+            "DMA_SOURCE_ID": self.query_manager.source_id,
+            "DMA_MANUAL_ID": self.query_manager.manual_id,
+        }
+
+        async def _execute(script: str) -> None:
+            async with self.limiter, self.connection_pool.connection() as connection:
+                statement_timeout, bound_by_deadline = self.query_manager.timeouts.get_statement_timeout()
+                if bound_by_deadline and cast("float", statement_timeout) <= 0:
+                    self.query_manager.record_query_status(script, "deadline", 0)
+                    return
+                lock_timeout = self.query_manager.timeouts.lock_timeout
+                timeout_statement = self.query_manager.get_timeout_statement(statement_timeout, lock_timeout)
+                if timeout_statement is not None and (statement_timeout is not None or lock_timeout is not None):
+                    await connection.execute(*timeout_statement)
+                started = time.monotonic()
+                try:
+                    script_result = await self.select_arrow(script, connection, **binds)
+                except (psycopg.errors.QueryCanceled, psycopg.errors.LockNotAvailable) as exc:
+                    reason = self.query_manager.get_timeout_reason(exc) or "statement_timeout"
+                    self.query_manager.record_query_status(
+                        script,
+                        "deadline" if bound_by_deadline and reason == "statement_timeout" else reason,
+                        time.monotonic() - started,
+                    )
+                except psycopg.errors.UndefinedTable:
+                    if not per_db:
+                        raise
+                    self.query_manager.console.print(rf"Skipped `{script}` as the table doesn't exist")
+                    self.query_manager.finished_queries.add(script)
+                except psycopg.errors.InsufficientPrivilege:
+                    if not per_db:
+                        raise
+                    self.query_manager.console.print(rf"Skipped `{script}` due to insufficient privileges.")
+                    self.query_manager.finished_queries.add(script)
+                else:
+                    self.query_manager.finished_queries.add(script)
+                    if self.query_manager.result_sink is not None:
+                        self.query_manager.result_sink(script, script_result)
+                    else:
+                        results[script] = script_result
+
+        manifest = self.query_manager.manifest
+        async with anyio.create_task_group() as tg:
+            # the most expensive queries are started first, so they are not left running alone at the end
+            for script in manifest.order_by_cost(scripts) if manifest is not None else sorted(scripts):
+                tg.start_soon(_execute, script)
+        return results
@@ -0,0 +1,195 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import inspect
+import mmap
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from aiosql.queries import Queries
+
+QUERY_BUNDLE_VERSION = 3
+
+
+class BundledQuery(msgspec.Struct, array_like=True):
+    name: str
+    doc: str
+    operation: int
+    sql: str
+    parameters: list[str] | None
+    signature: list[str]
+    attributes: dict[str, dict[str, str]] | None
+    file_name: str
+    line: int
+
+
+class BundledEngine(msgspec.Struct):
+    content_hash: str
+    queries: list[BundledQuery]
+
+
+class QueryBundle(msgspec.Struct):
+    """The queries of every engine, parsed ahead of time and shipped with the package.
+
+    Queries are bundled before they are rewritten for a driver adapter, so a single bundle serves every adapter.  The
+    content hash of each engine identifies the ``.sql`` files it was built from, see :func:`hash_query_sources`.
+    """
+
+    version: int
+    engines: dict[str, BundledEngine]
+
+
+class _UnchangedSQLAdapter:
+    """Stand-in driver adapter keeping the SQL of each query as written, so it can be rewritten for any adapter."""
+
+    @staticmethod
+    def process_sql(query_name: str, op_type: Any, sql: str) -> str:  # noqa: ARG004
+        return sql
+
+
+class AiosqlShim:
+    """The aiosql internals the bundle is built and loaded with.
+
+    ``QueryLoader``, the positional fields of ``QueryDatum`` and ``Queries.load_from_list`` are not part of the public
+    API of aiosql, so they are only used with the versions in :attr:`SUPPORTED_VERSIONS`.  With any other version,
+    :func:`get_aiosql_shim` returns ``None`` and the queries are parsed from the ``.sql`` files.
+    """
+
+    SUPPORTED_VERSIONS = ("15.",)
+
+    @staticmethod
+    def parse_file(sql_file: Path) -> list[BundledQuery]:
+        from aiosql.query_loader import QueryLoader  # noqa: PLC0415
+
+        loader = QueryLoader(_UnchangedSQLAdapter(), None, attribute="__", mandatory_parameters=False)  # type: ignore[arg-type]
+        return [
+            BundledQuery(
+                name=query_datum.query_name,
+                doc=query_datum.doc_comments,
+                operation=query_datum.operation_type.value,
+                sql=query_datum.sql,
+                parameters=query_datum.parameters,
+                signature=list(query_datum.signature.parameters)[1:] if query_datum.signature is not None else [],
+                attributes=query_datum.attributes,
+                file_name=sql_file.name,
+                line=query_datum.floc[1],
+            )
+            for query_datum in loader.load_query_data_from_file(sql_file)
+        ]
+
+    @staticmethod
+    def load(bundled_queries: list[BundledQuery], sql_path: Path, driver_adapter: str) -> Queries:
+        import aiosql  # noqa: PLC0415
+        from aiosql.types import QueryDatum, SQLOperationType  # noqa: PLC0415
+
+        queries = aiosql.from_str("", driver_adapter, mandatory_parameters=False)
+        query_data = []
+        for query in bundled_queries:
+            operation = SQLOperationType(query.operation)
+            signature = inspect.Signature(
+                parameters=[
+                    inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+                    *(inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY) for name in query.signature),
+                ]
+            )
+            query_data.append(
+                QueryDatum(
+                    query.name,
+                    query.doc,
+                    operation,
+                    queries.driver_adapter.process_sql(query.name, operation, query.sql),
+                    None,
+                    signature,
+                    (sql_path / query.file_name, query.line),
+                    query.attributes,
+                    query.parameters,
+                )
+            )
+        return queries.load_from_list(query_data)
+
+
+def get_aiosql_shim() -> AiosqlShim | None:
+    """Return the aiosql shim, or ``None`` when the installed aiosql is not a version it was written for."""
+    import aiosql  # noqa: PLC0415
+
+    return AiosqlShim() if aiosql.__version__.startswith(AiosqlShim.SUPPORTED_VERSIONS) else None
+
+
+def hash_query_sources(sql_path: Path) -> str:
+    """Hash the names and contents of the ``.sql`` files of a directory, with the package and aiosql versions.
+
+    The files are small and few, so hashing them on every load is cheap, and any edit makes the bundle stale.
+    """
+    import aiosql  # noqa: PLC0415
+
+    from dma.__about__ import __version__  # noqa: PLC0415
+
+    content_hash = hashlib.sha256(f"{QUERY_BUNDLE_VERSION}:{__version__}:{aiosql.__version__}".encode())
+    for sql_file in sorted(sql_path.glob("*.sql")):
+        content_hash.update(sql_file.name.encode())
+        content_hash.update(b"\0")
+        content_hash.update(sql_file.read_bytes())
+        content_hash.update(b"\0")
+    return content_hash.hexdigest()
+
+
+def bundle_queries(sql_path: Path) -> BundledEngine:
+    """Parse the queries of a directory into their bundled form."""
+    shim = get_aiosql_shim()
+    if shim is None:
+        msg = f"The query bundle cannot be built with this aiosql version, it requires {', '.join(AiosqlShim.SUPPORTED_VERSIONS)}x."
+        raise ApplicationError(msg)
+    return BundledEngine(
+        content_hash=hash_query_sources(sql_path),
+        queries=[query for sql_file in sorted(sql_path.glob("*.sql")) for query in shim.parse_file(sql_file)],
+    )
+
+
+def build_query_bundle(sql_paths: dict[str, Path]) -> QueryBundle:
+    return QueryBundle(
+        version=QUERY_BUNDLE_VERSION,
+        engines={engine: bundle_queries(sql_path) for engine, sql_path in sql_paths.items()},
+    )
+
+
+def write_query_bundle(bundle_path: Path, sql_paths: dict[str, Path]) -> QueryBundle:
+    bundle = build_query_bundle(sql_paths)
+    bundle_path.write_bytes(msgspec.msgpack.encode(bundle))
+    return bundle
+
+
+def read_query_bundle(bundle_path: Path) -> QueryBundle | None:
+    """Read a query bundle through a memory map, or return ``None`` when it is missing, empty or unreadable."""
+    try:
+        with (
+            bundle_path.open("rb") as bundle_file,
+            mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer,
+        ):
+            bundle = msgspec.msgpack.decode(buffer, type=QueryBundle)
+    except (OSError, ValueError, msgspec.DecodeError):
+        return None
+    return bundle if bundle.version == QUERY_BUNDLE_VERSION else None
+
+
+def load_bundled_queries(shim: AiosqlShim, engine: BundledEngine, sql_path: Path, driver_adapter: str) -> Queries:
+    """Build the queries of a bundled engine for a driver adapter, as ``aiosql.from_path`` would."""
+    return shim.load(engine.queries, sql_path, driver_adapter)
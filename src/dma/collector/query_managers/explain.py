@@ -0,0 +1,73 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import contextlib
+import json
+from typing import TYPE_CHECKING, Any
+
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from dma.collector.query_managers.base import CollectionQueryManager
+
+
+def explain_queries(manager: CollectionQueryManager, phase: str, scripts: set[str]) -> list[dict[str, Any]]:
+    """Estimate the cost of collection queries with ``EXPLAIN``, without running them.
+
+    Queries that cannot be planned on the source, such as those reading from a missing extension, are reported with
+    the planner's error.
+    """
+    if manager.explain_prefix is None:
+        msg = "Query plans are not supported for this database type."
+        raise ApplicationError(msg)
+    binds = {"PKEY": manager.execution_id, "DMA_SOURCE_ID": manager.source_id, "DMA_MANUAL_ID": manager.manual_id}
+    plans: list[dict[str, Any]] = []
+    for script in sorted(scripts):
+        plan: dict[str, Any] = {
+            "pkey": manager.execution_id,
+            "dma_source_id": manager.source_id,
+            "dma_manual_id": manager.manual_id,
+            "query_name": script,
+            "query_phase": phase,
+        }
+        try:
+            with contextlib.closing(manager.connection.cursor()) as cursor:
+                cursor.execute(f"{manager.explain_prefix} {manager.fn(script).sql}", binds)
+                row = cursor.fetchone()
+        except Exception as e:  # noqa: BLE001
+            manager.reset_connection(manager.connection)
+            plans.append({**plan, "error": str(e).strip()})
+            continue
+        plans.append({**plan, **parse_plan(next(iter(row.values())) if isinstance(row, dict) else row[0])})
+    return plans
+
+
+def parse_plan(plan: Any) -> dict[str, Any]:
+    """Extract the estimated cost and rows of a ``FORMAT JSON`` plan, from PostgreSQL or MySQL."""
+    if isinstance(plan, (str, bytes)):
+        plan = json.loads(plan)
+    if isinstance(plan, list):
+        root = plan[0]["Plan"]
+        return {
+            "startup_cost": root.get("Startup Cost"),
+            "total_cost": root.get("Total Cost"),
+            "plan_rows": root.get("Plan Rows"),
+        }
+    cost_info = plan.get("query_block", {}).get("cost_info", {})
+    return {
+        "startup_cost": None,
+        "total_cost": float(cost_info["query_cost"]) if "query_cost" in cost_info else None,
+        "plan_rows": None,
+    }
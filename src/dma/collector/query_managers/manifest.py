@@ -0,0 +1,99 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import math
+import threading
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+QueryScope = Literal["global", "per_db"]
+CostClass = Literal["heavy", "medium", "light"]
+
+_COST_ORDER: dict[CostClass, int] = {"heavy": 0, "medium": 1, "light": 2}
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """A collection query, and the source versions it applies to."""
+
+    name: str
+    target: str | None = None
+    """The collection table the result is loaded into, when it is not named after the query."""
+    scope: QueryScope = "global"
+    min_version: float | None = None
+    """The first version the query applies to."""
+    max_version: float | None = None
+    """The first version the query no longer applies to."""
+    cost: CostClass = "light"
+    """How expensive the query is expected to be, relative to the other collection queries."""
+
+    def applies_to(self, version: float) -> bool:
+        return (self.min_version is None or self.min_version <= version) and (
+            self.max_version is None or version < self.max_version
+        )
+
+
+class QueryManifest:
+    """The collection queries of an engine, compiled into an interval index over the source versions.
+
+    The version bounds of all queries split the versions into intervals, within which the same queries apply.  The
+    queries of every interval are computed once, so resolving the plan of a version is a binary search over the
+    bounds.  Queries are ordered from the most to the least expensive, so that schedulers start the longest queries
+    first.
+    """
+
+    def __init__(self, specs: Iterable[QuerySpec], parse_version: Callable[[str], float]) -> None:
+        self.specs = tuple(specs)
+        self.parse_version = parse_version
+        self.bounds = sorted({
+            bound for spec in self.specs for bound in (spec.min_version, spec.max_version) if bound is not None
+        })
+        self.intervals = [
+            tuple(
+                sorted(
+                    (spec for spec in self.specs if spec.applies_to(lower)),
+                    key=lambda spec: (_COST_ORDER[spec.cost], spec.name),
+                )
+            )
+            for lower in (-math.inf, *self.bounds)
+        ]
+        self.costs = {spec.name: spec.cost for spec in self.specs}
+        self._plans: dict[str, tuple[QuerySpec, ...]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, version: float) -> tuple[QuerySpec, ...]:
+        """Return the queries applying to ``version``."""
+        return self.intervals[bisect_right(self.bounds, version)]
+
+    def get_plan(self, db_version: str) -> tuple[QuerySpec, ...]:
+        """Return the queries applying to a version string reported by the source, parsing each version once."""
+        with self._lock:
+            if db_version not in self._plans:
+                self._plans[db_version] = self.resolve(self.parse_version(db_version))
+            return self._plans[db_version]
+
+    def get_queries(self, db_version: str, scope: QueryScope = "global") -> list[str]:
+        return [spec.name for spec in self.get_plan(db_version) if spec.scope == scope]
+
+    def get_targets(self, db_version: str) -> dict[str, str]:
+        return {spec.name: spec.target for spec in self.get_plan(db_version) if spec.target is not None}
+
+    def order_by_cost(self, scripts: Iterable[str]) -> list[str]:
+        """Order queries from the most to the least expensive; queries missing from the manifest come last."""
+        return sorted(scripts, key=lambda script: (_COST_ORDER.get(self.costs.get(script, "light"), 2), script))
@@ -15,15 +15,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import aiosql
-
 from dma.collector.query_managers.base import CollectionQueryManager
-from dma.utils import module_to_os_path
+from dma.collector.query_managers.registry import get_queries
 
 if TYPE_CHECKING:
     from aiosql.queries import Queries
-
-_root_path = module_to_os_path("dma")
+    from psycopg_pool import ConnectionPool
 
 
 class SQLServerCollectionQueryManager(CollectionQueryManager):
@@ -33,12 +30,20 @@ class SQLServerCollectionQueryManager(CollectionQueryManager):
         execution_id: str | None = None,
         source_id: str | None = None,
         manual_id: str | None = None,
-        queries: Queries = aiosql.from_path(
-            sql_path=f"{_root_path}/collector/sql/sources/mssql/",
-            driver_adapter="pymssql",
-            mandatory_parameters=False,
-        ),
+        connection_pool: ConnectionPool | None = None,
+        collection_concurrency: int = 1,
+        queries: Queries | None = None,
     ) -> None:
         super().__init__(
-            connection=connection, queries=queries, execution_id=execution_id, source_id=source_id, manual_id=manual_id
+            connection=connection,
+            queries=queries if queries is not None else get_queries("mssql", "pymssql"),
+            execution_id=execution_id,
+            source_id=source_id,
+            manual_id=manual_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
+
+    @staticmethod
+    def tuple_cursor(connection: Any) -> Any:
+        return connection.cursor(as_dict=False)
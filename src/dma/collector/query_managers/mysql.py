@@ -13,71 +13,104 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
-
-import aiosql
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from dma.collector.query_managers.base import CollectionQueryManager
-from dma.lib.exceptions import ApplicationError
-from dma.utils import module_to_os_path
+from dma.collector.query_managers.manifest import QueryManifest, QuerySpec
+from dma.collector.query_managers.registry import get_queries
+from dma.collector.util.mysql.helpers import get_db_major_version
 
 if TYPE_CHECKING:
     from aiosql.queries import Queries
+    from psycopg_pool import ConnectionPool
+
+_ER_LOCK_WAIT_TIMEOUT = 1205
+_ER_QUERY_TIMEOUT = 3024
+# MariaDB has neither `information_schema.resource_groups` nor `performance_schema.processlist`
+_MARIADB_COLLECTION_VERSION = 5.0
+
 
-_root_path = module_to_os_path("dma")
+def get_collection_version(db_version: str) -> float:
+    """Return the version the collection queries of a server are chosen for: MariaDB is collected as MySQL 5."""
+    if "MARIADB" in db_version.upper():
+        return _MARIADB_COLLECTION_VERSION
+    return get_db_major_version(db_version)
+
+
+MYSQL_MANIFEST = QueryManifest(
+    [
+        QuerySpec("collection_mysql_5_resource_groups", "mysql_resource_groups", max_version=6),
+        QuerySpec("collection_mysql_base_resource_groups", "mysql_resource_groups", min_version=6),
+        QuerySpec("collection_mysql_5_process_list", "mysql_process_list", max_version=6),
+        QuerySpec("collection_mysql_base_process_list", "mysql_process_list", min_version=6),
+        QuerySpec("collection_mysql_config", "mysql_config"),
+        QuerySpec("collection_mysql_data_types", "mysql_data_types", cost="heavy"),
+        QuerySpec("collection_mysql_database_details", "mysql_database_details", cost="medium"),
+        QuerySpec("collection_mysql_engines", "mysql_engines"),
+        QuerySpec("collection_mysql_plugins", "mysql_plugins"),
+        QuerySpec("collection_mysql_schema_objects", "mysql_schema_objects", cost="heavy"),
+        QuerySpec("collection_mysql_table_details", "mysql_table_details", cost="heavy"),
+        QuerySpec("collection_mysql_users", "mysql_users"),
+    ],
+    parse_version=get_collection_version,
+)
 
 
 class MySQLCollectionQueryManager(CollectionQueryManager):
+    load_statement = "show global status like 'Threads_running'"
+    explain_prefix = "explain format=json"
+    manifest: ClassVar[QueryManifest] = MYSQL_MANIFEST
+
     def __init__(
         self,
         connection: Any,
         execution_id: str | None = None,
         source_id: str | None = None,
         manual_id: str | None = None,
-        queries: Queries = aiosql.from_path(
-            sql_path=f"{_root_path}/collector/sql/sources/mysql/",
-            driver_adapter="pymysql",
-            mandatory_parameters=False,
-        ),
+        connection_pool: ConnectionPool | None = None,
+        collection_concurrency: int = 1,
+        queries: Queries | None = None,
     ) -> None:
         super().__init__(
-            connection=connection, queries=queries, execution_id=execution_id, source_id=source_id, manual_id=manual_id
+            connection=connection,
+            queries=queries if queries is not None else get_queries("mysql", "pymysql"),
+            execution_id=execution_id,
+            source_id=source_id,
+            manual_id=manual_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
 
+    @staticmethod
+    def tuple_cursor(connection: Any) -> Any:
+        from pymysql.cursors import Cursor  # noqa: PLC0415
+
+        return connection.cursor(Cursor)
+
+    @staticmethod
+    def get_timeout_statement(
+        statement_timeout: float | None, lock_timeout: float | None
+    ) -> tuple[str, tuple[Any, ...]] | None:
+        """``max_execution_time`` only bounds read-only selects, which is all the collection runs."""
+        return (
+            "set session max_execution_time = %s, session lock_wait_timeout = %s",
+            (
+                0 if statement_timeout is None else max(int(statement_timeout * 1000), 1),
+                31536000 if lock_timeout is None else max(int(lock_timeout), 1),
+            ),
+        )
+
+    @staticmethod
+    def get_timeout_reason(error: Exception) -> str | None:
+        error_code = error.args[0] if error.args else None
+        if error_code == _ER_QUERY_TIMEOUT:
+            return "statement_timeout"
+        if error_code == _ER_LOCK_WAIT_TIMEOUT:
+            return "lock_timeout"
+        return None
+
     def get_collection_queries(self) -> set[str]:
-        if self.db_version is None:
-            msg = "Database Version was not set.  Ensure the initialization step complete successfully."
-            raise ApplicationError(msg)
-        major_version = int(self.db_version[:1])
-        version_prefix = "base" if major_version > 5.8 else "5"
-        return {
-            f"collection_mysql_{version_prefix}_resource_groups",
-            f"collection_mysql_{version_prefix}_process_list",
-            "collection_mysql_config",
-            "collection_mysql_data_types",
-            "collection_mysql_database_details",
-            "collection_mysql_engines",
-            "collection_mysql_plugins",
-            "collection_mysql_schema_objects",
-            "collection_mysql_table_details",
-            "collection_mysql_users",
-        }
+        return set(self.manifest.get_queries(self.get_db_version()))
 
     def get_collection_filenames(self) -> dict[str, str]:
-        if self.db_version is None:
-            msg = "Database Version was not set.  Ensure the initialization step complete successfully."
-            raise ApplicationError(msg)
-        major_version = int(self.db_version[:1])
-        version_prefix = "base" if major_version > 5.8 else "5"
-        return {
-            f"collection_mysql_{version_prefix}_resource_groups": "mysql_resource_groups",
-            f"collection_mysql_{version_prefix}_process_list": "mysql_process_list",
-            "collection_mysql_config": "mysql_config",
-            "collection_mysql_data_types": "mysql_data_types",
-            "collection_mysql_database_details": "mysql_database_details",
-            "collection_mysql_engines": "mysql_engines",
-            "collection_mysql_plugins": "mysql_plugins",
-            "collection_mysql_schema_objects": "mysql_schema_objects",
-            "collection_mysql_table_details": "mysql_table_details",
-            "collection_mysql_users": "mysql_users",
-        }
+        return self.manifest.get_targets(self.get_db_version())
@@ -19,12 +19,12 @@ import aiosql
 from aiosql.adapters.generic import GenericAdapter
 
 from dma.collector.query_managers.base import CollectionQueryManager
-from dma.utils import module_to_os_path
+from dma.collector.query_managers.registry import get_queries
 
 if TYPE_CHECKING:
     from aiosql.queries import Queries
+    from psycopg_pool import ConnectionPool
 
-_root_path = module_to_os_path("dma")
 
 aiosql.register_adapter("oracledb", GenericAdapter)
 
@@ -36,12 +36,16 @@ class OracleCollectionQueryManager(CollectionQueryManager):
         execution_id: str | None = None,
         source_id: str | None = None,
         manual_id: str | None = None,
-        queries: Queries = aiosql.from_path(
-            sql_path=f"{_root_path}/collector/sql/sources/oracle/",
-            driver_adapter="oracledb",
-            mandatory_parameters=False,
-        ),
+        connection_pool: ConnectionPool | None = None,
+        collection_concurrency: int = 1,
+        queries: Queries | None = None,
     ) -> None:
         super().__init__(
-            connection=connection, queries=queries, execution_id=execution_id, source_id=source_id, manual_id=manual_id
+            connection=connection,
+            queries=queries if queries is not None else get_queries("oracle", "oracledb"),
+            execution_id=execution_id,
+            source_id=source_id,
+            manual_id=manual_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
@@ -13,112 +13,260 @@
 # limitations under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import contextlib
+import time
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import aiosql
+import psycopg
+import pyarrow as pa
+from psycopg.pq import ExecStatus
+from psycopg.rows import tuple_row
 
 from dma.collector.query_managers.base import CollectionQueryManager
+from dma.collector.query_managers.manifest import QueryManifest, QuerySpec
+from dma.collector.query_managers.registry import get_queries
 from dma.collector.util.postgres.helpers import get_db_major_version
-from dma.lib.exceptions import ApplicationError
-from dma.utils import module_to_os_path
+from dma.lib.db.query_manager import rows_to_record_batch
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from aiosql.queries import Queries
+    from psycopg_pool import ConnectionPool
+    from rich.status import Status
 
-_root_path = module_to_os_path("dma")
+
+POSTGRES_MANIFEST = QueryManifest(
+    [
+        QuerySpec("collection_postgres_12_table_details", "postgres_table_details", max_version=13, cost="heavy"),
+        QuerySpec(
+            "collection_postgres_13_table_details",
+            "postgres_table_details",
+            min_version=13,
+            max_version=14,
+            cost="heavy",
+        ),
+        QuerySpec("collection_postgres_base_table_details", "postgres_table_details", min_version=14, cost="heavy"),
+        QuerySpec("collection_postgres_12_database_details", "postgres_database_details", max_version=13),
+        QuerySpec(
+            "collection_postgres_13_database_details", "postgres_database_details", min_version=13, max_version=14
+        ),
+        QuerySpec("collection_postgres_base_database_details", "postgres_database_details", min_version=14),
+        QuerySpec("collection_postgres_12_replication_slots", "postgres_replication_slots", max_version=13),
+        QuerySpec(
+            "collection_postgres_13_replication_slots", "postgres_replication_slots", min_version=13, max_version=14
+        ),
+        QuerySpec("collection_postgres_base_replication_slots", "postgres_replication_slots", min_version=14),
+        QuerySpec("collection_postgres_bg_writer_stats", "postgres_bg_writer_stats", max_version=17),
+        QuerySpec(
+            "collection_postgres_bg_writer_stats_from_pg17", "postgres_bg_writer_stats_from_pg17", min_version=17
+        ),
+        QuerySpec("collection_postgres_applications", "postgres_applications"),
+        QuerySpec("collection_postgres_aws_extension_dependency", "postgres_aws_extension_dependency", cost="medium"),
+        QuerySpec("collection_postgres_aws_oracle_exists", "postgres_aws_oracle_exists"),
+        QuerySpec("collection_postgres_calculated_metrics", "postgres_calculated_metrics", cost="medium"),
+        QuerySpec("collection_postgres_data_types", "postgres_data_types", cost="heavy"),
+        QuerySpec("collection_postgres_index_details", "postgres_index_details", cost="heavy"),
+        QuerySpec("collection_postgres_replication_stats", "postgres_replication_stats"),
+        QuerySpec("collection_postgres_wal_position", "postgres_wal_position"),
+        QuerySpec("collection_postgres_schema_details", "postgres_schema_details", cost="medium"),
+        QuerySpec("collection_postgres_schema_objects", "postgres_schema_objects", cost="heavy"),
+        QuerySpec("collection_postgres_settings", "postgres_settings"),
+        QuerySpec("collection_postgres_source_details", "postgres_source_details"),
+        QuerySpec("collection_postgres_replication_role", "collection_privileges"),
+        QuerySpec("collection_postgres_extensions", "postgres_extensions", scope="per_db"),
+        QuerySpec("collection_postgres_pglogical_provider_node", "postgres_pglogical_details", scope="per_db"),
+        QuerySpec("collection_postgres_pglogical_privileges", scope="per_db"),
+        QuerySpec("collection_postgres_pglogical_schema_usage_privilege", scope="per_db"),
+        QuerySpec("collection_postgres_user_schemas_without_privilege", scope="per_db", cost="medium"),
+        QuerySpec("collection_postgres_user_tables_without_privilege", scope="per_db", cost="heavy"),
+        QuerySpec("collection_postgres_user_views_without_privilege", scope="per_db", cost="medium"),
+        QuerySpec("collection_postgres_user_sequences_without_privilege", scope="per_db", cost="medium"),
+        QuerySpec(
+            "collection_postgres_tables_with_no_primary_key", "postgres_table_details", scope="per_db", cost="heavy"
+        ),
+        QuerySpec(
+            "collection_postgres_tables_with_primary_key_replica_identity",
+            "postgres_table_details",
+            scope="per_db",
+            cost="heavy",
+        ),
+    ],
+    parse_version=get_db_major_version,
+)
 
 
 class PostgresCollectionQueryManager(CollectionQueryManager):
+    load_statement = (
+        "select count(*) as active_sessions from pg_stat_activity "
+        "where state = 'active' and backend_type = 'client backend'"
+    )
+    explain_prefix = "explain (format json)"
+    manifest: ClassVar[QueryManifest] = POSTGRES_MANIFEST
+    sample_query_suffixes: ClassVar[tuple[str, ...]] = (
+        "_database_details",
+        "_bg_writer_stats",
+        "_bg_writer_stats_from_pg17",
+        "_replication_stats",
+        "_wal_position",
+    )
+
     def __init__(
         self,
         connection: Any,
         execution_id: str | None = None,
         source_id: str | None = None,
         manual_id: str | None = None,
-        queries: Queries = aiosql.from_path(
-            sql_path=f"{_root_path}/collector/sql/sources/postgres/",
-            driver_adapter="psycopg",
-            mandatory_parameters=False,
-        ),
+        connection_pool: ConnectionPool | None = None,
+        collection_concurrency: int = 1,
+        queries: Queries | None = None,
     ) -> None:
         super().__init__(
-            connection=connection, queries=queries, execution_id=execution_id, source_id=source_id, manual_id=manual_id
+            connection=connection,
+            queries=queries if queries is not None else get_queries("postgres", "psycopg"),
+            execution_id=execution_id,
+            source_id=source_id,
+            manual_id=manual_id,
+            connection_pool=connection_pool,
+            collection_concurrency=collection_concurrency,
         )
 
-    def get_collection_queries(self) -> set[str]:
-        if self.db_version is None:
-            msg = "Database Version was not set.  Ensure the initialization step complete successfully."
-            raise ApplicationError(msg)
-        major_version = get_db_major_version(self.db_version)
-        version_prefix = "base" if major_version > 13 else "13" if major_version == 13 else "12"
-        bg_writer_stats = (
-            "collection_postgres_bg_writer_stats"
-            if major_version < 17
-            else "collection_postgres_bg_writer_stats_from_pg17"
+    @contextlib.contextmanager
+    def batch_cursor(self, method: str) -> Iterator[Any]:
+        """Open a named server-side cursor so that rows are fetched from the server one batch at a time."""
+        with (
+            self.connection.transaction(),
+            self.connection.cursor(name=f"dma_{method}", row_factory=tuple_row) as cursor,
+        ):
+            yield cursor
+
+    @staticmethod
+    def tuple_cursor(connection: Any) -> Any:
+        return connection.cursor(row_factory=tuple_row)
+
+    @staticmethod
+    def get_timeout_statement(
+        statement_timeout: float | None, lock_timeout: float | None
+    ) -> tuple[str, tuple[Any, ...]] | None:
+        return (
+            "select set_config('statement_timeout', %s, false), set_config('lock_timeout', %s, false)",
+            (_to_milliseconds(statement_timeout), _to_milliseconds(lock_timeout)),
+        )
+
+    @staticmethod
+    def get_timeout_reason(error: Exception) -> str | None:
+        if isinstance(error, psycopg.errors.LockNotAvailable):
+            return "lock_timeout"
+        if isinstance(error, psycopg.errors.QueryCanceled):
+            return "statement_timeout"
+        return None
+
+    @staticmethod
+    def reset_connection(connection: Any) -> None:
+        if not connection.autocommit:
+            connection.rollback()
+
+    def _execute_per_db_scripts(self, scripts: set[str], status: Status | None = None) -> dict[str, Any]:
+        """Execute the per DB queries, sending them in a single pipelined flight when pipelining is enabled.
+
+        A query failing in a pipeline aborts the queries queued after it, which are then sent again in a new flight.
+        """
+        if not self.pipeline_per_db or self.batch_sink is not None or not psycopg.Pipeline.is_supported():
+            return super()._execute_per_db_scripts(scripts, status)
+        results: dict[str, Any] = {}
+        pending = sorted(scripts)
+        while pending:
+            if status is not None:
+                status.update(rf" [yellow]*[/] Executing [bold]{len(pending)}[/] pipelined queries")
+            pending = self._pipeline_scripts(pending, results)
+        if status is not None:
+            for script in sorted(results):
+                status.console.print(rf" [green]:heavy_check_mark:[/] Gathered [bold magenta]`{script}`[/]")
+        return results
+
+    def _pipeline_scripts(self, scripts: list[str], results: dict[str, Any]) -> list[str]:
+        """Send ``scripts`` in one flight, adding their result sets to ``results``.
+
+        Returns the scripts that were aborted by a failing one and still need to be run.
+        """
+        statement_timeout, bound_by_deadline = self.timeouts.get_statement_timeout()
+        if bound_by_deadline and cast("float", statement_timeout) <= 0:
+            for script in scripts:
+                self.record_query_status(script, "deadline", 0)
+            return []
+        cursors: list[tuple[str, psycopg.Cursor[Any]]] = []
+        error: psycopg.Error | None = None
+        started = time.monotonic()
+        try:
+            self._send_pipeline(scripts, statement_timeout, cursors)
+        except psycopg.Error as e:
+            error = e
+        aborted: list[str] = []
+        for script, cursor in cursors:
+            with cursor:
+                if (
+                    cursor.pgresult is not None
+                    and cursor.pgresult.status == ExecStatus.TUPLES_OK
+                    and cursor.description is not None
+                ):
+                    self.finished_queries.add(script)
+                    self._add_result(
+                        results,
+                        script,
+                        pa.Table.from_batches([
+                            rows_to_record_batch(cursor.description, cursor.fetchall(), self.get_target_schema(script))
+                        ]),
+                    )
+                elif error is not None:
+                    # the first query without a result set is the one that failed
+                    self._skip_pipelined_script(script, error, bound_by_deadline, time.monotonic() - started)
+                    error = None
+                else:
+                    aborted.append(script)
+        if error is not None:
+            raise error
+        return aborted
+
+    def _send_pipeline(
+        self, scripts: list[str], statement_timeout: float | None, cursors: list[tuple[str, psycopg.Cursor[Any]]]
+    ) -> None:
+        """Queue the scripts, and the timeouts that apply to them, then flush and read back the whole flight."""
+        binds = {"PKEY": self.execution_id, "DMA_SOURCE_ID": self.source_id, "DMA_MANUAL_ID": self.manual_id}
+        with self.connection.pipeline() as pipeline:
+            timeout_statement = self.get_timeout_statement(statement_timeout, self.timeouts.lock_timeout)
+            if timeout_statement is not None and (
+                statement_timeout is not None or self.timeouts.lock_timeout is not None
+            ):
+                self.connection.execute(*timeout_statement)
+            for script in scripts:
+                cursor = self.connection.cursor(row_factory=tuple_row)
+                cursor.execute(self.fn(script).sql, binds)
+                cursors.append((script, cursor))
+            pipeline.sync()
+
+    def _skip_pipelined_script(
+        self, script: str, error: psycopg.Error, bound_by_deadline: bool, elapsed: float
+    ) -> None:
+        if isinstance(error, (psycopg.errors.UndefinedTable, psycopg.errors.InsufficientPrivilege)):
+            self._skip_per_db_script(script, error)
+            return
+        reason = self.get_timeout_reason(error)
+        if reason is None:
+            raise error
+        self.record_query_status(
+            script, "deadline" if bound_by_deadline and reason == "statement_timeout" else reason, elapsed
         )
-        return {
-            f"collection_postgres_{version_prefix}_table_details",
-            f"collection_postgres_{version_prefix}_database_details",
-            f"collection_postgres_{version_prefix}_replication_slots",
-            "collection_postgres_applications",
-            "collection_postgres_aws_extension_dependency",
-            "collection_postgres_aws_oracle_exists",
-            bg_writer_stats,
-            "collection_postgres_calculated_metrics",
-            "collection_postgres_data_types",
-            "collection_postgres_index_details",
-            "collection_postgres_replication_stats",
-            "collection_postgres_schema_details",
-            "collection_postgres_schema_objects",
-            "collection_postgres_settings",
-            "collection_postgres_source_details",
-            "collection_postgres_replication_role",
-        }
+
+    def get_collection_queries(self) -> set[str]:
+        return set(self.manifest.get_queries(self.get_db_version()))
 
     def get_per_db_collection_queries(self) -> set[str]:
-        if self.db_version is None:
-            msg = "Database Version was not set.  Ensure the initialization step complete successfully."
-            raise ApplicationError(msg)
-        get_db_major_version(self.db_version)
-        return {
-            "collection_postgres_extensions",
-            "collection_postgres_pglogical_provider_node",
-            "collection_postgres_pglogical_privileges",
-            "collection_postgres_pglogical_schema_usage_privilege",
-            "collection_postgres_user_schemas_without_privilege",
-            "collection_postgres_user_tables_without_privilege",
-            "collection_postgres_user_views_without_privilege",
-            "collection_postgres_user_sequences_without_privilege",
-            "collection_postgres_tables_with_no_primary_key",
-            "collection_postgres_tables_with_primary_key_replica_identity",
-        }
+        return set(self.manifest.get_queries(self.get_db_version(), scope="per_db"))
 
     def get_collection_filenames(self) -> dict[str, str]:
-        if self.db_version is None:
-            msg = "Database Version was not set.  Ensure the initialization step complete successfully."
-            raise ApplicationError(msg)
-        major_version = get_db_major_version(self.db_version)
-        version_prefix = "base" if major_version > 13 else "13" if major_version == 13 else "12"
-        return {
-            f"collection_postgres_{version_prefix}_table_details": "postgres_table_details",
-            f"collection_postgres_{version_prefix}_database_details": "postgres_database_details",
-            f"collection_postgres_{version_prefix}_replication_slots": "postgres_replication_slots",
-            "collection_postgres_applications": "postgres_applications",
-            "collection_postgres_aws_extension_dependency": "postgres_aws_extension_dependency",
-            "collection_postgres_aws_oracle_exists": "postgres_aws_oracle_exists",
-            "collection_postgres_bg_writer_stats": "postgres_bg_writer_stats",
-            "collection_postgres_bg_writer_stats_from_pg17": "postgres_bg_writer_stats_from_pg17",
-            "collection_postgres_calculated_metrics": "postgres_calculated_metrics",
-            "collection_postgres_data_types": "postgres_data_types",
-            "collection_postgres_extensions": "postgres_extensions",
-            "collection_postgres_index_details": "postgres_index_details",
-            "collection_postgres_replication_stats": "postgres_replication_stats",
-            "collection_postgres_schema_details": "postgres_schema_details",
-            "collection_postgres_schema_objects": "postgres_schema_objects",
-            "collection_postgres_settings": "postgres_settings",
-            "collection_postgres_source_details": "postgres_source_details",
-            "collection_postgres_pglogical_provider_node": "postgres_pglogical_details",
-            "collection_postgres_tables_with_no_primary_key": "postgres_table_details",
-            "collection_postgres_tables_with_primary_key_replica_identity": "postgres_table_details",
-            "collection_postgres_replication_role": "collection_privileges",
-        }
+        return self.manifest.get_targets(self.get_db_version())
+
+
+def _to_milliseconds(seconds: float | None) -> str:
+    """Format a timeout for ``set_config``; ``0`` disables it."""
+    return "0" if seconds is None else f"{max(int(seconds * 1000), 1)}ms"
@@ -0,0 +1,148 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from dma.collector.query_managers.bundle import (
+    get_aiosql_shim,
+    hash_query_sources,
+    load_bundled_queries,
+    read_query_bundle,
+)
+from dma.lib.exceptions import ApplicationError
+from dma.utils import module_to_os_path
+
+if TYPE_CHECKING:
+    from aiosql.queries import Queries
+
+    from dma.collector.query_managers.bundle import AiosqlShim, QueryBundle
+
+_root_path = module_to_os_path("dma")
+
+QUERY_PATHS: dict[str, str] = {
+    "canonical": "collector/sql/canonical",
+    "postgres": "collector/sql/sources/postgres",
+    "mysql": "collector/sql/sources/mysql",
+    "oracle": "collector/sql/sources/oracle",
+    "mssql": "collector/sql/sources/mssql",
+}
+QUERY_BUNDLE_PATH = Path(f"{_root_path}/collector/sql/queries.bundle")
+
+
+def get_query_paths() -> dict[str, Path]:
+    """Return the directory of the ``.sql`` files of every engine."""
+    return {engine: Path(f"{_root_path}/{sql_path}") for engine, sql_path in QUERY_PATHS.items()}
+
+
+@dataclass
+class QueryLoadTiming:
+    """The time spent loading the queries of an engine for a driver adapter."""
+
+    engine: str
+    driver_adapter: str
+    query_count: int
+    elapsed_seconds: float
+    source: Literal["bundle", "sql"] = "sql"
+
+
+class QueryRegistry:
+    """Load the SQL of each engine on first use, and keep the parsed queries for the rest of the process.
+
+    Queries are memoized per ``(engine, driver_adapter)``, so importing the query managers, or running a command that
+    only needs the queries of one engine, does not parse the SQL of the others.  They are built from the pre-parsed
+    query bundle when it was built from the current ``.sql`` files with the installed aiosql, and parsed from the
+    files otherwise.  Safe to use
+    from several threads.
+    """
+
+    def __init__(self, bundle_path: Path | None = QUERY_BUNDLE_PATH) -> None:
+        self.bundle_path = bundle_path
+        self.queries: dict[tuple[str, str], Queries] = {}
+        self.timings: dict[tuple[str, str], QueryLoadTiming] = {}
+        self._bundle: QueryBundle | None = None
+        self._bundle_read = False
+        self._shim: AiosqlShim | None = None
+        self._lock = threading.Lock()
+
+    def get(self, engine: str, driver_adapter: str) -> Queries:
+        key = (engine, driver_adapter)
+        with self._lock:
+            if key not in self.queries:
+                self.queries[key] = self._load(engine, driver_adapter)
+            return self.queries[key]
+
+    def _load(self, engine: str, driver_adapter: str) -> Queries:
+        import aiosql  # noqa: PLC0415
+
+        if engine not in QUERY_PATHS:
+            msg = f"There are no queries for {engine}."
+            raise ApplicationError(msg)
+        sql_path = get_query_paths()[engine]
+        started = time.perf_counter()
+        bundle = self._get_bundle()
+        bundled = bundle.engines.get(engine) if bundle is not None else None
+        if bundled is not None and self._shim is not None and bundled.content_hash == hash_query_sources(sql_path):
+            queries = load_bundled_queries(self._shim, bundled, sql_path, driver_adapter)
+            source: Literal["bundle", "sql"] = "bundle"
+        else:
+            queries = aiosql.from_path(
+                sql_path=f"{sql_path}/", driver_adapter=driver_adapter, mandatory_parameters=False
+            )
+            source = "sql"
+        self.timings[engine, driver_adapter] = QueryLoadTiming(
+            engine=engine,
+            driver_adapter=driver_adapter,
+            query_count=len(queries.available_queries),
+            elapsed_seconds=time.perf_counter() - started,
+            source=source,
+        )
+        return queries
+
+    def _get_bundle(self) -> QueryBundle | None:
+        if not self._bundle_read and self.bundle_path is not None:
+            self._shim = get_aiosql_shim()
+            self._bundle = read_query_bundle(self.bundle_path) if self._shim is not None else None
+            self._bundle_read = True
+        return self._bundle
+
+    def get_timings(self) -> list[QueryLoadTiming]:
+        """Return the load time of every set of queries loaded so far, in load order."""
+        with self._lock:
+            return list(self.timings.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self.queries.clear()
+            self.timings.clear()
+            self._bundle = None
+            self._bundle_read = False
+            self._shim = None
+
+
+query_registry = QueryRegistry()
+
+
+def get_queries(engine: str, driver_adapter: str) -> Queries:
+    """Return the queries of ``engine`` for ``driver_adapter``, loading them on first use."""
+    return query_registry.get(engine, driver_adapter)
+
+
+def get_load_timings() -> list[QueryLoadTiming]:
+    """Return the load time of every set of queries loaded so far by this process, printed after a collection."""
+    return query_registry.get_timings()
@@ -0,0 +1,46 @@
+/*
+ Copyright 2024 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ https://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+ */
+-- name: ddl-collection-status-01!
+create or replace table collection_query_status(
+    pkey varchar,
+    dma_source_id varchar,
+    dma_manual_id varchar,
+    database_name varchar,
+    query_name varchar,
+    status varchar,
+    reason varchar,
+    elapsed_seconds double
+);
+
+create or replace table collection_checkpoint(
+    pkey varchar,
+    database_name varchar,
+    query_name varchar,
+    completed_at timestamp with time zone default current_timestamp
+);
+
+create or replace table collection_query_plan(
+    pkey varchar,
+    dma_source_id varchar,
+    dma_manual_id varchar,
+    database_name varchar,
+    query_name varchar,
+    query_phase varchar,
+    startup_cost double,
+    total_cost double,
+    plan_rows bigint,
+    error varchar
+);
@@ -911,3 +911,53 @@ create or replace table collection_postgres_pglogical_provider_node(
     node_name VARCHAR,
     database_name VARCHAR
 );
+
+create or replace table collection_postgres_wal_position(
+    pkey VARCHAR,
+    dma_source_id VARCHAR,
+    dma_manual_id VARCHAR,
+    in_recovery BOOLEAN,
+    wal_lsn VARCHAR
+);
+
+create or replace table collection_postgres_12_database_details_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_12_database_details limit 0;
+
+create or replace table collection_postgres_13_database_details_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_13_database_details limit 0;
+
+create or replace table collection_postgres_base_database_details_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_base_database_details limit 0;
+
+create or replace table collection_postgres_bg_writer_stats_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_bg_writer_stats limit 0;
+
+create or replace table collection_postgres_bg_writer_stats_from_pg17_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_bg_writer_stats_from_pg17 limit 0;
+
+create or replace table collection_postgres_replication_stats_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_replication_stats limit 0;
+
+create or replace table collection_postgres_wal_position_samples as
+select null::integer as sample_id, null::timestamp with time zone as sampled_at, *
+from collection_postgres_wal_position limit 0;
+
+create or replace table collection_postgres_counter_rates(
+    pkey VARCHAR,
+    dma_source_id VARCHAR,
+    dma_manual_id VARCHAR,
+    metric_category VARCHAR,
+    object_name VARCHAR,
+    metric_name VARCHAR,
+    sample_id INTEGER,
+    sampled_at TIMESTAMP WITH TIME ZONE,
+    elapsed_seconds DOUBLE,
+    metric_delta DOUBLE,
+    rate_per_second DOUBLE
+);
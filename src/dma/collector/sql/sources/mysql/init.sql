@@ -14,10 +14,14 @@
  limitations under the License.
  */
 -- name: init-get-db-version$
-select if(
-    version() rlike '^[0-9]+\.[0-9]+\.[0-9]+$' = 1,
-    version(),
-    concat(SUBSTRING_INDEX(VERSION(), '.', 2), '.0')
+-- MariaDB servers keep their `-MariaDB` suffix, so they are collected with the queries they support
+select concat(
+    if(
+      version() rlike '^[0-9]+\.[0-9]+\.[0-9]+$' = 1,
+      version(),
+      concat(SUBSTRING_INDEX(VERSION(), '.', 2), '.0')
+    ),
+    if(upper(version()) like '%MARIADB%', '-MariaDB', '')
   ) as db_version;
 
 -- name: init-get-execution-id$
@@ -0,0 +1,26 @@
+/*
+ Copyright 2024 Google LLC
+
+ Licensed under the Apache License, Version 2.0 (the "License");
+ you may not use this file except in compliance with the License.
+ You may obtain a copy of the License at
+
+ https://www.apache.org/licenses/LICENSE-2.0
+
+ Unless required by applicable law or agreed to in writing, software
+ distributed under the License is distributed on an "AS IS" BASIS,
+ WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ See the License for the specific language governing permissions and
+ limitations under the License.
+ */
+-- name: collection-postgres-wal-position
+-- the WAL write position of a primary, or the WAL receive position of a standby, sampled to compute the WAL rate of
+-- servers without replicas
+select :PKEY as pkey,
+  :DMA_SOURCE_ID as dma_source_id,
+  :DMA_MANUAL_ID as dma_manual_id,
+  pg_is_in_recovery() as in_recovery,
+  case
+    when pg_is_in_recovery() then pg_last_wal_receive_lsn()
+    else pg_current_wal_lsn()
+  end::text as wal_lsn;
@@ -13,7 +13,7 @@
 # limitations under the License.
 from __future__ import annotations
 
-from dma.collector.workflows.collection_extractor import CollectionExtractor
+from dma.collector.workflows.collection_extractor import AsyncCollectionExtractor, CollectionExtractor
 from dma.collector.workflows.readiness_check import ReadinessCheck
 
-__all__ = ("CollectionExtractor", "ReadinessCheck")
+__all__ = ("AsyncCollectionExtractor", "CollectionExtractor", "ReadinessCheck")
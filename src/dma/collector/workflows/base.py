@@ -15,15 +15,22 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Literal
 
-import polars as pl
+from dma.lib.db.archive import export_archive, get_archive_name
+from dma.lib.db.export import export_database
+from dma.lib.db.query_manager import rows_to_record_batch
+from dma.lib.db.schema import SchemaRegistry
+from dma.lib.exceptions import ApplicationError
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+    import pyarrow as pa
     from duckdb import DuckDBPyConnection
     from rich.console import Console
 
     from dma.collector.query_managers.base import CanonicalQueryManager
+    from dma.lib.db.archive import ArchiveFormat
+    from dma.lib.db.export import ExportFormat, ParquetCompression
 
 
 class BaseWorkflow:
@@ -41,29 +48,78 @@ class BaseWorkflow:
         self.console = console
         self.db_type = db_type
         self.canonical_query_manager = canonical_query_manager
+        self.canonical_query_manager.console = console
+        self.schemas = SchemaRegistry(local_db)
 
     def execute(self) -> None:
         """Execute Workflow"""
         self.canonical_query_manager.execute_ddl_scripts()
+        self.schemas.load()
 
-    def import_to_table(self, data: dict[str, list[dict]]) -> None:
+    def import_to_table(self, data: dict[str, list[dict] | pa.Table]) -> None:
         """Load a dictionary of result sets into duckdb.
 
         The key of the dictionary becomes the table name in the database.
         """
         for table_name, table_data in data.items():
-            if len(table_data) > 0:
-                column_names = table_data[0].keys()
-                self.local_db.register(
-                    f"obj_{table_name}", pl.from_dicts(table_data, strict=False, infer_schema_length=10000)
-                )
-                self.local_db.execute(
-                    f"insert into {table_name}({', '.join(column_name for column_name in column_names)}) select {', '.join(column_name for column_name in column_names)} from obj_{table_name}"  # noqa: S608
+            self.append_to_table(table_name, table_data)
+
+    def append_to_table(self, table_name: str, table_data: list[dict] | pa.Table | pa.RecordBatch) -> None:
+        """Append a batch of rows to a table.
+
+        Also used as the sink for streamed result sets, so it may be called several times for the same table.  Arrow
+        data is scanned by DuckDB directly; lists of dicts are first converted to Arrow using the column types of the
+        target table.
+        """
+        if len(table_data) > 0:
+            if isinstance(table_data, list):
+                table_data = rows_to_record_batch(
+                    [(column_name,) for column_name in table_data[0]],
+                    [tuple(row.values()) for row in table_data],
+                    self.schemas.get(table_name),
                 )
+            column_names = table_data.schema.names
+            self.local_db.register(f"obj_{table_name}", table_data)
+            self.local_db.execute(
+                f"insert into {table_name}({', '.join(column_name for column_name in column_names)}) select {', '.join(column_name for column_name in column_names)} from obj_{table_name}"  # noqa: S608
+            )
 
-                self.local_db.execute(f"drop view obj_{table_name}")
+            self.local_db.execute(f"drop view obj_{table_name}")
 
-    def dump_database(self, export_path: Path, delimiter: str = "|") -> None:
-        """Export the entire database with DDLs and data as CSV"""
-        self.local_db.execute(f"export database '{export_path!s}' (format csv, delimiter '{delimiter}')")
+    def dump_database(
+        self,
+        export_path: Path,
+        delimiter: str = "|",
+        export_format: ExportFormat = "csv",
+        compression: ParquetCompression = "zstd",
+        row_group_size: int | None = None,
+        partition_by_collection: bool = False,
+        archive_format: ArchiveFormat | None = None,
+    ) -> None:
+        """Export the entire database with DDLs and data as CSV or Parquet, optionally into a single archive"""
+        if archive_format is not None:
+            if partition_by_collection:
+                msg = "Partitioned exports cannot be written to an archive."
+                raise ApplicationError(msg)
+            archive_path = export_path / get_archive_name(archive_format)
+            export_archive(
+                self.local_db,
+                archive_path,
+                archive_format=archive_format,
+                export_format=export_format,
+                delimiter=delimiter,
+                compression=compression,
+                row_group_size=row_group_size,
+            )
+            self.console.print(f"Database exported to '{archive_path!s}'")
+            return
+        export_database(
+            self.local_db,
+            export_path,
+            export_format=export_format,
+            delimiter=delimiter,
+            compression=compression,
+            row_group_size=row_group_size,
+            partition_by_collection=partition_by_collection,
+        )
         self.console.print(f"Database exported to '{export_path!s}'")
@@ -13,6 +13,6 @@
 # limitations under the License.
 from __future__ import annotations
 
-from dma.collector.workflows.collection_extractor.base import CollectionExtractor
+from dma.collector.workflows.collection_extractor.base import AsyncCollectionExtractor, CollectionExtractor
 
-__all__ = ("CollectionExtractor",)
+__all__ = ("AsyncCollectionExtractor", "CollectionExtractor")
@@ -25,6 +25,105 @@ if TYPE_CHECKING:
     from dma.collector.query_managers.base import CanonicalQueryManager
 
 
+def _lsn_to_bytes(column: str) -> str:
+    """Convert a textual ``pg_lsn`` (``16/B374D848``) into a byte position."""
+    return f"(('0x' || split_part({column}, '/', 1))::bigint * 4294967296 + ('0x' || split_part({column}, '/', 2))::bigint)"
+
+
+def _counters(*columns: str) -> dict[str, str]:
+    return {column: column for column in columns}
+
+
+_DATABASE_COUNTERS = _counters(
+    "txn_commit_count",
+    "txn_rollback_count",
+    "blocks_read_count",
+    "blocks_hit_count",
+    "tup_returned_count",
+    "tup_fetched_count",
+    "tup_inserted_count",
+    "tup_updated_count",
+    "tup_deleted_count",
+    "temporary_file_bytes_written",
+    "block_read_time_ms",
+    "block_write_time_ms",
+)
+
+# sampled table -> (expression naming the sampled object, metric name -> counter expression)
+SAMPLED_COUNTERS: dict[str, tuple[str, dict[str, str]]] = {
+    "collection_postgres_12_database_details": ("database_name", _DATABASE_COUNTERS),
+    "collection_postgres_13_database_details": ("database_name", _DATABASE_COUNTERS),
+    "collection_postgres_base_database_details": ("database_name", _DATABASE_COUNTERS),
+    "collection_postgres_bg_writer_stats": (
+        "'instance'",
+        _counters(
+            "checkpoints_timed",
+            "checkpoints_requested",
+            "buffers_checkpoint",
+            "buffers_clean",
+            "buffers_backend",
+            "buffers_allocated",
+        ),
+    ),
+    "collection_postgres_bg_writer_stats_from_pg17": (
+        "'instance'",
+        _counters("buffers_clean", "max_written_clean", "buffers_allocated"),
+    ),
+    "collection_postgres_replication_stats": (
+        "coalesce(application_name, pid)",
+        {"wal_sent_bytes": _lsn_to_bytes("sent_lsn"), "wal_replayed_bytes": _lsn_to_bytes("replay_lsn")},
+    ),
+    "collection_postgres_wal_position": ("'instance'", {"wal_bytes": _lsn_to_bytes("wal_lsn")}),
+}
+
+
+def clear_counter_samples_postgres(local_db: duckdb.DuckDBPyConnection) -> None:
+    """Delete the counter samples and rates of a previous run."""
+    for table_name in SAMPLED_COUNTERS:
+        local_db.execute(f"delete from {table_name}_samples")  # noqa: S608
+    local_db.execute("delete from collection_postgres_counter_rates")
+
+
+def calculate_counter_rates_postgres(local_db: duckdb.DuckDBPyConnection) -> None:
+    """Compute the per second rate of each counter between consecutive samples.
+
+    Rates are not computed across a counter reset, where the delta is negative.
+    """
+    for table_name, (object_name, counters) in SAMPLED_COUNTERS.items():
+        sample_table = f"{table_name}_samples"
+        exists = local_db.execute(
+            "select count(*) from information_schema.tables where table_schema = 'main' and table_name = ?",
+            [sample_table],
+        ).fetchone()
+        if exists is None or exists[0] == 0:
+            continue
+        local_db.execute(f"""
+            insert into collection_postgres_counter_rates
+            with metrics as (
+                unpivot (
+                    select pkey, dma_source_id, dma_manual_id, sample_id, sampled_at,
+                        {object_name}::varchar as object_name,
+                        {", ".join(f"({expression})::double as {metric}" for metric, expression in counters.items())}
+                    from {sample_table}
+                )
+                on {", ".join(counters)}
+                into name metric_name value metric_value
+            ),
+            deltas as (
+                select *,
+                    epoch(sampled_at - lag(sampled_at) over w) as elapsed_seconds,
+                    metric_value - lag(metric_value) over w as metric_delta
+                from metrics
+                window w as (partition by object_name, metric_name order by sample_id)
+            )
+            select pkey, dma_source_id, dma_manual_id, '{table_name}', object_name, metric_name, sample_id, sampled_at,
+                elapsed_seconds, metric_delta,
+                case when metric_delta >= 0 and elapsed_seconds > 0 then metric_delta / elapsed_seconds end
+            from deltas
+            where elapsed_seconds is not null
+        """)  # noqa: S608
+
+
 def print_summary_postgres(
     console: Console,
     local_db: duckdb.DuckDBPyConnection,
@@ -33,9 +132,35 @@ def print_summary_postgres(
     """Print Summary of the Migration Readiness Assessment."""
     summary_table = Table(show_edge=False, width=80)
     print_database_details(console=console, local_db=local_db, manager=manager)
+    print_counter_rates(console=console, local_db=local_db)
     console.print(summary_table)
 
 
+def print_counter_rates(console: Console, local_db: duckdb.DuckDBPyConnection) -> None:
+    """Print the average and peak per second rates of the sampled counters, summed over all objects."""
+    counter_rates = local_db.sql(
+        """
+            select metric_name, round(avg(rate_per_second), 2), round(max(rate_per_second), 2)
+            from (
+                select sample_id, metric_category, metric_name, sum(rate_per_second) as rate_per_second
+                from collection_postgres_counter_rates
+                group by sample_id, metric_category, metric_name
+            )
+            group by metric_name
+            order by metric_name
+        """,
+    ).fetchall()
+    if not counter_rates:
+        return
+    rates_table = Table(show_edge=False, width=80)
+    rates_table.add_column("Counter", justify="right", style="green")
+    rates_table.add_column("Avg / sec", justify="right", style="green")
+    rates_table.add_column("Max / sec", justify="right", style="green")
+    for row in counter_rates:
+        rates_table.add_row(*[str(col) for col in row])
+    console.print(rates_table)
+
+
 def print_database_details(
     console: Console,
     local_db: duckdb.DuckDBPyConnection,
@@ -13,23 +13,39 @@
 # limitations under the License.
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
+import anyio
+import pyarrow as pa
+from rich.padding import Padding
 from rich.table import Table
-from sqlalchemy.orm import Session
 
 from dma.__about__ import __version__ as current_version
-from dma.collector.dependencies import provide_collection_query_manager
+from dma.collector.dependencies import provide_async_collection_query_manager, provide_collection_query_manager
+from dma.collector.query_managers.registry import get_load_timings
 from dma.collector.workflows.base import BaseWorkflow
-from dma.lib.db.base import SourceInfo, get_engine
+from dma.collector.workflows.collection_extractor.checkpoints import CollectionCheckpoints
+from dma.lib.db.base import SourceInfo, get_async_connection_pool
+from dma.lib.db.connections import ConnectionManager
 from dma.lib.exceptions import ApplicationError
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from duckdb import DuckDBPyConnection
+    from psycopg_pool import ConnectionPool
     from rich.console import Console
 
-    from dma.collector.query_managers.base import CanonicalQueryManager, CollectionQueryManager
+    from dma.collector.query_managers.base import (
+        AsyncCollectionQueryManager,
+        CanonicalQueryManager,
+        CollectionQueryManager,
+    )
 
 
 class CollectionExtractor(BaseWorkflow):
@@ -41,47 +57,391 @@ class CollectionExtractor(BaseWorkflow):
         canonical_query_manager: CanonicalQueryManager,
         console: Console,
         collection_identifier: str | None,
+        collection_concurrency: int = 1,
+        max_concurrent_databases: int = 1,
+        batch_size: int | None = None,
+        statement_timeout: float | None = None,
+        lock_timeout: float | None = None,
+        collection_deadline: float | None = None,
+        resume: bool = False,
+        sample_interval: float = 60,
+        sample_count: int = 1,
+        pipeline_per_db: bool = False,
+        max_source_load: int | None = None,
+        load_sample_interval: float = 5,
+        dry_run: bool = False,
     ) -> None:
         self.src_info = src_info
         self.database = database
         self.collection_identifier = collection_identifier
+        self.collection_concurrency = collection_concurrency
+        self.max_concurrent_databases = max_concurrent_databases
+        self.batch_size = batch_size
+        self.statement_timeout = statement_timeout
+        self.lock_timeout = lock_timeout
+        self.collection_deadline = collection_deadline
+        self.deadline: float | None = None
+        self.resume = resume
+        self.sample_interval = sample_interval
+        self.sample_count = sample_count
+        self.pipeline_per_db = pipeline_per_db
+        self.max_source_load = max_source_load
+        self.load_sample_interval = load_sample_interval
+        self.dry_run = dry_run
+        self.execution_id: str | None = None
+        self.source_id: str | None = None
+        self.per_db_queries: set[str] = set()
+        self.checkpoints = CollectionCheckpoints(local_db)
+        self.connections = ConnectionManager(src_info, database)
         super().__init__(local_db, canonical_query_manager, src_info.db_type, console)
 
     def execute(self) -> None:
-        super().execute()
-        execution_id = (
-            f"{self.src_info.db_type}_{current_version!s}_{datetime.now(tz=timezone.utc).strftime('%y%m%d%H%M%S')}"
-        )
-        self.collect_data(execution_id)
-        self.collect_db_specific_data(execution_id)
+        execution_id = self.checkpoints.get_latest_execution_id() if self.resume and not self.dry_run else None
+        if execution_id is None:
+            super().execute()
+            execution_id = (
+                f"{self.src_info.db_type}_{current_version!s}_{datetime.now(tz=timezone.utc).strftime('%y%m%d%H%M%S')}"
+            )
+        else:
+            self.console.print(rf"[bold green]Resuming collection [bold magenta]`{execution_id}`[/][/]")
+            self.canonical_query_manager.execute_ddl_scripts(exclude="ddl_collection")
+            self.schemas.load()
+        if self.dry_run:
+            self.explain(execution_id)
+            return
+        self.collect(execution_id)
+
+    def collect(self, execution_id: str) -> None:
+        """Collect the instance level and the per database details."""
+        self.execution_id = execution_id
+        self.start_deadline()
+        try:
+            self.collect_data(execution_id)
+            self.collect_db_specific_data(execution_id)
+            if self.sample_count > 1:
+                self.sample_counters(execution_id)
+            self._print_query_load_timings()
+        finally:
+            self._close_connections()
+
+    def _print_query_load_timings(self) -> None:
+        """Print how long the queries of each engine took to load, and whether they came from the query bundle."""
+        for timing in get_load_timings():
+            source = "the query bundle" if timing.source == "bundle" else "the .sql files"
+            self.console.print(
+                rf" [dim grey]:heavy_check_mark: Loaded {timing.query_count} `{timing.engine}` queries for `{timing.driver_adapter}` from {source} in {timing.elapsed_seconds:.3f}s[/]"
+            )
+
+    def explain(self, execution_id: str) -> None:
+        """Estimate the cost of the collection queries on the source with ``EXPLAIN``, without running them.
+
+        The per DB queries are planned against the assessed database only.
+        """
+        from dma.collector.query_managers.explain import explain_queries  # noqa: PLC0415
+
+        self.execution_id = execution_id
+        try:
+            with self.connections.connection(self.database) as connection:
+                collection_manager = next(
+                    provide_collection_query_manager(
+                        connection=connection,
+                        db_type=self.src_info.db_type,
+                        execution_id=execution_id,
+                        manual_id=self.collection_identifier,
+                    )
+                )
+                collection_manager.console = self.console
+                collection_manager.set_identifiers()
+                self.db_version = collection_manager.get_db_version()
+                self.source_id = collection_manager.source_id
+                phases = {
+                    "collection": collection_manager.get_collection_queries(),
+                    "extended_collection": collection_manager.get_extended_collection_queries(),
+                }
+                if self.src_info.db_type == "POSTGRES":
+                    phases["per_db"] = collection_manager.get_per_db_collection_queries()
+                self.console.print(Padding("QUERY PLANS", 1, style="bold", expand=True), width=80)
+                with self.console.status("[bold green]Explaining queries...[/]"):
+                    plans = [
+                        {**plan, "database_name": self.database}
+                        for phase, scripts in phases.items()
+                        for plan in explain_queries(collection_manager, phase, scripts)
+                    ]
+        finally:
+            self._close_connections()
+        self.import_to_table({"collection_query_plan": plans})
+        self._print_query_plans()
+
+    def _print_query_plans(self) -> None:
+        """Print the collection queries ranked by their estimated cost."""
+        table = Table(show_edge=False, width=80)
+        table.add_column("Query", justify="left", style="green")
+        table.add_column("Phase", justify="left", style="green")
+        table.add_column("Cost", justify="right", style="green")
+        table.add_column("Rows", justify="right", style="green")
+        for query_name, query_phase, total_cost, plan_rows, error in self.local_db.sql("""
+            select query_name, query_phase, total_cost, plan_rows, error
+            from collection_query_plan
+            order by total_cost desc nulls last, query_name
+        """).fetchall():
+            table.add_row(
+                query_name.removeprefix(f"collection_{self.src_info.db_type.lower()}_"),
+                query_phase,
+                f"{total_cost:,.0f}" if total_cost is not None else "[yellow]n/a[/]",
+                f"{plan_rows:,}" if plan_rows is not None else (f"[yellow]{error[:40]}[/]" if error else ""),
+            )
+        self.console.print(table)
 
     def collect_data(self, execution_id: str) -> None:
-        sync_engine = get_engine(self.src_info, self.database)
-        with Session(sync_engine) as db_session:
+        connection_pool = self.get_collection_connection_pool()
+        with self.connections.connection(self.database) as connection:
             collection_manager = next(
                 provide_collection_query_manager(
-                    db_session=db_session, execution_id=execution_id, manual_id=self.collection_identifier
+                    connection=connection,
+                    db_type=self.src_info.db_type,
+                    execution_id=execution_id,
+                    manual_id=self.collection_identifier,
+                    connection_pool=connection_pool,
+                    collection_concurrency=self.collection_concurrency,
                 )
             )
-            self.extract_collection(collection_manager)
-            self.extract_extended_collection(collection_manager)
+            self.prepare_collection_manager(collection_manager)
+            with self._checkpoint_queries(collection_manager, self.database):
+                self.extract_collection(collection_manager)
+                self.extract_extended_collection(collection_manager)
+            self.import_to_table(self.get_query_status(collection_manager))
             self.process_collection()
             self.db_version = collection_manager.get_db_version()
-        sync_engine.dispose()
+            self.source_id = collection_manager.source_id
+            if self.src_info.db_type == "POSTGRES":
+                self.per_db_queries = collection_manager.get_per_db_collection_queries()
 
     def collect_db_specific_data(self, execution_id: str) -> None:
-        dbs = self.get_all_dbs()
+        dbs = self.get_pending_databases()
+        if self.max_concurrent_databases > 1 and len(dbs) > 1:
+            self.collect_db_specific_data_concurrently(execution_id, dbs)
+            return
         for db in dbs:
-            async_engine = get_engine(src_info=self.src_info, database=db)
-            with Session(async_engine) as db_session:
+            with self.connections.connection(db) as connection:
+                collection_manager = next(
+                    provide_collection_query_manager(
+                        connection=connection,
+                        db_type=self.src_info.db_type,
+                        execution_id=execution_id,
+                        manual_id=self.collection_identifier,
+                    )
+                )
+                self.prepare_collection_manager(collection_manager)
+                with self._checkpoint_queries(collection_manager, db):
+                    self.import_to_table(collection_manager.execute_per_db_collection_queries())
+                self.import_to_table(self.get_query_status(collection_manager, db))
+            self.connections.release(db)
+
+    def collect_db_specific_data_concurrently(self, execution_id: str, dbs: set[str]) -> None:
+        """Fan the per DB collection out over a pool of workers.
+
+        Each worker connects to a single database and returns its result sets.  All DuckDB inserts happen on the
+        calling thread, so the local database only ever has a single writer.
+        """
+        max_workers = min(self.max_concurrent_databases, len(dbs))
+        self.console.print(Padding("PER DB QUERIES", 1, style="bold", expand=True), width=80)
+        with (
+            self.console.status(
+                rf"[bold green]Collecting [bold]{len(dbs)}[/] databases over [bold]{max_workers}[/] workers...[/]"
+            ) as status,
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dma-per-db") as executor,
+        ):
+            futures = {
+                executor.submit(
+                    self.collect_database, db, execution_id, self.checkpoints.get_completed(self.execution_id, db)
+                ): db
+                for db in sorted(dbs)
+            }
+            for collected, future in enumerate(as_completed(futures), start=1):
+                db = futures[future]
+                db_collection, finished_queries = future.result()
+                self.import_to_table({"collection_query_status": db_collection.pop("collection_query_status", [])})
+                self._checkpoint_results(db, db_collection, finished_queries)
+                status.update(rf" [yellow]*[/] Collected [bold]{collected}[/] of [bold]{len(futures)}[/] databases")
+                status.console.print(rf" [green]:heavy_check_mark:[/] Gathered database [bold magenta]`{db}`[/]")
+
+    def collect_database(
+        self, database: str, execution_id: str, completed_queries: set[str] | None = None
+    ) -> tuple[dict[str, Any], set[str]]:
+        """Execute the per DB queries against a single database.
+
+        Returns the result sets and the queries that do not need to be run again for this database.  Queries in
+        ``completed_queries`` are not run.
+        """
+        try:
+            with self.connections.connection(database) as connection:
                 collection_manager = next(
                     provide_collection_query_manager(
-                        db_session=db_session, execution_id=execution_id, manual_id=self.collection_identifier
+                        connection=connection,
+                        db_type=self.src_info.db_type,
+                        execution_id=execution_id,
+                        manual_id=self.collection_identifier,
                     )
                 )
-                db_collection = collection_manager.execute_per_db_collection_queries()
-                self.import_to_table(db_collection)
-            async_engine.dispose()
+                self.prepare_collection_manager(collection_manager, stream=False)
+                collection_manager.completed_queries = completed_queries or set()
+                collection_manager.set_identifiers(
+                    execution_id=execution_id, source_id=self.source_id, db_version=self.get_db_version()
+                )
+                return {
+                    **collection_manager.collect_per_db_collection_queries(),
+                    **self.get_query_status(collection_manager, database),
+                }, collection_manager.finished_queries
+        finally:
+            self.connections.release(database)
+
+    @contextmanager
+    def _checkpoint_queries(self, collection_manager: CollectionQueryManager, database: str) -> Iterator[None]:
+        """Load and checkpoint the result set of each query of ``collection_manager`` as soon as it finishes.
+
+        Queries already checkpointed for ``database`` are not run again.  The queries that finished without a result
+        set, such as per DB queries that cannot run on ``database``, are checkpointed when the block completes.
+        """
+        checkpointed: set[str] = set()
+
+        def _complete(script: str, script_result: Any) -> None:
+            self.checkpoints.complete(
+                self.execution_id, database, script, partial(self.import_to_table, {script: script_result})
+            )
+            checkpointed.add(script)
+
+        collection_manager.completed_queries = self.checkpoints.get_completed(self.execution_id, database)
+        collection_manager.result_sink = _complete
+        try:
+            yield
+        finally:
+            collection_manager.result_sink = None
+            self.checkpoints.discard()
+        self._checkpoint_results(database, {}, collection_manager.finished_queries - checkpointed)
+
+    def _checkpoint_results(self, database: str, results: dict[str, Any], finished_queries: set[str]) -> None:
+        """Load each result set and record its query as completed, one query per transaction.
+
+        Finished queries without a result set are only recorded as completed.
+        """
+        for script, script_result in results.items():
+            self.checkpoints.complete(
+                self.execution_id, database, script, partial(self.import_to_table, {script: script_result})
+            )
+        for script in sorted(finished_queries - results.keys()):
+            self.checkpoints.complete(self.execution_id, database, script)
+
+    def _load_batch(self, script: str, batch: pa.RecordBatch) -> None:
+        """Load a streamed batch in the transaction that will checkpoint its query."""
+        self.checkpoints.load(script, partial(self.append_to_table, script, batch))
+
+    def get_pending_databases(self) -> set[str]:
+        """Return the databases whose per DB queries have not all been completed in this collection."""
+        return {
+            db
+            for db in self.get_all_dbs()
+            if not self.per_db_queries
+            or not self.per_db_queries <= self.checkpoints.get_completed(self.execution_id, db)
+        }
+
+    def sample_counters(self, execution_id: str) -> None:
+        """Re-run the cumulative counter queries at a fixed interval and compute their per second rates.
+
+        Each sample is appended to a ``<query>_samples`` table, tagged with its sample id and time.  The samples of a
+        previous run are cleared first, so that a resumed collection does not compute rates twice.
+        """
+        if self.src_info.db_type != "POSTGRES":
+            self.console.print(f"[dim grey]Counter sampling is not supported for {self.src_info.db_type}.[/]")
+            return
+        from dma.collector.workflows.collection_extractor._postgres import (  # noqa: PLC0415
+            calculate_counter_rates_postgres,
+            clear_counter_samples_postgres,
+        )
+
+        self.console.print(Padding("COUNTER SAMPLES", 1, style="bold", expand=True), width=80)
+        with self.connections.connection(self.database) as connection:
+            collection_manager = next(
+                provide_collection_query_manager(
+                    connection=connection,
+                    db_type=self.src_info.db_type,
+                    execution_id=execution_id,
+                    manual_id=self.collection_identifier,
+                )
+            )
+            self.prepare_collection_manager(collection_manager, stream=False)
+            collection_manager.set_identifiers(
+                execution_id=execution_id, source_id=self.source_id, db_version=self.get_db_version()
+            )
+            clear_counter_samples_postgres(self.local_db)
+            started = time.monotonic()
+            with self.console.status("[bold green]Sampling counters...[/]") as status:
+                for sample_id in range(1, self.sample_count + 1):
+                    next_sample = started + (sample_id - 1) * self.sample_interval
+                    if self.deadline is not None and next_sample > self.deadline:
+                        status.console.print(" [yellow]:warning:[/] Stopped sampling at the collection deadline")
+                        break
+                    status.update(
+                        rf" [yellow]*[/] Waiting for sample [bold]{sample_id}[/] of [bold]{self.sample_count}[/]"
+                    )
+                    time.sleep(max(next_sample - time.monotonic(), 0))
+                    sampled_at = datetime.now(tz=timezone.utc)
+                    for script, sample in collection_manager.execute_sample_queries().items():
+                        sample = sample.add_column(0, "sample_id", pa.array([sample_id] * sample.num_rows, pa.int32()))
+                        sample = sample.add_column(
+                            1, "sampled_at", pa.array([sampled_at] * sample.num_rows, pa.timestamp("us", tz="UTC"))
+                        )
+                        self.append_to_table(f"{script}_samples", sample)
+                    status.console.print(rf" [green]:heavy_check_mark:[/] Gathered sample [bold]{sample_id}[/]")
+            self.import_to_table(self.get_query_status(collection_manager))
+        calculate_counter_rates_postgres(self.local_db)
+
+    def start_deadline(self) -> None:
+        """Start the clock of the collection deadline, if one is configured."""
+        if self.collection_deadline is not None:
+            self.deadline = time.monotonic() + self.collection_deadline
+
+    def prepare_collection_manager(self, collection_manager: CollectionQueryManager, stream: bool = True) -> None:
+        """Apply the console, load, streaming, pipelining, throttling and timeout settings of this extractor to a collection query manager."""
+        collection_manager.console = self.console
+        collection_manager.schema_registry = self.schemas
+        collection_manager.pipeline_per_db = self.pipeline_per_db
+        collection_manager.load_ceiling = self.max_source_load
+        collection_manager.load_sample_interval = self.load_sample_interval
+        collection_manager.set_timeouts(
+            statement_timeout=self.statement_timeout, lock_timeout=self.lock_timeout, deadline=self.deadline
+        )
+        if stream and self.batch_size is not None:
+            collection_manager.enable_streaming(self._load_batch, self.batch_size)
+
+    def get_query_status(
+        self, collection_manager: CollectionQueryManager, database: str | None = None
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Return the queries skipped by a collection query manager, keyed by the status table."""
+        return {
+            "collection_query_status": [
+                {**status, "database_name": database or self.database} for status in collection_manager.query_status
+            ]
+        }
+
+    def get_collection_connection_pool(self) -> ConnectionPool | None:
+        """Return a connection pool when concurrent collection is requested and supported by the source."""
+        if self.collection_concurrency <= 1:
+            return None
+        if self.src_info.db_type != "POSTGRES":
+            self.console.print(
+                f"[dim grey]Concurrent collection is not supported for {self.src_info.db_type}; queries will run sequentially.[/]"
+            )
+            return None
+        return self.connections.get_connection_pool(self.database, max_size=self.collection_concurrency)
+
+    def _close_connections(self) -> None:
+        stats = self.connections.get_stats()
+        self.connections.close()
+        if stats:
+            self.console.print(
+                f"[dim grey]Opened {sum(s.connections_opened + s.pooled_connections_opened for s in stats)} connections "
+                f"to {len(stats)} databases for {sum(s.checkouts + s.pooled_requests for s in stats)} requests.[/]"
+            )
 
     def get_all_dbs(self) -> set[str]:
         result = self.local_db.sql("""
@@ -123,3 +483,99 @@ class CollectionExtractor(BaseWorkflow):
         else:
             msg = f"{self.db_type} is not implemented."
             raise ApplicationError(msg)
+
+
+class AsyncCollectionExtractor(CollectionExtractor):
+    """Collection extractor driven by anyio task groups.
+
+    The collection queries and the per database queries run concurrently over async connection pools so that the
+    collection time of a high latency source does not grow linearly with the number of queries.  DuckDB inserts are
+    issued from the event loop thread only, keeping a single writer on the local database.
+    """
+
+    def collect(self, execution_id: str) -> None:
+        self.execution_id = execution_id
+        self.start_deadline()
+        try:
+            anyio.run(self.collect_async, execution_id)
+            if self.sample_count > 1:
+                self.sample_counters(execution_id)
+        finally:
+            self._close_connections()
+
+    async def collect_async(self, execution_id: str) -> None:
+        limiter = anyio.CapacityLimiter(self.collection_concurrency)
+        self.console.print(Padding("ASYNC COLLECTION QUERIES", 1, style="bold", expand=True), width=80)
+        async with get_async_connection_pool(
+            self.src_info, self.database, max_size=self.collection_concurrency
+        ) as connection_pool:
+            try:
+                collection_manager = next(
+                    provide_async_collection_query_manager(
+                        db_type=self.src_info.db_type,
+                        connection_pool=connection_pool,
+                        limiter=limiter,
+                        execution_id=execution_id,
+                        manual_id=self.collection_identifier,
+                        collection_concurrency=self.collection_concurrency,
+                    )
+                )
+                self.prepare_collection_manager(collection_manager.query_manager, stream=False)
+                with self._checkpoint_queries(collection_manager.query_manager, self.database):
+                    await collection_manager.set_identifiers()
+                    self.db_version = collection_manager.get_db_version()
+                    self.source_id = collection_manager.source_id
+                    self.per_db_queries = collection_manager.query_manager.get_per_db_collection_queries()
+                    async with anyio.create_task_group() as tg:
+                        tg.start_soon(self.extract_collection_async, collection_manager)
+                        tg.start_soon(self.extract_databases_async, collection_manager, limiter)
+                self.import_to_table(self.get_query_status(collection_manager.query_manager))
+            finally:
+                self.connections.record_pool_stats(self.database, connection_pool)
+        self.process_collection()
+
+    async def extract_collection_async(self, collection_manager: AsyncCollectionQueryManager) -> None:
+        self.import_to_table(await collection_manager.execute_collection_queries())
+
+    async def extract_databases_async(
+        self, collection_manager: AsyncCollectionQueryManager, limiter: anyio.CapacityLimiter
+    ) -> None:
+        """Gather the database list and then collect each database as soon as it is known."""
+        self.import_to_table(await collection_manager.execute_extended_collection_queries())
+        database_limiter = anyio.CapacityLimiter(self.max_concurrent_databases)
+        async with anyio.create_task_group() as tg:
+            for db in sorted(self.get_pending_databases()):
+                tg.start_soon(self.extract_database_async, db, collection_manager, limiter, database_limiter)
+
+    async def extract_database_async(
+        self,
+        database: str,
+        collection_manager: AsyncCollectionQueryManager,
+        limiter: anyio.CapacityLimiter,
+        database_limiter: anyio.CapacityLimiter,
+    ) -> None:
+        async with (
+            database_limiter,
+            get_async_connection_pool(self.src_info, database, max_size=self.collection_concurrency) as connection_pool,
+        ):
+            try:
+                db_manager = next(
+                    provide_async_collection_query_manager(
+                        db_type=self.src_info.db_type,
+                        connection_pool=connection_pool,
+                        limiter=limiter,
+                        execution_id=collection_manager.execution_id,
+                        source_id=collection_manager.source_id,
+                        manual_id=self.collection_identifier,
+                        db_version=collection_manager.get_db_version(),
+                        collection_concurrency=self.collection_concurrency,
+                    )
+                )
+                self.prepare_collection_manager(db_manager.query_manager, stream=False)
+                with self._checkpoint_queries(db_manager.query_manager, database):
+                    await db_manager.set_identifiers()
+                    self.import_to_table(await db_manager.execute_per_db_collection_queries())
+                self.import_to_table(self.get_query_status(db_manager.query_manager, database))
+            finally:
+                self.connections.record_pool_stats(database, connection_pool)
+        self.console.print(rf" [green]:heavy_check_mark:[/] Gathered database [bold magenta]`{database}`[/]")
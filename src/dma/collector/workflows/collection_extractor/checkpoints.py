@@ -0,0 +1,99 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from duckdb import DuckDBPyConnection
+
+
+class CollectionCheckpoints:
+    """Completed collection queries, recorded in the working database so that a failed collection can be resumed.
+
+    A checkpoint is an (execution id, database, query name) tuple stored in ``collection_checkpoint``.  Each query is
+    checkpointed in the transaction loading its rows, so the rows of a query are kept if and only if it completed.
+    """
+
+    def __init__(self, local_db: DuckDBPyConnection) -> None:
+        self.local_db = local_db
+        self._loading: str | None = None
+        """The query whose streamed rows are held by the open transaction, until it is checkpointed or discarded."""
+
+    def get_latest_execution_id(self) -> str | None:
+        """Return the execution id of the latest checkpointed collection, if any."""
+        has_checkpoints = self.local_db.execute(
+            "select count(*) from information_schema.tables where table_schema = 'main' and table_name = 'collection_checkpoint'"
+        ).fetchone()
+        if has_checkpoints is None or has_checkpoints[0] == 0:
+            return None
+        latest = self.local_db.execute(
+            "select pkey from collection_checkpoint order by completed_at desc limit 1"
+        ).fetchone()
+        return None if latest is None else latest[0]
+
+    def get_completed(self, execution_id: str | None, database: str) -> set[str]:
+        """Return the queries already completed for a database."""
+        rows = self.local_db.execute(
+            "select query_name from collection_checkpoint where pkey = ? and database_name = ?",
+            [execution_id, database],
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def load(self, query_name: str, load_rows: Callable[[], None]) -> None:
+        """Load a batch of rows of a query still running, in the transaction that will record its checkpoint.
+
+        Rows streamed for another query that was not checkpointed, because it timed out, are rolled back first.
+        """
+        if self._loading != query_name:
+            self.discard()
+            self.local_db.begin()
+            self._loading = query_name
+        try:
+            load_rows()
+        except BaseException:
+            self.discard()
+            raise
+
+    def complete(
+        self, execution_id: str | None, database: str, query_name: str, load_rows: Callable[[], None] | None = None
+    ) -> None:
+        """Load the rows of a finished query and record its checkpoint in a single transaction.
+
+        The rows streamed for the query with :meth:`load` are committed along with them.  If loading fails, nothing is
+        kept, so a resumed collection runs the query again.
+        """
+        if self._loading != query_name:
+            self.discard()
+            self.local_db.begin()
+        self._loading = None
+        try:
+            if load_rows is not None:
+                load_rows()
+            self.local_db.execute(
+                "insert into collection_checkpoint(pkey, database_name, query_name) values (?, ?, ?)",
+                [execution_id, database, query_name],
+            )
+        except BaseException:
+            self.local_db.rollback()
+            raise
+        self.local_db.commit()
+
+    def discard(self) -> None:
+        """Roll back the streamed rows of a query that was not checkpointed."""
+        if self._loading is not None:
+            self._loading = None
+            self.local_db.rollback()
@@ -0,0 +1,28 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from dma.collector.workflows.fleet.base import FleetCollection, FleetResult, collect_instance
+from dma.collector.workflows.fleet.inventory import FleetInstance, load_inventory
+from dma.collector.workflows.fleet.merge import FleetMerge, find_assessment_databases
+
+__all__ = (
+    "FleetCollection",
+    "FleetInstance",
+    "FleetMerge",
+    "FleetResult",
+    "collect_instance",
+    "find_assessment_databases",
+    "load_inventory",
+)
@@ -0,0 +1,228 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import multiprocessing
+import os
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal
+
+from rich.console import Console
+from rich.padding import Padding
+from rich.table import Table
+
+from dma.collector.dependencies import provide_canonical_queries
+from dma.collector.workflows.collection_extractor.base import AsyncCollectionExtractor, CollectionExtractor
+from dma.collector.workflows.readiness_check.base import ReadinessCheck
+from dma.lib.db.local import get_duckdb_connection
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from dma.collector.workflows.fleet.inventory import FleetInstance
+
+
+@dataclass
+class FleetResult:
+    """The outcome of the collection of one fleet instance."""
+
+    name: str
+    status: Literal["SUCCESS", "FAILED"]
+    elapsed_seconds: float
+    database_path: Path
+    error: str | None = None
+
+
+def collect_instance(
+    instance: FleetInstance,
+    export_path: Path,
+    working_path: Path | None = None,
+    readiness_check: bool = True,
+    options: dict[str, Any] | None = None,
+) -> FleetResult:
+    """Collect a single instance into its own DuckDB file, logging the console output next to it.
+
+    Runs in a worker process, so every failure is reported in the result instead of being raised.
+    """
+    instance_path = export_path / instance.name
+    instance_path.mkdir(parents=True, exist_ok=True)
+    started = time.perf_counter()
+    with (instance_path / "collection.log").open("w", encoding="utf-8") as log_file:
+        console = Console(file=log_file, width=120)
+        try:
+            _run_instance(instance, instance_path, console, working_path, readiness_check, dict(options or {}))
+        except Exception as e:  # noqa: BLE001
+            console.print_exception()
+            return FleetResult(
+                name=instance.name,
+                status="FAILED",
+                elapsed_seconds=time.perf_counter() - started,
+                database_path=instance_path / "assessment.db",
+                error=f"{type(e).__name__}: {e}",
+            )
+    return FleetResult(
+        name=instance.name,
+        status="SUCCESS",
+        elapsed_seconds=time.perf_counter() - started,
+        database_path=instance_path / "assessment.db",
+    )
+
+
+def _run_instance(
+    instance: FleetInstance,
+    instance_path: Path,
+    console: Console,
+    working_path: Path | None,
+    readiness_check: bool,
+    options: dict[str, Any],
+) -> None:
+    with get_duckdb_connection(
+        working_path=working_path / instance.name if working_path is not None else None,
+        export_path=instance_path,
+        threads=options.pop("duckdb_threads", None),
+        memory_limit=options.pop("duckdb_memory_limit", None),
+        resource_share=options.pop("duckdb_resource_share", 1),
+    ) as local_db:
+        if readiness_check:
+            workflow = ReadinessCheck(
+                local_db=local_db,
+                src_info=instance.src_info,
+                database=instance.database,
+                console=console,
+                collection_identifier=instance.collection_identifier,
+                working_path=working_path,
+                **options,
+            )
+            workflow.execute()
+            workflow.print_summary()
+            return
+        extractor_class = AsyncCollectionExtractor if options.pop("async_collection", False) else CollectionExtractor
+        extractor_class(
+            local_db=local_db,
+            src_info=instance.src_info,
+            database=instance.database,
+            canonical_query_manager=next(provide_canonical_queries(local_db=local_db, working_path=working_path)),
+            console=console,
+            collection_identifier=instance.collection_identifier,
+            **options,
+        ).execute()
+
+
+class FleetCollection:
+    """Collect a fleet of instances in a pool of worker processes.
+
+    Each worker process is reused across instances, so interpreter startup and imports are paid once per worker rather
+    than once per instance.  No more than ``max_per_host`` instances of the same host are collected at a time.  The
+    local DuckDB database of each worker is sized to its share of the host.  Workers are spawned rather than forked, so
+    they do not inherit the threads and open connections of the parent process.
+    """
+
+    def __init__(
+        self,
+        instances: list[FleetInstance],
+        export_path: Path,
+        console: Console,
+        working_path: Path | None = None,
+        max_workers: int | None = None,
+        max_per_host: int = 1,
+        readiness_check: bool = True,
+        collection_options: dict[str, Any] | None = None,
+    ) -> None:
+        self.instances = instances
+        self.export_path = export_path
+        self.console = console
+        self.working_path = working_path
+        self.max_workers = max(min(max_workers or os.cpu_count() or 1, len(instances)), 1)
+        self.max_per_host = max_per_host
+        self.readiness_check = readiness_check
+        self.collection_options = collection_options or {}
+        self.worker: Callable[..., FleetResult] = collect_instance
+
+    def execute(self) -> list[FleetResult]:
+        self.console.print(Padding("FLEET COLLECTION", 1, style="bold", expand=True), width=80)
+        self.export_path.mkdir(parents=True, exist_ok=True)
+        pending = list(self.instances)
+        running: dict[Future[FleetResult], FleetInstance] = {}
+        hosts: Counter[str] = Counter()
+        results: list[FleetResult] = []
+        with (
+            ProcessPoolExecutor(max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")) as pool,
+            self.console.status("[bold green]Collecting fleet...[/]") as status,
+        ):
+            while pending or running:
+                for instance in list(pending):
+                    if len(running) >= self.max_workers:
+                        break
+                    if hosts[instance.host] >= self.max_per_host:
+                        continue
+                    pending.remove(instance)
+                    hosts[instance.host] += 1
+                    running[
+                        pool.submit(
+                            self.worker,
+                            instance,
+                            self.export_path,
+                            self.working_path,
+                            self.readiness_check,
+                            {"duckdb_resource_share": self.max_workers, **self.collection_options},
+                        )
+                    ] = instance
+                status.update(
+                    rf" [yellow]*[/] Collecting [bold]{len(running)}[/] instances, [bold]{len(pending)}[/] waiting, [bold]{len(results)}[/] done"
+                )
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    instance = running.pop(future)
+                    hosts[instance.host] -= 1
+                    result = self.get_result(future, instance)
+                    results.append(result)
+                    if result.status == "SUCCESS":
+                        status.console.print(
+                            rf" [green]:heavy_check_mark:[/] Collected [bold magenta]`{result.name}`[/] in {result.elapsed_seconds:.1f}s"
+                        )
+                    else:
+                        status.console.print(
+                            rf" [red]:x:[/] Failed to collect [bold magenta]`{result.name}`[/]: {result.error}"
+                        )
+        return results
+
+    def get_result(self, future: Future[FleetResult], instance: FleetInstance) -> FleetResult:
+        """Return the result of a finished collection, including one whose worker process died."""
+        try:
+            return future.result()
+        except Exception as e:  # noqa: BLE001
+            return FleetResult(
+                name=instance.name,
+                status="FAILED",
+                elapsed_seconds=0,
+                database_path=self.export_path / instance.name / "assessment.db",
+                error=f"{type(e).__name__}: {e}",
+            )
+
+    def print_summary(self, results: list[FleetResult]) -> None:
+        table = Table(show_edge=False, width=80)
+        table.add_column("Instance", justify="left", style="green")
+        table.add_column("Status", justify="left", style="green")
+        table.add_column("Seconds", justify="right", style="green")
+        for result in sorted(results, key=lambda r: r.name):
+            table.add_row(
+                result.name,
+                result.status if result.status == "SUCCESS" else f"[red]{result.status}[/]",
+                f"{result.elapsed_seconds:.1f}",
+            )
+        self.console.print(table)
@@ -0,0 +1,131 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import csv
+import os
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, cast
+
+import msgspec
+
+from dma.lib.db.base import SourceInfo
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from dma.types import SupportedSources
+
+_SUPPORTED_SOURCES = ("POSTGRES", "MYSQL", "ORACLE", "MSSQL")
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+@dataclass
+class FleetInstance:
+    """A database instance listed in a fleet inventory."""
+
+    name: str
+    src_info: SourceInfo
+    database: str
+    collection_identifier: str | None = None
+
+    @property
+    def host(self) -> str:
+        """The host the instance runs on, used to limit the number of concurrent collections per host."""
+        return self.src_info.hostname.lower()
+
+
+def load_inventory(inventory_path: Path) -> list[FleetInstance]:
+    """Load the instances of a CSV or TOML fleet inventory.
+
+    A CSV inventory has a header row naming the fields of each instance and may contain ``#`` comment lines.  A TOML
+    inventory lists the instances in an ``[[instances]]`` array, and may set shared values in a ``[defaults]`` table.
+
+    Each instance requires a ``db_type``, ``hostname``, ``port``, ``database`` and ``username``.  The password is given
+    either directly as ``password`` or as the name of an environment variable in ``password_env``.  The optional
+    ``name`` defaults to ``<hostname>_<port>_<database>`` and must be unique, as it names the instance's output.
+    """
+    if not inventory_path.exists():
+        msg = f"Inventory file '{inventory_path!s}' does not exist."
+        raise ApplicationError(msg)
+    if inventory_path.suffix.lower() == ".toml":
+        entries = _read_toml_inventory(inventory_path)
+    else:
+        entries = _read_csv_inventory(inventory_path)
+    instances = [_to_instance(entry, line) for line, entry in enumerate(entries, start=1)]
+    names = [instance.name for instance in instances]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        msg = f"Inventory instance names must be unique.  Duplicated: {', '.join(duplicates)}"
+        raise ApplicationError(msg)
+    return instances
+
+
+def _read_csv_inventory(inventory_path: Path) -> list[dict[str, Any]]:
+    with inventory_path.open(newline="", encoding="utf-8") as inventory_file:
+        lines = [line for line in inventory_file if line.strip() and not line.lstrip().startswith("#")]
+    return [
+        {key.strip(): value.strip() for key, value in row.items() if key is not None and value}
+        for row in csv.DictReader(lines)
+    ]
+
+
+def _read_toml_inventory(inventory_path: Path) -> list[dict[str, Any]]:
+    try:
+        inventory = msgspec.toml.decode(inventory_path.read_bytes())
+    except msgspec.DecodeError as e:
+        msg = f"Could not parse inventory file '{inventory_path!s}': {e}"
+        raise ApplicationError(msg) from e
+    defaults = inventory.get("defaults", {})
+    return [{**defaults, **instance} for instance in inventory.get("instances", [])]
+
+
+def _to_instance(entry: dict[str, Any], position: int) -> FleetInstance:
+    missing = [key for key in ("db_type", "hostname", "port", "database", "username") if not entry.get(key)]
+    if missing:
+        msg = f"Inventory instance {position} is missing: {', '.join(missing)}"
+        raise ApplicationError(msg)
+    db_type = str(entry["db_type"]).upper()
+    if db_type not in _SUPPORTED_SOURCES:
+        msg = f"Inventory instance {position} has an unsupported database type: {entry['db_type']}"
+        raise ApplicationError(msg)
+    password = entry.get("password")
+    if password is None and entry.get("password_env"):
+        password = os.environ.get(entry["password_env"])
+        if password is None:
+            msg = f"Inventory instance {position} reads its password from '{entry['password_env']}', which is not set."
+            raise ApplicationError(msg)
+    if password is None:
+        msg = f"Inventory instance {position} requires a `password` or `password_env`."
+        raise ApplicationError(msg)
+    name = entry.get("name") or f"{entry['hostname']}_{entry['port']}_{entry['database']}"
+    # the name becomes a directory under the fleet root, so `.` and `..` must not survive
+    safe_name = _UNSAFE_NAME_CHARS.sub("_", str(name)).lstrip(".")
+    if not safe_name:
+        msg = f"Inventory instance {position} has a name that cannot be used as a directory: '{name}'"
+        raise ApplicationError(msg)
+    return FleetInstance(
+        name=safe_name,
+        src_info=SourceInfo(
+            db_type=cast("SupportedSources", db_type),
+            username=str(entry["username"]),
+            password=str(password),
+            hostname=str(entry["hostname"]),
+            port=int(entry["port"]),
+        ),
+        database=str(entry["database"]),
+        collection_identifier=entry.get("collection_identifier"),
+    )
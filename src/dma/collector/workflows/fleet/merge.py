@@ -0,0 +1,207 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import duckdb
+from rich.padding import Padding
+
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from duckdb import DuckDBPyConnection
+    from rich.console import Console
+
+# the number of assessment databases attached to the fleet database at a time
+MERGE_BATCH_SIZE = 64
+
+
+def find_assessment_databases(paths: list[Path]) -> dict[str, Path]:
+    """Resolve files and directories to the assessment databases to merge, keyed by their collection key.
+
+    Directories are searched for ``assessment.db`` files, such as those written by ``dma fleet``.  The collection key
+    is the name of the directory holding an ``assessment.db``, or the file name of any other database.
+    """
+    databases: dict[str, Path] = {}
+    for path in paths:
+        for database in sorted(path.rglob("assessment.db")) if path.is_dir() else [path]:
+            collection_key = database.parent.name if database.name == "assessment.db" else database.stem
+            if collection_key in databases and databases[collection_key] != database.absolute():
+                msg = f"Both '{databases[collection_key]!s}' and '{database!s}' use the collection key '{collection_key}'."
+                raise ApplicationError(msg)
+            databases[collection_key] = database.absolute()
+    return databases
+
+
+class FleetMerge:
+    """Consolidate assessment databases into a single fleet database.
+
+    The ``collection_*``, ``extended_collection_*`` and ``readiness_check_summary`` tables of every assessment
+    database are appended to tables of the same name in the fleet database, with an additional ``collection_key``
+    column identifying the collection they come from.  Merging a collection again replaces its rows.
+    """
+
+    def __init__(self, local_db: DuckDBPyConnection, console: Console) -> None:
+        self.local_db = local_db
+        self.console = console
+
+    def execute(self, databases: dict[str, Path]) -> None:
+        self.console.print(Padding("MERGE ASSESSMENTS", 1, style="bold", expand=True), width=80)
+        self.local_db.execute("""
+            create table if not exists fleet_collection(
+                collection_key VARCHAR primary key,
+                source_path VARCHAR,
+                merged_at TIMESTAMP WITH TIME ZONE default current_timestamp
+            )
+        """)
+        collection_keys = sorted(databases)
+        with self.console.status("[bold green]Merging assessments...[/]") as status:
+            for start in range(0, len(collection_keys), MERGE_BATCH_SIZE):
+                batch = {key: databases[key] for key in collection_keys[start : start + MERGE_BATCH_SIZE]}
+                status.update(
+                    rf" [yellow]*[/] Merging collections [bold]{start + 1}[/] to [bold]{start + len(batch)}[/]"
+                )
+                self.merge_batch(batch)
+                status.console.print(rf" [green]:heavy_check_mark:[/] Merged [bold]{len(batch)}[/] collections")
+        self.console.print(f"Merged {len(databases)} collections into the fleet database")
+
+    def merge_batch(self, databases: dict[str, Path]) -> None:
+        """Attach a batch of databases and append each of their tables with a single statement.
+
+        A single ``insert`` per table lets DuckDB scan all the attached databases in parallel.
+        """
+        aliases = {f"dma_source_{i}": key for i, key in enumerate(databases)}
+        for alias, collection_key in aliases.items():
+            path = str(databases[collection_key]).replace("'", "''")
+            self.local_db.execute(f"attach '{path}' as {alias} (read_only)")
+        try:
+            tables = self.get_source_tables(list(aliases))
+            self.local_db.begin()
+            try:
+                self.append_collections(aliases, databases, tables)
+            except:
+                self.local_db.rollback()
+                raise
+            self.local_db.commit()
+        finally:
+            for alias in aliases:
+                self.local_db.execute(f"detach {alias}")
+
+    def append_collections(
+        self, aliases: dict[str, str], databases: dict[str, Path], tables: dict[str, list[tuple[str, str, str]]]
+    ) -> None:
+        collection_keys = list(aliases.values())
+        self.local_db.executemany(
+            "delete from fleet_collection where collection_key = ?", [[key] for key in collection_keys]
+        )
+        self.local_db.executemany(
+            "insert into fleet_collection(collection_key, source_path) values (?, ?)",
+            [[key, str(databases[key])] for key in collection_keys],
+        )
+        self.delete_collections(collection_keys)
+        for table_name, columns in tables.items():
+            self.prepare_table(table_name, columns)
+            sources = sorted({alias for alias, _, _ in columns})
+            self.local_db.execute(
+                f"insert into {table_name} by name ({' union all by name '.join(f'select ? as collection_key, * from {alias}.{table_name}' for alias in sources)})",  # noqa: S608
+                [aliases[alias] for alias in sources],
+            )
+
+    def delete_collections(self, collection_keys: list[str]) -> None:
+        """Remove the rows of previously merged collections from every fleet table."""
+        tables = self.local_db.execute("""
+            select table_name from duckdb_columns()
+            where database_name = current_database() and schema_name = 'main'
+                and column_name = 'collection_key' and table_name != 'fleet_collection'
+        """).fetchall()
+        for (table_name,) in tables:
+            self.local_db.execute(
+                f"delete from {table_name} where collection_key in ({', '.join('?' for _ in collection_keys)})",  # noqa: S608
+                collection_keys,
+            )
+
+    def get_source_tables(self, aliases: list[str]) -> dict[str, list[tuple[str, str, str]]]:
+        """Return the mergeable tables of the attached databases, with their ``(alias, column, type)`` columns."""
+        rows = self.local_db.execute(
+            f"""
+                select database_name, table_name, column_name, data_type
+                from duckdb_columns()
+                where database_name in ({", ".join("?" for _ in aliases)})
+                    and schema_name = 'main'
+                    and (database_name, table_name) in (select (database_name, table_name) from duckdb_tables())
+                    and (table_name like 'collection\\_%' escape '\\'
+                        or table_name like 'extended\\_collection\\_%' escape '\\'
+                        or table_name = 'readiness_check_summary')
+                order by database_name, table_name, column_index
+            """,  # noqa: S608
+            aliases,
+        ).fetchall()
+        tables: dict[str, list[tuple[str, str, str]]] = defaultdict(list)
+        for alias, table_name, column_name, data_type in rows:
+            tables[table_name].append((alias, column_name, data_type))
+        return tables
+
+    def prepare_table(self, table_name: str, columns: list[tuple[str, str, str]]) -> None:
+        """Create the fleet table, or add and widen the columns it needs, so that every source can be appended to it.
+
+        Enumerations are stored as text, since their types belong to the attached databases.  A column typed
+        differently across collections, such as ``INTEGER`` and ``BIGINT``, takes the type all of them cast to.
+        """
+        existing = dict(
+            self.local_db.execute(
+                "select column_name, data_type from duckdb_columns() where database_name = current_database() and schema_name = 'main' and table_name = ?",
+                [table_name],
+            ).fetchall()
+        )
+        column_types: dict[str, list[str]] = defaultdict(list)
+        for column_name, data_type in existing.items():
+            column_types[column_name].append(data_type)
+        for _, column_name, source_type in columns:
+            data_type = "VARCHAR" if source_type.startswith("ENUM") else source_type
+            if data_type not in column_types[column_name]:
+                column_types[column_name].append(data_type)
+        if not existing:
+            column_definitions = ", ".join(
+                f'"{name}" {self.get_common_type(table_name, name, data_types)}'
+                for name, data_types in column_types.items()
+            )
+            self.local_db.execute(f"create table {table_name}(collection_key VARCHAR, {column_definitions})")
+            return
+        for column_name, data_types in column_types.items():
+            data_type = self.get_common_type(table_name, column_name, data_types)
+            if column_name not in existing:
+                self.local_db.execute(f'alter table {table_name} add column "{column_name}" {data_type}')
+            elif data_type != existing[column_name]:
+                self.local_db.execute(f'alter table {table_name} alter column "{column_name}" type {data_type}')
+
+    def get_common_type(self, table_name: str, column_name: str, data_types: list[str]) -> str:
+        """Return the type that all of ``data_types`` implicitly cast to, or raise if the column cannot be merged."""
+        if len(data_types) == 1:
+            return data_types[0]
+        candidates = " union all ".join(f"select null::{data_type} as value" for data_type in data_types)
+        try:
+            common_type = self.local_db.execute(f"select typeof(value) from ({candidates}) limit 1").fetchall()[0][0]  # noqa: S608
+            castable = self.local_db.execute(
+                f"select {', '.join(f'can_cast_implicitly(null::{data_type}, null::{common_type})' for data_type in data_types)}"
+            ).fetchall()[0]
+        except duckdb.Error:
+            castable = (False,)
+        if not all(castable):
+            msg = f"The column '{column_name}' of '{table_name}' has incompatible types across collections: {', '.join(data_types)}."
+            raise ApplicationError(msg)
+        return str(common_type)
@@ -18,11 +18,11 @@ from typing import TYPE_CHECKING
 
 from rich.table import Table
 
+from dma.collector.util.mysql.helpers import get_db_major_version
 from dma.collector.workflows.readiness_check._mysql.constants import (
     DB_TYPE_MAP,
     RDS_MINOR_VERSION_SUPPORT_MAP,
 )
-from dma.collector.workflows.readiness_check._mysql.helpers import get_db_major_version
 from dma.collector.workflows.readiness_check.base import (
     ReadinessCheck,
     ReadinessCheckExecutor,
@@ -133,20 +133,31 @@ class PostgresReadinessCheckExecutor(ReadinessCheckExecutor):
         # Per DB Checks.
         self._check_extensions()
         self._check_replication_role()
-        # db_check_results stores the verification results for all DBs.
+        # db_check_results stores the verification results for all DBs.  They do not depend on the target, so they are
+        # evaluated once, with a query per rule covering every database.
+        db_check_results = self._check_databases()
         for config in self.rule_config:
-            db_check_results: dict[str, dict[str, list]] = {}
-            for db in sorted(self.get_all_dbs()):
-                is_pglogical_installed = self._check_pglogical_installed(db, db_check_results)
-                if is_pglogical_installed:
-                    privilege_check_passed = self._check_privileges(db, db_check_results)
-                    if not privilege_check_passed:
-                        continue
-                    self._check_if_node_exists(db, db_check_results)
-                self._check_tables_without_pk(db, db_check_results)
-                self._check_tables_replica_identity(db, db_check_results)
             self._save_results(config.db_variant, db_check_results)
 
+    def _check_databases(self) -> dict[str, dict[str, list]]:
+        db_check_results: dict[str, dict[str, list]] = {}
+        databases = sorted(self.get_all_dbs())
+        pglogical_databases = self._get_pglogical_databases()
+        privilege_errors = self._get_privilege_errors(databases)
+        node_databases = self._get_pglogical_node_databases()
+        tables_without_pk = self._get_tables_without_pk()
+        tables_replica_identity = self._get_tables_replica_identity()
+        for db in databases:
+            is_pglogical_installed = self._check_pglogical_installed(db, pglogical_databases, db_check_results)
+            if is_pglogical_installed:
+                privilege_check_passed = self._check_privileges(db, privilege_errors.get(db, []), db_check_results)
+                if not privilege_check_passed:
+                    continue
+                self._check_if_node_exists(db, node_databases, db_check_results)
+            self._check_tables_without_pk(db, tables_without_pk, db_check_results)
+            self._check_tables_replica_identity(db, tables_replica_identity, db_check_results)
+        return db_check_results
+
     def _save_results(self, db_variant: PostgresVariants, db_check_results: dict[str, dict[str, list]]) -> None:
         for rule, result in db_check_results.items():
             for severity in [ACTION_REQUIRED, WARNING, PASS]:
@@ -224,24 +235,36 @@ class PostgresReadinessCheckExecutor(ReadinessCheckExecutor):
                     "All utilized collations are supported.",
                 )
 
-    def _check_tables_without_pk(self, db_name: str, db_check_results: dict[str, dict[str, list]]) -> None:
+    def _get_tables_without_pk(self) -> dict[str, str]:
+        return dict(
+            self.local_db.sql(
+                "select database_name, string_agg(CONCAT(nspname, '.', relname), ', ') from collection_postgres_tables_with_no_primary_key group by database_name"
+            ).fetchall()
+        )
+
+    @staticmethod
+    def _check_tables_without_pk(
+        db_name: str, tables_without_pk: dict[str, str], db_check_results: dict[str, dict[str, list]]
+    ) -> None:
         rule_code = TABLES_WITH_NO_PK
-        result = self.local_db.sql(
-            "select CONCAT(nspname, '.', relname) from collection_postgres_tables_with_no_primary_key where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        tables = ", ".join(row[0] for row in result)
+        tables = tables_without_pk.get(db_name)
         init_results_dict(db_check_results, rule_code)
         if tables:
             db_check_results[rule_code][WARNING].append(f"In database {db_name}, {tables} don't have primary keys")
 
-    def _check_tables_replica_identity(self, db_name: str, db_check_results: dict[str, dict[str, list]]) -> None:
+    def _get_tables_replica_identity(self) -> dict[str, str]:
+        return dict(
+            self.local_db.sql(
+                "select database_name, string_agg(CONCAT(nspname, '.', relname), ', ') from collection_postgres_tables_with_primary_key_replica_identity group by database_name"
+            ).fetchall()
+        )
+
+    @staticmethod
+    def _check_tables_replica_identity(
+        db_name: str, tables_replica_identity: dict[str, str], db_check_results: dict[str, dict[str, list]]
+    ) -> None:
         rule_code = UNSUPPORTED_TABLES_WITH_REPLICA_IDENTITY
-        result = self.local_db.sql(
-            "select CONCAT(nspname, '.', relname) from collection_postgres_tables_with_primary_key_replica_identity where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        tables = ", ".join(row[0] for row in result)
+        tables = tables_replica_identity.get(db_name)
         init_results_dict(db_check_results, rule_code)
         if tables:
             db_check_results[rule_code][ACTION_REQUIRED].append(f"{tables} in database {db_name}")
@@ -291,13 +314,18 @@ class PostgresReadinessCheckExecutor(ReadinessCheckExecutor):
                     f"Version {self.db_version} is supported.  Please ensure that you selected a version that meets or exceeds version {detected_major_version!s}.",
                 )
 
-    def _check_pglogical_installed(self, db_name: str, db_check_results: dict[str, dict[str, list]]) -> bool:
-        rule_code = PGLOGICAL_INSTALLED
+    def _get_pglogical_databases(self) -> set[str]:
         result = self.local_db.sql(
-            query="select count(*) from collection_postgres_extensions where extension_name = 'pglogical' and database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchone()
-        is_installed = result[0] > 0 if result is not None else False
+            "select distinct database_name from collection_postgres_extensions where extension_name = 'pglogical'"
+        ).fetchall()
+        return {row[0] for row in result}
+
+    @staticmethod
+    def _check_pglogical_installed(
+        db_name: str, pglogical_databases: set[str], db_check_results: dict[str, dict[str, list]]
+    ) -> bool:
+        rule_code = PGLOGICAL_INSTALLED
+        is_installed = db_name in pglogical_databases
         init_results_dict(db_check_results, rule_code)
         if not is_installed:
             db_check_results[rule_code][ACTION_REQUIRED].append(db_name)
@@ -305,77 +333,86 @@ class PostgresReadinessCheckExecutor(ReadinessCheckExecutor):
             db_check_results[rule_code][PASS].append(db_name)
         return is_installed
 
-    def _check_pglogical_schema_usage_privilege(self, db_name: str) -> str | None:
-        result = self.local_db.sql(
-            "select has_schema_usage_privilege from collection_postgres_pglogical_schema_usage_privilege where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchone()
-        if result is None:
-            return "Empty result reading pglogical schema usage privilege for the user"
-        if not result[0]:
-            return "user doesn't have USAGE privilege on schema pglogical"
-        return None
-
-    def _check_pglogical_privileges(self, db_name: str) -> list[str]:
-        err = self._check_pglogical_schema_usage_privilege(db_name)
-        if err is not None:
-            return [err]
-        result = self.local_db.sql(
-            "select has_tables_select_privilege, has_local_node_select_privilege, has_node_select_privilege, has_node_interface_select_privilege from collection_postgres_pglogical_privileges where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchone()
-        errors: list[str] = []
-        if result is None:
-            errors.append("Empty result reading pglogical privileges for the user")
-        else:
-            if not result[0]:
-                errors.append("user doesn't have SELECT privilege on table pglogical.tables")
-            if not result[1]:
-                errors.append("user doesn't have SELECT privilege on table pglogical.local_node")
-            if not result[2]:
-                errors.append("user doesn't have SELECT privilege on table pglogical.node")
-            if not result[3]:
-                errors.append("user doesn't have SELECT privilege on table pglogical.node_interface")
+    def _get_pglogical_schema_usage_privileges(self) -> dict[str, str | None]:
+        errors: dict[str, str | None] = {}
+        for db_name, has_schema_usage_privilege in self.local_db.sql(
+            "select database_name, has_schema_usage_privilege from collection_postgres_pglogical_schema_usage_privilege"
+        ).fetchall():
+            errors.setdefault(
+                db_name, None if has_schema_usage_privilege else "user doesn't have USAGE privilege on schema pglogical"
+            )
         return errors
 
-    def _check_if_node_exists(self, db_name: str, db_check_results: dict[str, dict[str, list]]) -> None:
-        rule_code = PGLOGICAL_NODE_ALREADY_EXISTS
+    def _get_pglogical_privileges(self, databases: list[str]) -> dict[str, list[str]]:
+        """Return the pglogical privileges missing in each database, for the databases where they were collected."""
+        schema_usage_errors = self._get_pglogical_schema_usage_privileges()
+        privileges: dict[str, tuple[Any, ...]] = {}
+        for row in self.local_db.sql(
+            "select database_name, has_tables_select_privilege, has_local_node_select_privilege, has_node_select_privilege, has_node_interface_select_privilege from collection_postgres_pglogical_privileges"
+        ).fetchall():
+            privileges.setdefault(row[0], row[1:])
+        errors: dict[str, list[str]] = {}
+        for db_name in databases:
+            if db_name not in schema_usage_errors:
+                errors[db_name] = ["Empty result reading pglogical schema usage privilege for the user"]
+                continue
+            schema_usage_error = schema_usage_errors[db_name]
+            if schema_usage_error is not None:
+                errors[db_name] = [schema_usage_error]
+                continue
+            result = privileges.get(db_name)
+            if result is None:
+                errors[db_name] = ["Empty result reading pglogical privileges for the user"]
+                continue
+            errors[db_name] = [
+                f"user doesn't have SELECT privilege on table pglogical.{table_name}"
+                for table_name, has_privilege in zip(
+                    ("tables", "local_node", "node", "node_interface"), result, strict=True
+                )
+                if not has_privilege
+            ]
+        return errors
+
+    def _get_pglogical_node_databases(self) -> set[str]:
         result = self.local_db.sql(
-            "select count(*) from collection_postgres_pglogical_provider_node where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchone()
-        node_exists = result[0] > 0 if result is not None else False
+            "select distinct database_name from collection_postgres_pglogical_provider_node"
+        ).fetchall()
+        return {row[0] for row in result}
+
+    @staticmethod
+    def _check_if_node_exists(
+        db_name: str, node_databases: set[str], db_check_results: dict[str, dict[str, list]]
+    ) -> None:
+        rule_code = PGLOGICAL_NODE_ALREADY_EXISTS
+        node_exists = db_name in node_databases
         init_results_dict(db_check_results, rule_code)
         if node_exists:
             db_check_results[rule_code][ACTION_REQUIRED].append(db_name)
         else:
             db_check_results[rule_code][PASS].append(db_name)
 
-    def check_user_obj_privileges(self, db_name: str) -> list[str]:
-        errors: list[str] = []
-        rows = self.local_db.sql(
-            "select namespace_name from collection_postgres_user_schemas_without_privilege where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        errors.extend(f"user doesn't have USAGE privilege on schema {row[0]}" for row in rows)
-
-        rows = self.local_db.sql(
-            "select schema_name, table_name from collection_postgres_user_tables_without_privilege where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        errors.extend(f"user doesn't have SELECT privilege on table {row[0]}.{row[1]}" for row in rows)
-
-        rows = self.local_db.sql(
-            "select schema_name, view_name from collection_postgres_user_views_without_privilege where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        errors.extend(f"user doesn't have SELECT privilege on view {row[0]}.{row[1]}" for row in rows)
-
-        rows = self.local_db.sql(
-            "select namespace_name, rel_name from collection_postgres_user_sequences_without_privilege where database_name = $db_name",
-            params={"db_name": db_name},
-        ).fetchall()
-        errors.extend(f"user doesn't have SELECT privilege on sequence {row[0]}.{row[1]}" for row in rows)
+    def check_user_obj_privileges(self) -> defaultdict[str, list[str]]:
+        """Return the objects of each database the user lacks privileges on."""
+        errors: defaultdict[str, list[str]] = defaultdict(list)
+        for db_name, namespace_name in self.local_db.sql(
+            "select database_name, namespace_name from collection_postgres_user_schemas_without_privilege"
+        ).fetchall():
+            errors[db_name].append(f"user doesn't have USAGE privilege on schema {namespace_name}")
+
+        for db_name, schema_name, table_name in self.local_db.sql(
+            "select database_name, schema_name, table_name from collection_postgres_user_tables_without_privilege"
+        ).fetchall():
+            errors[db_name].append(f"user doesn't have SELECT privilege on table {schema_name}.{table_name}")
+
+        for db_name, schema_name, view_name in self.local_db.sql(
+            "select database_name, schema_name, view_name from collection_postgres_user_views_without_privilege"
+        ).fetchall():
+            errors[db_name].append(f"user doesn't have SELECT privilege on view {schema_name}.{view_name}")
+
+        for db_name, namespace_name, rel_name in self.local_db.sql(
+            "select database_name, namespace_name, rel_name from collection_postgres_user_sequences_without_privilege"
+        ).fetchall():
+            errors[db_name].append(f"user doesn't have SELECT privilege on sequence {namespace_name}.{rel_name}")
         return errors
 
     def _check_replication_role(self) -> None:
@@ -401,11 +438,16 @@ class PostgresReadinessCheckExecutor(ReadinessCheckExecutor):
                     "user has rolreplication role.",
                 )
 
-    def _check_privileges(self, db_name: str, db_check_results: dict[str, dict[str, list]]) -> bool:
-        rule_code = PRIVILEGES
-        errors = self._check_pglogical_privileges(db_name)
+    def _get_privilege_errors(self, databases: list[str]) -> dict[str, list[str]]:
+        """Return the privileges missing in each database: the pglogical privileges, then the object privileges."""
+        errors = self._get_pglogical_privileges(databases)
+        for db_name, object_errors in self.check_user_obj_privileges().items():
+            errors.setdefault(db_name, []).extend(object_errors)
+        return errors
 
-        errors.extend(self.check_user_obj_privileges(db_name))
+    @staticmethod
+    def _check_privileges(db_name: str, errors: list[str], db_check_results: dict[str, dict[str, list]]) -> bool:
+        rule_code = PRIVILEGES
         all_errors = "\n".join(errors)
         init_results_dict(db_check_results, rule_code)
         if len(errors) > 0:
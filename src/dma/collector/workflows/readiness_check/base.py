@@ -13,14 +13,16 @@
 # limitations under the License.
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
+import pyarrow as pa
 from rich.console import Console
 from rich.table import Table
 
 from dma.collector.dependencies import provide_canonical_queries
-from dma.collector.workflows.collection_extractor.base import CollectionExtractor
+from dma.collector.workflows.collection_extractor.base import AsyncCollectionExtractor, CollectionExtractor
 from dma.lib.exceptions import ApplicationError
 
 if TYPE_CHECKING:
@@ -40,6 +42,51 @@ if TYPE_CHECKING:
     )
 
 
+RULE_RESULT_COLUMNS: Final = ("migration_target", "rule_code", "severity", "info")
+
+
+class RuleResultBuffer:
+    """Accumulate rule results column by column, and write them to ``readiness_check_summary`` with a single insert.
+
+    Results may be appended from several threads; ``flush`` writes everything appended so far, and may be called
+    again to write later results.
+    """
+
+    def __init__(self, local_db: DuckDBPyConnection) -> None:
+        self.local_db = local_db
+        self.columns: dict[str, list[str]] = {column_name: [] for column_name in RULE_RESULT_COLUMNS}
+        self._lock = threading.Lock()
+
+    def append(self, migration_target: str, rule_code: str, severity: str, info: str) -> None:
+        with self._lock:
+            for column_name, value in zip(
+                RULE_RESULT_COLUMNS, (migration_target, rule_code, severity, info), strict=True
+            ):
+                self.columns[column_name].append(value)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self.columns["rule_code"])
+
+    def flush(self) -> int:
+        """Insert the buffered results as an Arrow table, and return the number of results written."""
+        with self._lock:
+            if not self.columns["rule_code"]:
+                return 0
+            results = pa.table({
+                column_name: pa.array(values, pa.string()) for column_name, values in self.columns.items()
+            })
+            self.local_db.register("obj_readiness_check_summary", results)
+            try:
+                self.local_db.execute(
+                    f"insert into readiness_check_summary({', '.join(RULE_RESULT_COLUMNS)}) select {', '.join(RULE_RESULT_COLUMNS)} from obj_readiness_check_summary"  # noqa: S608
+                )
+            finally:
+                self.local_db.unregister("obj_readiness_check_summary")
+            self.columns = {column_name: [] for column_name in RULE_RESULT_COLUMNS}
+            return results.num_rows
+
+
 @dataclass
 class ReadinessCheckTargetConfig:
     db_type: SupportedSources
@@ -56,6 +103,20 @@ class ReadinessCheck:
         console: Console,
         collection_identifier: str | None,
         working_path: Path | None = None,
+        collection_concurrency: int = 1,
+        max_concurrent_databases: int = 1,
+        async_collection: bool = False,
+        batch_size: int | None = None,
+        statement_timeout: float | None = None,
+        lock_timeout: float | None = None,
+        collection_deadline: float | None = None,
+        resume: bool = False,
+        sample_interval: float = 60,
+        sample_count: int = 1,
+        pipeline_per_db: bool = False,
+        max_source_load: int | None = None,
+        load_sample_interval: float = 5,
+        dry_run: bool = False,
     ) -> None:
         self.executor: ReadinessCheckExecutor | None = None
         self.collection_extractor: CollectionExtractor | None = None
@@ -65,23 +126,52 @@ class ReadinessCheck:
         self.console = console
         self.collection_identifier = collection_identifier
         self.working_path = working_path
+        self.collection_concurrency = collection_concurrency
+        self.max_concurrent_databases = max_concurrent_databases
+        self.async_collection = async_collection
+        self.batch_size = batch_size
+        self.statement_timeout = statement_timeout
+        self.lock_timeout = lock_timeout
+        self.collection_deadline = collection_deadline
+        self.resume = resume
+        self.sample_interval = sample_interval
+        self.sample_count = sample_count
+        self.pipeline_per_db = pipeline_per_db
+        self.max_source_load = max_source_load
+        self.load_sample_interval = load_sample_interval
+        self.dry_run = dry_run
 
     def execute(self) -> None:
         self.execute_data_collection()
-        self.execute_readiness_check()
+        if not self.dry_run:
+            self.execute_readiness_check()
 
     def execute_data_collection(self) -> None:
         canonical_query_manager = next(
             provide_canonical_queries(local_db=self.local_db, working_path=self.working_path)
         )
 
-        self.collection_extractor = CollectionExtractor(
+        extractor_class = AsyncCollectionExtractor if self.async_collection else CollectionExtractor
+        self.collection_extractor = extractor_class(
             local_db=self.local_db,
             src_info=self.src_info,
             database=self.database,
             canonical_query_manager=canonical_query_manager,
             console=self.console,
             collection_identifier=self.collection_identifier,
+            collection_concurrency=self.collection_concurrency,
+            max_concurrent_databases=self.max_concurrent_databases,
+            batch_size=self.batch_size,
+            statement_timeout=self.statement_timeout,
+            lock_timeout=self.lock_timeout,
+            collection_deadline=self.collection_deadline,
+            resume=self.resume,
+            sample_interval=self.sample_interval,
+            sample_count=self.sample_count,
+            pipeline_per_db=self.pipeline_per_db,
+            max_source_load=self.max_source_load,
+            load_sample_interval=self.load_sample_interval,
+            dry_run=self.dry_run,
         )
         self.collection_extractor.execute()
         self.db_version = self.collection_extractor.get_db_version()
@@ -98,7 +188,6 @@ class ReadinessCheck:
                 readiness_check=self,
                 console=self.console,
             )
-            self.executor.execute()
         elif self.src_info.db_type == "MYSQL":
             # lazy loaded to help with circular import issues
             from dma.collector.workflows.readiness_check._mysql.main import (  # noqa: PLC0415
@@ -109,13 +198,19 @@ class ReadinessCheck:
                 readiness_check=self,
                 console=self.console,
             )
-            self.executor.execute()
         else:
             msg = f"{self.src_info.db_type} is not implemented."
             raise ApplicationError(msg)
+        try:
+            self.executor.execute()
+        finally:
+            self.executor.flush_results()
 
     def print_summary(self) -> None:
         """Print Summary of the Migration Readiness Assessment."""
+        if self.dry_run:
+            self.console.print("[dim grey]Dry run: no data was collected and the readiness check was skipped.[/]")
+            return
         table = Table(show_header=False)
         table.add_column("title", style="cyan", width=80)
         table.add_row("Migration Readiness Report")
@@ -133,6 +228,7 @@ class ReadinessCheckExecutor:
         self.readiness_check = readiness_check
         self.local_db = readiness_check.local_db
         self.db_version = readiness_check.db_version
+        self.results = RuleResultBuffer(self.local_db)
 
     def execute(self) -> None:
         """Execute checks"""
@@ -157,7 +253,8 @@ class ReadinessCheckExecutor:
         severity: SeverityLevels,
         info: str,
     ) -> None:
-        self.local_db.execute(
-            "insert into readiness_check_summary(migration_target, rule_code, severity, info) values (?,?,?,?)",
-            [migration_target, rule_code, severity, info],
-        )
+        """Buffer the result of a rule; results are written to ``readiness_check_summary`` by ``flush_results``."""
+        self.results.append(migration_target, rule_code, severity, info)
+
+    def flush_results(self) -> int:
+        return self.results.flush()
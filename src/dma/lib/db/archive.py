@@ -0,0 +1,221 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import io
+import tarfile
+import tempfile
+import time
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Literal
+
+import msgspec
+
+from dma.lib.db.export import get_schema_sql, get_table_names, import_database
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import ModuleType
+
+    from duckdb import DuckDBPyConnection
+
+    from dma.lib.db.export import ExportFormat, ParquetCompression
+
+ArchiveFormat = Literal["zip", "tar.zst"]
+
+ARCHIVE_MANIFEST_VERSION = 1
+MANIFEST_NAME = "manifest.json"
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ArchiveMember(msgspec.Struct):
+    name: str
+    sha256: str
+    size: int
+    table_name: str | None = None
+
+
+class ArchiveManifest(msgspec.Struct):
+    """The members of an export archive, and the SHA-256 hash of their content."""
+
+    version: int
+    export_format: str
+    created_at: datetime
+    members: list[ArchiveMember] = msgspec.field(default_factory=list)
+
+
+class _ArchiveWriter:
+    """Append members to a zip or a zstd compressed tar archive, hashing their content as it is written."""
+
+    def __init__(self, archive_file: IO[bytes], archive_format: ArchiveFormat) -> None:
+        self.archive_format = archive_format
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._compressor: IO[bytes] | None = None
+        if archive_format == "zip":
+            self._zip = zipfile.ZipFile(archive_file, "w", compression=zipfile.ZIP_DEFLATED)
+        else:
+            self._compressor = _get_zstd().ZstdCompressor().stream_writer(archive_file, closefd=False)
+            self._tar = tarfile.open(fileobj=self._compressor, mode="w|")  # noqa: SIM115
+
+    def write(self, name: str, source: IO[bytes], size: int, compress: bool = True) -> ArchiveMember:
+        content_hash = hashlib.sha256()
+        if self._zip is not None:
+            zip_info = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+            zip_info.compress_type = zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED
+            with self._zip.open(zip_info, "w", force_zip64=True) as member:
+                while chunk := source.read(_CHUNK_SIZE):
+                    content_hash.update(chunk)
+                    member.write(chunk)
+        elif self._tar is not None:
+            tar_info = tarfile.TarInfo(name)
+            tar_info.size = size
+            tar_info.mtime = int(time.time())
+            self._tar.addfile(tar_info, _HashingReader(source, content_hash))
+        return ArchiveMember(name=name, sha256=content_hash.hexdigest(), size=size)
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._compressor is not None:
+            self._compressor.close()
+
+
+class _HashingReader:
+    def __init__(self, source: IO[bytes], content_hash: Any) -> None:
+        self.source = source
+        self.content_hash = content_hash
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.source.read(size)
+        self.content_hash.update(chunk)
+        return chunk
+
+
+def export_archive(
+    local_db: DuckDBPyConnection,
+    archive_path: Path,
+    archive_format: ArchiveFormat = "zip",
+    export_format: ExportFormat = "csv",
+    delimiter: str = "|",
+    compression: ParquetCompression = "zstd",
+    row_group_size: int | None = None,
+) -> ArchiveManifest:
+    """Export the entire database into a single archive, with a manifest of the SHA-256 hash of every member.
+
+    Each table is written by DuckDB to a scratch file next to the archive, then streamed into the archive and hashed in
+    the same pass, and removed.  The archive holds the ``schema.sql`` and ``load.sql`` scripts of ``export database``,
+    so it is loaded back with :func:`import_archive`, or with ``import database`` once extracted.
+    """
+    if export_format == "csv":
+        extension, options = "csv", f"format csv, quote '\"', header true, delimiter '{delimiter}'"
+        copy_options = options
+    else:
+        extension, options = "parquet", f"format parquet, compression {compression}"
+        copy_options = "format parquet"
+        if row_group_size is not None:
+            options += f", row_group_size {row_group_size}"
+    manifest = ArchiveManifest(
+        version=ARCHIVE_MANIFEST_VERSION, export_format=export_format, created_at=datetime.now(tz=timezone.utc)
+    )
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    load_statements = []
+    with (
+        archive_path.open("wb") as archive_file,
+        tempfile.TemporaryDirectory(dir=archive_path.parent, prefix=".dma_export_") as scratch_path,
+        _open_writer(archive_file, archive_format) as writer,
+    ):
+        manifest.members.append(_write_bytes(writer, "schema.sql", get_schema_sql(local_db).encode()))
+        for table_name in get_table_names(local_db):
+            member_name = f"{table_name}.{extension}"
+            table_path = Path(scratch_path) / member_name
+            local_db.execute(f"copy {table_name} to '{table_path!s}' ({options})")
+            with table_path.open("rb") as table_file:
+                member = writer.write(
+                    member_name, table_file, table_path.stat().st_size, compress=export_format == "csv"
+                )
+            table_path.unlink()
+            member.table_name = table_name
+            manifest.members.append(member)
+            load_statements.append(f"copy {table_name} from '{member_name}' ({copy_options});")
+        manifest.members.append(_write_bytes(writer, "load.sql", ("\n".join(load_statements) + "\n").encode()))
+        _write_bytes(writer, MANIFEST_NAME, msgspec.json.format(msgspec.json.encode(manifest)))
+    return manifest
+
+
+def import_archive(local_db: DuckDBPyConnection, archive_path: Path, working_path: Path | None = None) -> None:
+    """Extract an archive written by :func:`export_archive`, check it against its manifest, and load it."""
+    with tempfile.TemporaryDirectory(dir=working_path, prefix=".dma_import_") as extract_path:
+        manifest = extract_archive(archive_path, Path(extract_path))
+        for member in manifest.members:
+            content_hash = hashlib.sha256()
+            with (Path(extract_path) / member.name).open("rb") as member_file:
+                while chunk := member_file.read(_CHUNK_SIZE):
+                    content_hash.update(chunk)
+            if content_hash.hexdigest() != member.sha256:
+                msg = f"The content of '{member.name}' does not match the manifest of '{archive_path!s}'."
+                raise ApplicationError(msg)
+        import_database(local_db, Path(extract_path))
+
+
+def extract_archive(archive_path: Path, extract_path: Path) -> ArchiveManifest:
+    """Extract an export archive, and return its manifest."""
+    if zipfile.is_zipfile(archive_path):
+        with zipfile.ZipFile(archive_path) as archive:
+            archive.extractall(extract_path)  # noqa: S202
+    else:
+        with (
+            archive_path.open("rb") as archive_file,
+            _get_zstd().ZstdDecompressor().stream_reader(archive_file) as decompressor,
+            tarfile.open(fileobj=decompressor, mode="r|") as archive,
+        ):
+            archive.extractall(extract_path, filter="data")
+    try:
+        return msgspec.json.decode((extract_path / MANIFEST_NAME).read_bytes(), type=ArchiveManifest)
+    except (OSError, msgspec.DecodeError) as e:
+        msg = f"'{archive_path!s}' is not an export archive: its manifest is missing or invalid."
+        raise ApplicationError(msg) from e
+
+
+def get_archive_name(archive_format: ArchiveFormat) -> str:
+    return f"assessment.{archive_format}"
+
+
+@contextmanager
+def _open_writer(archive_file: IO[bytes], archive_format: ArchiveFormat) -> Iterator[_ArchiveWriter]:
+    writer = _ArchiveWriter(archive_file, archive_format)
+    try:
+        yield writer
+    finally:
+        writer.close()
+
+
+def _write_bytes(writer: _ArchiveWriter, name: str, content: bytes) -> ArchiveMember:
+    return writer.write(name, io.BytesIO(content), len(content))
+
+
+def _get_zstd() -> ModuleType:
+    try:
+        import zstandard  # noqa: PLC0415
+    except ImportError as e:
+        msg = "`tar.zst` archives require the `zstandard` package.  Install it with `pip install dma[zstd]`."
+        raise ApplicationError(msg) from e
+    return zstandard
@@ -14,11 +14,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-
-from sqlalchemy import URL, Engine, create_engine
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+    from sqlalchemy import Engine
+
     from dma.types import (
         SupportedSources,
     )
@@ -37,6 +38,8 @@ def get_engine(
     src_info: SourceInfo,
     database: str,
 ) -> Engine:
+    from sqlalchemy import URL, create_engine  # noqa: PLC0415
+
     if src_info.db_type == "POSTGRES":
         return create_engine(
             URL(
@@ -96,3 +99,128 @@ def get_engine(
         )
     msg = f"{src_info.db_type} is not a supported engine."  # type: ignore[unreachable]
     raise NotImplementedError(msg)
+
+
+def get_connection(
+    src_info: SourceInfo,
+    database: str,
+) -> Any:
+    """Open a driver connection to ``database``, without going through SQLAlchemy.
+
+    The connection uses the driver of the aiosql adapter of the source's query manager, in autocommit mode and
+    returning rows as dicts where the driver supports it.
+    """
+    if src_info.db_type == "POSTGRES":
+        import psycopg  # noqa: PLC0415
+        from psycopg.rows import dict_row  # noqa: PLC0415
+
+        return psycopg.connect(
+            host=src_info.hostname,
+            port=src_info.port,
+            user=src_info.username,
+            password=src_info.password,
+            dbname=database,
+            autocommit=True,
+            row_factory=dict_row,
+        )
+    if src_info.db_type == "MYSQL":
+        import pymysql  # noqa: PLC0415
+        from pymysql.cursors import DictCursor  # noqa: PLC0415
+
+        return pymysql.connect(
+            host=src_info.hostname,
+            port=src_info.port,
+            user=src_info.username,
+            password=src_info.password,
+            database=database,
+            autocommit=True,
+            cursorclass=DictCursor,
+        )
+    if src_info.db_type == "MSSQL":
+        import pymssql  # noqa: PLC0415
+
+        return pymssql.connect(
+            server=src_info.hostname,
+            port=str(src_info.port),
+            user=src_info.username,
+            password=src_info.password,
+            database=database,
+            autocommit=True,
+            as_dict=True,
+        )
+    if src_info.db_type == "ORACLE":
+        import oracledb  # noqa: PLC0415
+
+        connection = oracledb.connect(
+            user=src_info.username,
+            password=src_info.password,
+            host=src_info.hostname,
+            port=src_info.port,
+            service_name=database,
+        )
+        connection.autocommit = True
+        return connection
+    msg = f"{src_info.db_type} is not a supported engine."  # type: ignore[unreachable]
+    raise NotImplementedError(msg)
+
+
+def get_connection_pool(
+    src_info: SourceInfo,
+    database: str,
+    max_size: int = 4,
+) -> ConnectionPool:
+    """Build a bounded pool of driver connections for concurrent collection.
+
+    The pool is returned closed; use it as a context manager to open it and to release the connections afterwards.
+    """
+    if src_info.db_type == "POSTGRES":
+        from psycopg.conninfo import make_conninfo  # noqa: PLC0415
+        from psycopg.rows import dict_row  # noqa: PLC0415
+        from psycopg_pool import ConnectionPool  # noqa: PLC0415
+
+        return ConnectionPool(
+            conninfo=make_conninfo(
+                host=src_info.hostname,
+                port=src_info.port,
+                user=src_info.username,
+                password=src_info.password,
+                dbname=database,
+            ),
+            kwargs={"autocommit": True, "row_factory": dict_row},
+            min_size=1,
+            max_size=max_size,
+            open=False,
+        )
+    msg = f"Connection pooling is not supported for {src_info.db_type}."
+    raise NotImplementedError(msg)
+
+
+def get_async_connection_pool(
+    src_info: SourceInfo,
+    database: str,
+    max_size: int = 4,
+) -> AsyncConnectionPool:
+    """Build a bounded pool of async driver connections for the async collection pipeline.
+
+    The pool is returned closed; use it as an async context manager to open it and to release the connections
+    afterwards.
+    """
+    if src_info.db_type == "POSTGRES":
+        from psycopg.conninfo import make_conninfo  # noqa: PLC0415
+        from psycopg_pool import AsyncConnectionPool  # noqa: PLC0415
+
+        return AsyncConnectionPool(
+            conninfo=make_conninfo(
+                host=src_info.hostname,
+                port=src_info.port,
+                user=src_info.username,
+                password=src_info.password,
+                dbname=database,
+            ),
+            kwargs={"autocommit": True},
+            min_size=1,
+            max_size=max_size,
+            open=False,
+        )
+    msg = f"Async collection is not supported for {src_info.db_type}."
+    raise NotImplementedError(msg)
@@ -0,0 +1,130 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from dma.lib.db.base import get_connection, get_connection_pool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from psycopg_pool import AsyncConnectionPool, ConnectionPool
+
+    from dma.lib.db.base import SourceInfo
+
+
+@dataclass
+class ConnectionStats:
+    """Connection usage of a single database of the source."""
+
+    database: str
+    connections_opened: int = 0
+    checkouts: int = 0
+    connect_ms: int = 0
+    pooled_connections_opened: int = 0
+    pooled_requests: int = 0
+    pooled_connect_ms: int = 0
+
+
+class ConnectionManager:
+    """Hand out the connections to the databases of a single source, reusing them across the collection phases.
+
+    Driver connections and connection pools are opened on first use for each database and kept open until they are
+    released or the manager is closed, so the connection and authentication handshakes are paid once per database
+    rather than once per phase.  The connections to ``database``, the database being assessed, are only closed with
+    the manager.  Safe to use from several threads, as long as a connection to a database is used by one thread at a
+    time.
+    """
+
+    def __init__(self, src_info: SourceInfo, database: str) -> None:
+        self.src_info = src_info
+        self.database = database
+        self.connections: dict[str, Any] = {}
+        self.connection_pools: dict[str, ConnectionPool] = {}
+        self.stats: dict[str, ConnectionStats] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self, database: str) -> Iterator[Any]:
+        """Yield the driver connection to ``database``, opening it on first use."""
+        with self._lock:
+            driver_connection = self.connections.get(database)
+            stats = self.stats.setdefault(database, ConnectionStats(database=database))
+            stats.checkouts += 1
+        if driver_connection is None:
+            started = time.perf_counter()
+            driver_connection = get_connection(self.src_info, database)
+            with self._lock:
+                stats.connections_opened += 1
+                stats.connect_ms += int((time.perf_counter() - started) * 1000)
+                self.connections[database] = driver_connection
+        yield driver_connection
+
+    def get_connection_pool(self, database: str, max_size: int = 4) -> ConnectionPool:
+        """Return an open pool of driver connections to ``database``, sized on first use."""
+        with self._lock:
+            if database not in self.connection_pools:
+                connection_pool = get_connection_pool(self.src_info, database, max_size=max_size)
+                connection_pool.open()
+                self.stats.setdefault(database, ConnectionStats(database=database))
+                self.connection_pools[database] = connection_pool
+            return self.connection_pools[database]
+
+    def release(self, database: str) -> None:
+        """Close the connections to a database that will not be used again, unless it is the assessed database."""
+        if database != self.database:
+            self._close(database)
+
+    def close(self) -> None:
+        for database in {*self.connections, *self.connection_pools}:
+            self._close(database)
+
+    def _close(self, database: str) -> None:
+        with self._lock:
+            driver_connection = self.connections.pop(database, None)
+            connection_pool = self.connection_pools.pop(database, None)
+        if driver_connection is not None:
+            # the connection may already be broken, e.g. by the source restarting
+            with suppress(Exception):
+                driver_connection.close()
+        if connection_pool is not None:
+            self._update_pool_stats(database, connection_pool)
+            connection_pool.close()
+
+    def get_stats(self) -> list[ConnectionStats]:
+        """Return the connection usage of every database, including the pools that are still open."""
+        for database, connection_pool in list(self.connection_pools.items()):
+            self._update_pool_stats(database, connection_pool)
+        return sorted(self.stats.values(), key=lambda stats: stats.database)
+
+    def record_pool_stats(self, database: str, connection_pool: AsyncConnectionPool) -> None:
+        """Add the usage of a pool the manager does not own, such as those of the async collection, to the stats."""
+        pool_stats = connection_pool.get_stats()
+        with self._lock:
+            stats = self.stats.setdefault(database, ConnectionStats(database=database))
+            stats.pooled_connections_opened += pool_stats.get("connections_num", 0)
+            stats.pooled_requests += pool_stats.get("requests_num", 0)
+            stats.pooled_connect_ms += pool_stats.get("connections_ms", 0)
+
+    def _update_pool_stats(self, database: str, connection_pool: ConnectionPool) -> None:
+        pool_stats = connection_pool.get_stats()
+        stats = self.stats[database]
+        stats.pooled_connections_opened = pool_stats.get("connections_num", 0)
+        stats.pooled_requests = pool_stats.get("requests_num", 0)
+        stats.pooled_connect_ms = pool_stats.get("connections_ms", 0)
@@ -0,0 +1,133 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from duckdb import DuckDBPyConnection
+
+ExportFormat = Literal["csv", "parquet"]
+ParquetCompression = Literal["zstd", "snappy", "gzip", "uncompressed"]
+
+# the columns identifying the collection of a row: fleet databases use `collection_key`, assessment databases `pkey`
+COLLECTION_KEY_COLUMNS = ("collection_key", "pkey")
+
+
+def export_database(
+    local_db: DuckDBPyConnection,
+    export_path: Path,
+    export_format: ExportFormat = "csv",
+    delimiter: str = "|",
+    compression: ParquetCompression = "zstd",
+    row_group_size: int | None = None,
+    partition_by_collection: bool = False,
+) -> None:
+    """Export the entire database with DDLs and data.
+
+    Parquet exports are compressed with ``compression``, and may be hive partitioned by the collection key of each
+    table, so that a collection can be read without scanning the others.  Either way, the export is loaded back with
+    :func:`import_database`.
+    """
+    if export_format == "csv":
+        local_db.execute(f"export database '{export_path!s}' (format csv, delimiter '{delimiter}')")
+        return
+    options = f"format parquet, compression {compression}"
+    if row_group_size is not None:
+        options += f", row_group_size {row_group_size}"
+    if not partition_by_collection:
+        local_db.execute(f"export database '{export_path!s}' ({options})")
+        return
+    _export_partitioned(local_db, export_path, options)
+
+
+def _export_partitioned(local_db: DuckDBPyConnection, export_path: Path, options: str) -> None:
+    """Export each table containing a collection key as a hive partitioned directory, and the others as a file.
+
+    ``export database`` cannot partition tables, so the ``schema.sql`` and ``load.sql`` scripts are written here.
+    """
+    export_path.mkdir(parents=True, exist_ok=True)
+    columns: dict[str, set[str]] = {}
+    for table_name, column_name in local_db.execute(
+        "select table_name, column_name from duckdb_columns() where database_name = current_database() and schema_name = 'main'"
+    ).fetchall():
+        columns.setdefault(table_name, set()).add(column_name)
+    load_statements = []
+    for table_name in get_table_names(local_db):
+        partition_column = next(
+            (column_name for column_name in COLLECTION_KEY_COLUMNS if column_name in columns.get(table_name, ())),
+            None,
+        )
+        # partitioning an empty table writes no file, which could not be read back
+        has_rows = local_db.execute(f"select exists(select 1 from {table_name})").fetchone()  # noqa: S608
+        if partition_column is None or not (has_rows and has_rows[0]):
+            target = export_path / f"{table_name}.parquet"
+            local_db.execute(f"copy {table_name} to '{target!s}' ({options})")
+            load_statements.append(f"copy {table_name} from '{target!s}' (format parquet);")
+            continue
+        target = export_path / table_name
+        local_db.execute(f"copy {table_name} to '{target!s}' ({options}, partition_by ({partition_column}))")
+        load_statements.append(_get_partitioned_load(table_name, target))
+    (export_path / "schema.sql").write_text(get_schema_sql(local_db), encoding="utf-8")
+    (export_path / "load.sql").write_text("\n".join(load_statements) + "\n", encoding="utf-8")
+
+
+def get_table_names(local_db: DuckDBPyConnection) -> list[str]:
+    return [
+        table_name
+        for (table_name,) in local_db.execute(
+            "select table_name from duckdb_tables() where database_name = current_database() and schema_name = 'main' and not temporary order by table_name"
+        ).fetchall()
+    ]
+
+
+def get_schema_sql(local_db: DuckDBPyConnection) -> str:
+    """Return the statements creating the tables, then the views, of the database."""
+    tables = local_db.execute(
+        "select sql from duckdb_tables() where database_name = current_database() and schema_name = 'main' and not temporary order by table_name"
+    ).fetchall()
+    views = local_db.execute(
+        "select sql from duckdb_views() where database_name = current_database() and schema_name = 'main' and not internal and not temporary order by view_oid"
+    ).fetchall()
+    return "\n".join(sql for (sql,) in [*tables, *views]) + "\n"
+
+
+def _get_partitioned_load(table_name: str, partition_path: Path) -> str:
+    # the partition values are read as text, so that keys are never reinterpreted as numbers or dates
+    return f"insert into {table_name} by name select * from read_parquet('{partition_path!s}/**/*.parquet', hive_partitioning = true, hive_types_autocast = false);"  # noqa: S608
+
+
+def import_database(local_db: DuckDBPyConnection, export_path: Path) -> None:
+    """Load a database exported by :func:`export_database`.
+
+    CSV and Parquet files are loaded with ``import database``.  Partitioned exports cannot be, so their schema is
+    created and each table is scanned with ``read_parquet`` here, from wherever the export was moved to.
+    """
+    partition_paths = sorted(path for path in export_path.iterdir() if path.is_dir() and any(path.glob("*=*")))
+    if not partition_paths:
+        local_db.execute(f"import database '{export_path!s}'")
+        return
+    local_db.begin()
+    try:
+        local_db.execute((export_path / "schema.sql").read_text(encoding="utf-8"))
+        for table_file in sorted(export_path.glob("*.parquet")):
+            local_db.execute(f"copy {table_file.stem} from '{table_file!s}' (format parquet)")
+        for partition_path in partition_paths:
+            local_db.execute(_get_partitioned_load(partition_path.name, partition_path))
+    except:
+        local_db.rollback()
+        raise
+    local_db.commit()
@@ -20,15 +20,27 @@ from typing import TYPE_CHECKING
 
 import duckdb
 
+from dma.lib.db.resources import get_resource_profile
+
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
 
 @contextmanager
 def get_duckdb_connection(
-    working_path: Path | None = None, export_path: Path | None = None, database: str | None = None
+    working_path: Path | None = None,
+    export_path: Path | None = None,
+    database: str | None = None,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+    resource_share: int = 1,
 ) -> Iterator[duckdb.DuckDBPyConnection]:
-    """Yield a new duckdb connections and automatically manages resource cleanup."""
+    """Yield a new duckdb connections and automatically manages resource cleanup.
+
+    The threads, memory limit and temporary directory size of the database are sized to the host, sharing it with
+    ``resource_share`` concurrent connections, unless they are set explicitly.  The chosen profile is recorded in the
+    ``dma_resource_profile`` table.
+    """
 
     if database is None and export_path is not None:
         database = f"{Path(export_path / 'assessment.db').absolute()!s}"
@@ -36,19 +48,15 @@ def get_duckdb_connection(
         database = ":memory:"
     if working_path is None:
         working_path = Path(tempfile.gettempdir())
-    config: dict[str, str | bool | int | float | list[str]] = {
-        "memory_limit": "1GB",
-        "temp_directory": str(working_path),
-        "worker_threads": 2,
-        "preserve_insertion_order": False,
-    }
     Path(working_path).mkdir(parents=True, exist_ok=True)
+    profile = get_resource_profile(Path(working_path), threads=threads, memory_limit=memory_limit, share=resource_share)
     with duckdb.connect(
         database=database,
         read_only=False,
-        config=config,
+        config=profile.to_config(),
     ) as local_db:
         try:
+            profile.record(local_db)
             yield local_db
         finally:
             local_db.close()
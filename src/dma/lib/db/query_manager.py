@@ -15,18 +15,22 @@ from __future__ import annotations
 
 import contextlib
 import faulthandler
+import logging
 from typing import TYPE_CHECKING, Any, TypeVar
 
+import pyarrow as pa
 from typing_extensions import Self
 
 from dma.lib.exceptions import ApplicationError
 
 faulthandler.enable()
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
 
     from aiosql.queries import Queries
 
+logger = logging.getLogger(__name__)
+
 QueryManagerT = TypeVar("QueryManagerT", bound="QueryManager")
 
 
@@ -64,6 +68,45 @@ class QueryManager:
         data = self.fn(method)(conn=self.connection, **binds)
         return [dict(row) for row in data]
 
+    def select_arrow(self, method: str, schema: pa.Schema | None = None, **binds: Any) -> pa.Table:
+        """Execute a query and return its result set as an Arrow table, without building a dict per row.
+
+        Columns present in ``schema`` are built with its types; the others are inferred.
+        """
+        with contextlib.closing(self.tuple_cursor(self.connection)) as cursor:
+            cursor.execute(self.fn(method).sql, binds)
+            return pa.Table.from_batches([rows_to_record_batch(cursor.description, cursor.fetchall(), schema)])
+
+    def select_batches(
+        self, method: str, batch_size: int = 10_000, schema: pa.Schema | None = None, **binds: Any
+    ) -> Iterator[pa.RecordBatch]:
+        """Yield the rows of a query as Arrow record batches of at most ``batch_size`` rows."""
+        with self.batch_cursor(method) as cursor:
+            cursor.execute(self.fn(method).sql, binds)
+            while rows := cursor.fetchmany(batch_size):
+                yield rows_to_record_batch(cursor.description, rows, schema)
+
+    @contextlib.contextmanager
+    def batch_cursor(self, method: str) -> Iterator[Any]:
+        """Open the cursor used by :meth:`select_batches`.
+
+        Drivers that support server-side cursors should override this so that rows are not buffered client side.
+        """
+        cursor = self.tuple_cursor(self.connection)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def tuple_cursor(connection: Any) -> Any:
+        """Open a cursor on ``connection`` returning rows as tuples, whatever the row factory of the connection.
+
+        Drivers whose connections are opened with a dict row factory override this, so that result sets ingested as
+        Arrow do not build a dict per row.
+        """
+        return connection.cursor()
+
     def select_one(self, method: str, **binds: Any) -> dict[str, Any]:
         data = self.fn(method)(conn=self.connection, **binds)
         return dict(data)
@@ -89,3 +132,49 @@ class QueryManager:
         except AttributeError as exc:
             msg = "%s was not found"
             raise ApplicationError(msg, method) from exc
+
+
+def rows_to_record_batch(
+    description: Sequence[Sequence[Any]], rows: Sequence[Any], schema: pa.Schema | None = None
+) -> pa.RecordBatch:
+    """Transpose tuple rows, as returned by :meth:`QueryManager.tuple_cursor`, into an Arrow record batch.
+
+    The column names are taken from the cursor ``description``.  Columns found in ``schema`` are converted to its
+    types without an inference pass.  Other columns are inferred, and values Arrow cannot infer a type for (e.g.
+    ``inet`` addresses) are converted to strings; both fallbacks are logged with the column they apply to.
+    """
+    column_names = [column[0] for column in description]
+    columns = list(zip(*rows, strict=True)) if rows else [() for _ in column_names]
+    return pa.RecordBatch.from_arrays(
+        [
+            _to_arrow_array(column, _field_type(schema, column_name), column_name)
+            for column_name, column in zip(column_names, columns, strict=True)
+        ],
+        names=column_names,
+    )
+
+
+def _field_type(schema: pa.Schema | None, column_name: str) -> pa.DataType | None:
+    if schema is None:
+        return None
+    index = schema.get_field_index(column_name)
+    return schema.field(index).type if index >= 0 else None
+
+
+def _to_arrow_array(values: Sequence[Any], type_: pa.DataType | None = None, column_name: str = "") -> pa.Array:
+    if type_ is not None:
+        try:
+            return pa.array(values, type=type_)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+            logger.warning(
+                "Column %s could not be converted to %s, inferring its type instead: %s", column_name, type_, e
+            )
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as e:
+        value_type = next((type(value).__name__ for value in values if value is not None), "NoneType")
+        # expected for the source types Arrow has no equivalent for, such as ``inet``
+        logger.debug(
+            "Column %s holds %s values with no Arrow type, converting them to strings: %s", column_name, value_type, e
+        )
+        return pa.array([None if value is None else str(value) for value in values], type=pa.string())
@@ -0,0 +1,190 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import math
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+THREADS_ENV = "DMA_DUCKDB_THREADS"
+MEMORY_LIMIT_ENV = "DMA_DUCKDB_MEMORY_LIMIT"
+MAX_TEMP_DIRECTORY_SIZE_ENV = "DMA_DUCKDB_MAX_TEMP_DIRECTORY_SIZE"
+
+# the share of the available memory and of the free disk DuckDB may use when they are not set explicitly
+MEMORY_FRACTION = 0.75
+DISK_FRACTION = 0.9
+MIN_MEMORY_LIMIT_MB = 256
+
+_CGROUP_PATH = Path("/sys/fs/cgroup")
+# cgroup v1 reports an unlimited memory limit as a page aligned maximum value
+_CGROUP_V1_UNLIMITED = 1 << 60
+
+
+@dataclass
+class ResourceProfile:
+    """The resources of the host, and the DuckDB settings chosen for them."""
+
+    threads: int
+    memory_limit: str
+    max_temp_directory_size: str
+    temp_directory: str
+    detected_cores: int
+    detected_memory_mb: int | None
+    detected_free_disk_mb: int | None
+    share: int = 1
+    overrides: str = ""
+    """The comma separated settings that were set explicitly rather than detected."""
+
+    def to_config(self) -> dict[str, str | bool | int | float | list[str]]:
+        return {
+            "threads": self.threads,
+            "memory_limit": self.memory_limit,
+            "max_temp_directory_size": self.max_temp_directory_size,
+            "temp_directory": self.temp_directory,
+            "preserve_insertion_order": False,
+        }
+
+    def record(self, local_db: DuckDBPyConnection) -> None:
+        """Append the profile to the ``dma_resource_profile`` table, so that runs can be compared later."""
+        local_db.execute("""
+            create table if not exists dma_resource_profile(
+                recorded_at TIMESTAMP WITH TIME ZONE default current_timestamp,
+                threads INTEGER,
+                memory_limit VARCHAR,
+                max_temp_directory_size VARCHAR,
+                temp_directory VARCHAR,
+                detected_cores INTEGER,
+                detected_memory_mb BIGINT,
+                detected_free_disk_mb BIGINT,
+                share INTEGER,
+                overrides VARCHAR
+            )
+        """)
+        values = asdict(self)
+        local_db.execute(
+            f"insert into dma_resource_profile({', '.join(values)}) values ({', '.join('?' for _ in values)})",  # noqa: S608
+            list(values.values()),
+        )
+
+
+def get_resource_profile(
+    working_path: Path,
+    threads: int | None = None,
+    memory_limit: str | None = None,
+    max_temp_directory_size: str | None = None,
+    share: int = 1,
+) -> ResourceProfile:
+    """Size the DuckDB settings to the host.
+
+    Settings that are not given are read from the ``DMA_DUCKDB_THREADS``, ``DMA_DUCKDB_MEMORY_LIMIT`` and
+    ``DMA_DUCKDB_MAX_TEMP_DIRECTORY_SIZE`` environment variables, and otherwise derived from the cores and the memory
+    available to the process, including cgroup limits, and from the free disk space of ``working_path``.  ``share``
+    divides the detected resources between processes running side by side, such as fleet workers.
+    """
+    share = max(share, 1)
+    overrides = []
+    cores = detect_cpu_count()
+    memory_mb = detect_memory_mb()
+    free_disk_mb = detect_free_disk_mb(working_path)
+    threads = threads if threads is not None else _get_int_env(THREADS_ENV)
+    if threads is not None:
+        overrides.append("threads")
+    memory_limit = memory_limit or os.environ.get(MEMORY_LIMIT_ENV)
+    if memory_limit:
+        overrides.append("memory_limit")
+    max_temp_directory_size = max_temp_directory_size or os.environ.get(MAX_TEMP_DIRECTORY_SIZE_ENV)
+    if max_temp_directory_size:
+        overrides.append("max_temp_directory_size")
+    return ResourceProfile(
+        threads=threads if threads is not None else max(cores // share, 1),
+        memory_limit=memory_limit
+        or f"{max(int(memory_mb * MEMORY_FRACTION / share), MIN_MEMORY_LIMIT_MB) if memory_mb else 1024}MB",
+        max_temp_directory_size=max_temp_directory_size
+        or (f"{int(free_disk_mb * DISK_FRACTION / share)}MB" if free_disk_mb else "90% of available disk space"),
+        temp_directory=str(working_path),
+        detected_cores=cores,
+        detected_memory_mb=memory_mb,
+        detected_free_disk_mb=free_disk_mb,
+        share=share,
+        overrides=",".join(overrides),
+    )
+
+
+def detect_cpu_count() -> int:
+    """Return the number of cores the process may use, honouring CPU affinity and cgroup v2 or v1 CPU quotas."""
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    quota = _read_cgroup_file("cpu.max")
+    if quota is not None and not quota.startswith("max"):
+        limit, period = quota.split()
+        cores = min(cores, max(math.ceil(int(limit) / int(period)), 1))
+    elif quota is None:
+        # cgroup v1 reports the quota and the period in separate files, and an unlimited quota as -1
+        for cpu_controller in ("cpu", "cpu,cpuacct"):
+            quota_us = _read_cgroup_file(f"{cpu_controller}/cpu.cfs_quota_us")
+            period_us = _read_cgroup_file(f"{cpu_controller}/cpu.cfs_period_us")
+            if quota_us is not None and period_us is not None:
+                if quota_us.isdigit() and period_us.isdigit() and int(period_us) > 0:
+                    cores = min(cores, max(math.ceil(int(quota_us) / int(period_us)), 1))
+                break
+    return max(cores, 1)
+
+
+def detect_memory_mb() -> int | None:
+    """Return the memory available to the process in MB: the physical memory, or the cgroup memory limit if lower."""
+    memory: int | None = None
+    if hasattr(os, "sysconf"):
+        try:
+            memory = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (ValueError, OSError):
+            memory = None
+    for cgroup_file in ("memory.max", "memory/memory.limit_in_bytes"):
+        limit = _read_cgroup_file(cgroup_file)
+        if limit is not None and limit.isdigit() and int(limit) < _CGROUP_V1_UNLIMITED:
+            memory = min(memory, int(limit)) if memory is not None else int(limit)
+            break
+    return memory // (1024 * 1024) if memory is not None else None
+
+
+def detect_free_disk_mb(path: Path) -> int | None:
+    """Return the free disk space of the file system holding ``path`` in MB."""
+    for candidate in (path, *path.parents):
+        if candidate.exists():
+            return shutil.disk_usage(candidate).free // (1024 * 1024)
+    return None
+
+
+def _read_cgroup_file(name: str) -> str | None:
+    try:
+        return (_CGROUP_PATH / name).read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+
+
+def _get_int_env(name: str) -> int | None:
+    value = os.environ.get(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError as e:
+        msg = f"{name} must be a whole number, not '{value}'."
+        raise ApplicationError(msg) from e
@@ -0,0 +1,49 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+    from duckdb import DuckDBPyConnection
+
+
+class SchemaRegistry:
+    """Arrow schemas of the tables in a local DuckDB database.
+
+    The column types are read from DuckDB once, after the canonical DDLs have run, so that result sets can be built
+    with the types of their target table instead of inferring them on every load.
+    """
+
+    def __init__(self, local_db: DuckDBPyConnection) -> None:
+        self.local_db = local_db
+        self._schemas: dict[str, pa.Schema] = {}
+
+    def load(self) -> None:
+        """Read the schema of every table in the main schema of the database."""
+        tables = self.local_db.execute(
+            "select table_name from information_schema.tables where table_catalog = current_database() and table_schema = 'main' and table_type = 'BASE TABLE'"
+        ).fetchall()
+        self._schemas = {
+            table_name: self.local_db.sql(f"select * from {table_name} limit 0").arrow().schema  # noqa: S608
+            for (table_name,) in tables
+        }
+
+    def get(self, table_name: str) -> pa.Schema | None:
+        """Return the schema of a table, or ``None`` when the table is unknown."""
+        return self._schemas.get(table_name)
+
+    def __contains__(self, table_name: str) -> bool:
+        return table_name in self._schemas
@@ -0,0 +1,84 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class AdaptiveLimiter:
+    """Bound the number of in-flight queries, adapting the bound to the load of the source.
+
+    The load is sampled at most every ``sample_interval`` seconds.  The first sample sizes the limit to the headroom
+    left under ``load_ceiling``.  Afterwards, the limit is halved whenever the load is above the ceiling, and grows by
+    one query per sample while the load stays below 80% of the ceiling.  The limit never drops below ``min_limit``, so
+    that a collection always makes progress.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        load_ceiling: int,
+        sample_load: Callable[[], int | None],
+        sample_interval: float = 5,
+        min_limit: int = 1,
+    ) -> None:
+        self.max_limit = max(max_limit, min_limit)
+        self.min_limit = min_limit
+        self.limit = min_limit
+        self.load_ceiling = load_ceiling
+        self.sample_load = sample_load
+        self.sample_interval = sample_interval
+        self.last_load: int | None = None
+        self.in_flight = 0
+        self._sampled_at: float | None = None
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Wait until a query may start, and hold a slot while it runs."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_flight -= 1
+                self._condition.notify_all()
+
+    def adjust(self) -> int:
+        """Sample the load of the source if it is due, and return the resulting limit."""
+        now = time.monotonic()
+        if self._sampled_at is not None and now - self._sampled_at < self.sample_interval:
+            return self.limit
+        self._sampled_at = now
+        load = self.sample_load()
+        if load is None:
+            return self.limit
+        with self._condition:
+            if self.last_load is None:
+                self.limit = min(max(self.load_ceiling - load, self.min_limit), self.max_limit)
+            elif load > self.load_ceiling:
+                self.limit = max(self.limit // 2, self.min_limit)
+            elif load < self.load_ceiling * 0.8:
+                self.limit = min(self.limit + 1, self.max_limit)
+            self._condition.notify_all()
+        self.last_load = load
+        return self.limit
@@ -11,6 +11,9 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import subprocess
+import sys
+
 from click.testing import CliRunner
 
 from dma.cli.main import app
@@ -25,3 +28,41 @@ def test_readiness_check() -> None:
     runner = CliRunner()
     result = runner.invoke(app, ["readiness-check", "--help"])
     assert result.exit_code == 0
+
+
+# a wall-clock budget is too noisy on shared or parallel test runners to guard the startup time, so the CLI is checked
+# to import nothing but its own modules and the packages it needs to parse arguments and print
+CLI_PACKAGES = {"click", "dma", "rich", "rich_click"}
+DEFERRED_MODULES = ("aiosql", "duckdb", "polars", "psycopg", "pyarrow", "sqlalchemy")
+
+
+def _imported_modules(*modules: str) -> set[str]:
+    imports = "".join(f"import {module}; " for module in modules)
+    return set(
+        subprocess.run(
+            [sys.executable, "-c", f"{imports}import sys; print(*sorted(sys.modules), sep='\\n')"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+    )
+
+
+def test_cli_defers_heavy_imports() -> None:
+    modules = _imported_modules("dma.cli.main")
+    assert not [module for module in DEFERRED_MODULES if module in modules]
+    assert {module for module in modules if module.startswith("dma.")} == {
+        "dma.__about__",
+        "dma.cli",
+        "dma.cli._utils",
+        "dma.cli.main",
+    }
+
+
+def test_cli_imports_only_its_own_dependencies() -> None:
+    # modules imported by the interpreter itself, such as those of `.pth` files, are not imported by the CLI
+    interpreter_modules = _imported_modules()
+    packages = {module.split(".")[0] for module in _imported_modules("dma.cli.main") - interpreter_modules} - set(
+        sys.stdlib_module_names
+    )
+    assert packages <= CLI_PACKAGES
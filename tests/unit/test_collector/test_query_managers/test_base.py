@@ -0,0 +1,261 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import io
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+
+import anyio
+import duckdb
+import psycopg
+import pytest
+from rich.console import Console
+
+from dma.collector.query_managers.base import AsyncCollectionQueryManager, CollectionQueryManager
+from dma.lib.db.local import get_duckdb_connection
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+    import pyarrow as pa
+    from aiosql.queries import Queries
+    from duckdb import DuckDBPyConnection
+
+pytestmark = pytest.mark.anyio
+
+
+class _FakePool:
+    def __init__(self, local_db: DuckDBPyConnection) -> None:
+        self.checkouts = 0
+        self._local_db = local_db
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator[DuckDBPyConnection]:
+        with self._lock:
+            self.checkouts += 1
+        yield self._local_db.cursor()
+
+
+class _FakeQuery:
+    """An aiosql query the managers only read the SQL of."""
+
+    def __init__(self, sql: str) -> None:
+        self.sql = sql
+
+    def __call__(self, conn: Any, **binds: Any) -> Any:
+        raise AssertionError
+
+
+def _fake_queries(names: list[str]) -> SimpleNamespace:
+    queries = SimpleNamespace(**{
+        name: _FakeQuery(
+            f"select $PKEY as pkey, '{name}' as query_name, $DMA_SOURCE_ID as dma_source_id, $DMA_MANUAL_ID as dma_manual_id"
+        )
+        for name in names
+    })
+    queries.available_queries = names
+    return queries
+
+
+def _collection_query_manager(connection: Any = None, **kwargs: Any) -> CollectionQueryManager:
+    names = ["collection_a", "collection_b", "collection_c", "init_get_db_version"]
+    return CollectionQueryManager(
+        connection=connection,
+        queries=_fake_queries(names),  # type: ignore[arg-type]
+        execution_id="exec",
+        source_id="src",
+        db_version="16",
+        **kwargs,
+    )
+
+
+def test_concurrent_collection_matches_sequential() -> None:
+    with get_duckdb_connection() as local_db:
+        pool = _FakePool(local_db)
+        sequential = _collection_query_manager(local_db).execute_collection_queries()
+        concurrent = _collection_query_manager(
+            local_db,
+            connection_pool=pool,  # type: ignore[arg-type]
+            collection_concurrency=3,
+        ).execute_collection_queries()
+
+    assert set(concurrent) == set(sequential) == {"collection_a", "collection_b", "collection_c"}
+    assert pool.checkouts == 3
+    for script, rows in concurrent.items():
+        assert rows.to_pylist() == sequential[script].to_pylist()
+        assert rows.to_pylist() == [
+            {"pkey": "exec", "query_name": script, "dma_source_id": "src", "dma_manual_id": None}
+        ]
+
+
+def test_concurrency_without_pool_runs_sequentially() -> None:
+    with get_duckdb_connection() as local_db:
+        results = _collection_query_manager(local_db, collection_concurrency=4).execute_collection_queries()
+    assert {rows["query_name"][0].as_py() for rows in results.values()} == {
+        "collection_a",
+        "collection_b",
+        "collection_c",
+    }
+
+
+class _FakeAsyncCursor:
+    description = [("pkey",), ("query_name",)]
+
+    def __init__(self, rows: list[tuple[Any, ...]]) -> None:
+        self._rows = rows
+
+    async def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._rows
+
+
+class _FakeAsyncPool:
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[object]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await anyio.sleep(0.01)
+            yield object()
+        finally:
+            self.in_flight -= 1
+
+
+def _fake_async_queries(names: list[str], failing: dict[str, type[Exception]] | None = None) -> SimpleNamespace:
+    failing = failing or {}
+
+    def _cursor(name: str) -> Callable[..., Any]:
+        @asynccontextmanager
+        async def _fn(conn: Any, **binds: Any) -> AsyncIterator[_FakeAsyncCursor]:
+            if name in failing:
+                raise failing[name]
+            yield _FakeAsyncCursor([(binds["PKEY"], name)])
+
+        return _fn
+
+    return SimpleNamespace(**{f"{name}_cursor": _cursor(name) for name in names})
+
+
+async def test_async_collection_overlaps_queries() -> None:
+    pool = _FakeAsyncPool()
+    manager = AsyncCollectionQueryManager(
+        query_manager=_collection_query_manager(collection_concurrency=2),
+        queries=_fake_async_queries(["collection_a", "collection_b", "collection_c"]),  # type: ignore[arg-type]
+        connection_pool=pool,  # type: ignore[arg-type]
+    )
+    results = await manager.execute_collection_queries()
+    assert results["collection_b"].to_pylist() == [{"pkey": "exec", "query_name": "collection_b"}]
+    assert set(results) == {"collection_a", "collection_b", "collection_c"}
+    assert pool.max_in_flight == 2
+
+
+async def test_async_per_db_collection_skips_missing_objects() -> None:
+    class _PerDBQueryManager(CollectionQueryManager):
+        def get_per_db_collection_queries(self) -> set[str]:
+            return {"collection_a", "collection_b"}
+
+    manager = AsyncCollectionQueryManager(
+        query_manager=_PerDBQueryManager(
+            connection=None,
+            queries=cast("Queries", _fake_queries([])),
+            execution_id="exec",
+            source_id="src",
+            db_version="16",
+        ),
+        queries=_fake_async_queries(
+            ["collection_a", "collection_b"], failing={"collection_b": psycopg.errors.UndefinedTable}
+        ),  # type: ignore[arg-type]
+        connection_pool=_FakeAsyncPool(),  # type: ignore[arg-type]
+    )
+    results = await manager.execute_per_db_collection_queries()
+    assert set(results) == {"collection_a"}
+
+
+def test_streaming_collection_yields_bounded_batches() -> None:
+    query = _FakeQuery(
+        "select $PKEY as pkey, $DMA_SOURCE_ID as dma_source_id, $DMA_MANUAL_ID as dma_manual_id, i from range(25) t(i)"
+    )
+    queries = SimpleNamespace(collection_a=query, available_queries=["collection_a"])
+    batches: list[tuple[str, pa.RecordBatch]] = []
+    with get_duckdb_connection() as local_db:
+        manager = CollectionQueryManager(
+            connection=local_db,
+            queries=queries,  # type: ignore[arg-type]
+            execution_id="exec",
+            source_id="src",
+            db_version="16",
+        )
+        manager.enable_streaming(lambda script, batch: batches.append((script, batch)), batch_size=10)
+        results = manager.execute_collection_queries()
+
+    assert results == {"collection_a": []}
+    assert [len(batch) for _, batch in batches] == [10, 10, 5]
+    assert batches[0][1].to_pylist()[0] == {"pkey": "exec", "dma_source_id": "src", "dma_manual_id": None, "i": 0}
+
+
+class _TimeoutQueryManager(CollectionQueryManager):
+    @staticmethod
+    def get_timeout_reason(error: Exception) -> str | None:
+        return "statement_timeout" if isinstance(error, duckdb.InvalidInputException) else None
+
+
+def test_timed_out_queries_are_skipped_and_recorded() -> None:
+    queries = _fake_queries(["collection_a", "collection_b", "init_get_db_version"])
+    queries.collection_b.sql = "select error('canceling statement due to statement timeout')"
+    with get_duckdb_connection() as local_db:
+        manager = _TimeoutQueryManager(
+            connection=local_db,
+            queries=queries,  # type: ignore[arg-type]
+            execution_id="exec",
+            source_id="src",
+            db_version="16",
+        )
+        manager.set_timeouts(statement_timeout=5)
+        results = manager.execute_collection_queries()
+
+    assert set(results) == {"collection_a"}
+    assert [(status["query_name"], status["reason"]) for status in manager.query_status] == [
+        ("collection_b", "statement_timeout")
+    ]
+
+
+def test_queries_after_the_deadline_are_skipped() -> None:
+    with get_duckdb_connection() as local_db:
+        manager = _collection_query_manager(local_db)
+        manager.set_timeouts(deadline=time.monotonic() - 1)
+        results = manager.execute_collection_queries()
+
+    assert results == {}
+    assert {status["reason"] for status in manager.query_status} == {"deadline"}
+    assert len(manager.query_status) == 3
+
+
+def test_progress_is_printed_to_the_console_of_the_manager() -> None:
+    output = io.StringIO()
+    with get_duckdb_connection() as local_db:
+        manager = _collection_query_manager(local_db)
+        manager.console = Console(file=output, width=120)
+        manager.set_timeouts(deadline=time.monotonic() - 1)
+        manager.execute_collection_queries()
+
+    assert "COLLECTION QUERIES" in output.getvalue()
+    assert "Skipped `collection_a` (deadline)" in output.getvalue()
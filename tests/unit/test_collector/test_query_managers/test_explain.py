@@ -0,0 +1,26 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from dma.collector.query_managers.explain import parse_plan
+
+
+def test_parse_postgres_plan() -> None:
+    plan = [{"Plan": {"Node Type": "Hash Join", "Startup Cost": 12.5, "Total Cost": 1040.25, "Plan Rows": 320}}]
+    assert parse_plan(plan) == {"startup_cost": 12.5, "total_cost": 1040.25, "plan_rows": 320}
+
+
+def test_parse_mysql_plan() -> None:
+    plan = '{"query_block": {"select_id": 1, "cost_info": {"query_cost": "53.75"}}}'
+    assert parse_plan(plan) == {"startup_cost": None, "total_cost": 53.75, "plan_rows": None}
@@ -0,0 +1,89 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import pytest
+
+from dma.collector.query_managers.manifest import QueryManifest, QuerySpec
+from dma.collector.query_managers.mysql import MYSQL_MANIFEST
+from dma.collector.query_managers.postgres import POSTGRES_MANIFEST
+
+MANIFEST = QueryManifest(
+    [
+        QuerySpec("old_details", "details", max_version=13),
+        QuerySpec("new_details", "details", min_version=13, cost="heavy"),
+        QuerySpec("settings"),
+        QuerySpec("extensions", scope="per_db", cost="medium"),
+        QuerySpec("stats_from_17", min_version=17, cost="medium"),
+    ],
+    parse_version=float,
+)
+
+
+@pytest.mark.parametrize(
+    ("version", "expected"),
+    [
+        (9.6, ["old_details", "settings"]),
+        (12, ["old_details", "settings"]),
+        (13, ["new_details", "settings"]),
+        (16, ["new_details", "settings"]),
+        (17, ["new_details", "stats_from_17", "settings"]),
+    ],
+)
+def test_resolve_orders_expensive_queries_first(version: float, expected: list[str]) -> None:
+    assert [spec.name for spec in MANIFEST.resolve(version) if spec.scope == "global"] == expected
+
+
+def test_plan_by_scope_and_target() -> None:
+    assert MANIFEST.get_queries("12", scope="per_db") == ["extensions"]
+    assert MANIFEST.get_targets("12") == {"old_details": "details"}
+    assert MANIFEST.get_plan("16") is MANIFEST.get_plan("16")
+    assert MANIFEST.order_by_cost({"settings", "unknown", "extensions", "new_details"}) == [
+        "new_details",
+        "extensions",
+        "settings",
+        "unknown",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("db_version", "table_details", "bg_writer_stats"),
+    [
+        ("12.18", "collection_postgres_12_table_details", "collection_postgres_bg_writer_stats"),
+        ("13.14", "collection_postgres_13_table_details", "collection_postgres_bg_writer_stats"),
+        ("16.2", "collection_postgres_base_table_details", "collection_postgres_bg_writer_stats"),
+        ("17.0", "collection_postgres_base_table_details", "collection_postgres_bg_writer_stats_from_pg17"),
+    ],
+)
+def test_postgres_manifest(db_version: str, table_details: str, bg_writer_stats: str) -> None:
+    queries = POSTGRES_MANIFEST.get_queries(db_version)
+    assert table_details in queries
+    assert bg_writer_stats in queries
+    assert len(queries) == 17
+
+
+@pytest.mark.parametrize(
+    ("db_version", "prefix"),
+    [
+        ("5.7.44", "collection_mysql_5"),
+        ("8.0.36", "collection_mysql_base"),
+        ("10.6.0-MariaDB", "collection_mysql_5"),
+        ("5.5.5-10.11.6-MariaDB-log", "collection_mysql_5"),
+    ],
+)
+def test_mysql_manifest(db_version: str, prefix: str) -> None:
+    queries = MYSQL_MANIFEST.get_queries(db_version)
+    assert f"{prefix}_resource_groups" in queries
+    assert f"{prefix}_process_list" in queries
+    assert len(queries) == 10
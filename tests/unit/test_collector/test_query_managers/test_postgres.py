@@ -0,0 +1,106 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import psycopg
+from psycopg.pq import ExecStatus
+from psycopg.rows import tuple_row
+
+from dma.collector.query_managers.postgres import PostgresCollectionQueryManager
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+
+class _FakeCursor:
+    description = [("query_name",)]
+
+    def __init__(self, connection: _FakePipelineConnection) -> None:
+        self.pgresult: Any = None
+        self._connection = connection
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        pass
+
+    def execute(self, sql: str, binds: dict[str, Any]) -> None:
+        self.sql = sql
+        self._connection.queued.append(self)
+
+    def fetchall(self) -> list[tuple[Any, ...]]:
+        return [(self.sql,)]
+
+
+class _FakePipelineConnection:
+    """Runs the queued queries at each sync, aborting the ones queued after a failing query."""
+
+    def __init__(self, failing: dict[str, psycopg.Error]) -> None:
+        self.failing = failing
+        self.queued: list[_FakeCursor] = []
+        self.flights: list[list[str]] = []
+        self.row_factories: list[Any] = []
+
+    def cursor(self, **kwargs: Any) -> _FakeCursor:
+        self.row_factories.append(kwargs.get("row_factory"))
+        return _FakeCursor(self)
+
+    @contextmanager
+    def pipeline(self) -> Iterator[SimpleNamespace]:
+        yield SimpleNamespace(sync=self._sync)
+
+    def _sync(self) -> None:
+        self.flights.append([cursor.sql for cursor in self.queued])
+        error = None
+        for cursor in self.queued:
+            if error is None and cursor.sql in self.failing:
+                error = self.failing[cursor.sql]
+            elif error is None:
+                cursor.pgresult = SimpleNamespace(status=ExecStatus.TUPLES_OK)
+        self.queued.clear()
+        if error is not None:
+            raise error
+
+
+def test_pipelined_per_db_queries_skip_failures() -> None:
+    scripts = ["per_db_a", "per_db_b", "per_db_c", "per_db_d"]
+    queries = SimpleNamespace(**{script: SimpleNamespace(sql=script) for script in scripts})
+    connection = _FakePipelineConnection({"per_db_b": psycopg.errors.UndefinedTable("per_db_b")})
+    manager = PostgresCollectionQueryManager(
+        connection=connection,
+        execution_id="exec",
+        source_id="src",
+        queries=queries,  # type: ignore[arg-type]
+    )
+    manager.pipeline_per_db = True
+
+    with patch.object(psycopg.Pipeline, "is_supported", return_value=True):
+        results = manager._execute_per_db_scripts(set(scripts))
+
+    assert connection.flights == [scripts, ["per_db_c", "per_db_d"]]
+    assert set(connection.row_factories) == {tuple_row}
+    assert {script: rows["query_name"][0].as_py() for script, rows in results.items()} == {
+        "per_db_a": "per_db_a",
+        "per_db_c": "per_db_c",
+        "per_db_d": "per_db_d",
+    }
+    assert manager.finished_queries == set(scripts)
@@ -0,0 +1,114 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING
+
+import msgspec
+import pytest
+
+from dma.collector.query_managers import registry
+from dma.collector.query_managers.bundle import AiosqlShim, read_query_bundle, write_query_bundle
+from dma.collector.query_managers.registry import QueryRegistry, get_query_paths
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_queries_are_loaded_once_per_adapter() -> None:
+    registry = QueryRegistry(bundle_path=None)
+    assert registry.get_timings() == []
+
+    queries = registry.get("postgres", "psycopg")
+    assert registry.get("postgres", "psycopg") is queries
+    assert registry.get("postgres", "apsycopg") is not queries
+
+    timings = registry.get_timings()
+    assert [(timing.engine, timing.driver_adapter) for timing in timings] == [
+        ("postgres", "psycopg"),
+        ("postgres", "apsycopg"),
+    ]
+    assert timings[0].query_count == len(queries.available_queries)
+    assert timings[0].elapsed_seconds > 0
+
+
+def test_unknown_engine() -> None:
+    with pytest.raises(ApplicationError):
+        QueryRegistry().get("db2", "generic")
+
+
+def test_queries_are_loaded_from_the_bundle(tmp_path: Path) -> None:
+    bundle_path = tmp_path / "queries.bundle"
+    write_query_bundle(bundle_path, get_query_paths())
+
+    bundled = QueryRegistry(bundle_path=bundle_path).get("postgres", "psycopg")
+    parsed = QueryRegistry(bundle_path=None).get("postgres", "psycopg")
+
+    assert bundled.available_queries == parsed.available_queries
+    for name in parsed.available_queries:
+        assert getattr(bundled, name).sql == getattr(parsed, name).sql
+        assert getattr(bundled, name).__signature__ == getattr(parsed, name).__signature__
+
+
+def test_stale_bundle_falls_back_to_parsing(tmp_path: Path) -> None:
+    bundle_path = tmp_path / "queries.bundle"
+    bundle = write_query_bundle(bundle_path, get_query_paths())
+    bundle.engines["postgres"].content_hash = "stale"
+    bundle_path.write_bytes(msgspec.msgpack.encode(bundle))
+
+    registry = QueryRegistry(bundle_path=bundle_path)
+    registry.get("postgres", "psycopg")
+    registry.get("mysql", "pymysql")
+
+    assert [timing.source for timing in registry.get_timings()] == ["sql", "bundle"]
+
+
+def test_unreadable_bundle(tmp_path: Path) -> None:
+    assert read_query_bundle(tmp_path / "missing.bundle") is None
+    (tmp_path / "empty.bundle").touch()
+    assert read_query_bundle(tmp_path / "empty.bundle") is None
+    (tmp_path / "corrupt.bundle").write_bytes(b"not a bundle")
+    assert read_query_bundle(tmp_path / "corrupt.bundle") is None
+
+
+def test_bundle_is_ignored_with_an_unsupported_aiosql(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    bundle_path = tmp_path / "queries.bundle"
+    write_query_bundle(bundle_path, get_query_paths())
+    monkeypatch.setattr(AiosqlShim, "SUPPORTED_VERSIONS", ("0.",))
+
+    registry = QueryRegistry(bundle_path=bundle_path)
+    registry.get("postgres", "psycopg")
+
+    assert [timing.source for timing in registry.get_timings()] == ["sql"]
+    with pytest.raises(ApplicationError):
+        write_query_bundle(bundle_path, get_query_paths())
+
+
+def test_same_size_edit_makes_the_bundle_stale(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sql_path = tmp_path / "postgres"
+    shutil.copytree(get_query_paths()["postgres"], sql_path)
+    monkeypatch.setattr(registry, "get_query_paths", lambda: {**get_query_paths(), "postgres": sql_path})
+    bundle_path = tmp_path / "queries.bundle"
+    write_query_bundle(bundle_path, registry.get_query_paths())
+    init_file = sql_path / "init.sql"
+    size = init_file.stat().st_size
+    init_file.write_text(init_file.read_text(encoding="utf-8").replace("select", "SELECT", 1), encoding="utf-8")
+    assert init_file.stat().st_size == size
+
+    edited = QueryRegistry(bundle_path=bundle_path)
+    edited.get("postgres", "psycopg")
+
+    assert [timing.source for timing in edited.get_timings()] == ["sql"]
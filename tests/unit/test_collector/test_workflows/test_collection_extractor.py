@@ -0,0 +1,349 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import io
+import ipaddress
+import logging
+import threading
+from functools import partial
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
+
+import duckdb
+import pyarrow as pa
+import pytest
+from duckdb import DuckDBPyConnection
+from rich import get_console
+from rich.console import Console
+
+from dma.collector.query_managers.base import CanonicalQueryManager, CollectionQueryManager
+from dma.collector.query_managers.registry import get_queries
+from dma.collector.workflows.collection_extractor._postgres import (
+    calculate_counter_rates_postgres,
+    clear_counter_samples_postgres,
+)
+from dma.collector.workflows.collection_extractor.base import AsyncCollectionExtractor, CollectionExtractor
+from dma.lib.db.base import SourceInfo
+from dma.lib.db.local import get_duckdb_connection
+from dma.lib.db.query_manager import rows_to_record_batch
+
+if TYPE_CHECKING:
+    from aiosql.queries import Queries
+    from typing_extensions import Self
+
+pytestmark = pytest.mark.anyio
+
+_CHECKPOINT_DDL = """
+    create table collection_checkpoint(
+        pkey varchar, database_name varchar, query_name varchar, completed_at timestamptz default current_timestamp
+    )
+"""
+
+
+def _dummy_collection_extractor(local_db: DuckDBPyConnection, **kwargs: Any) -> CollectionExtractor:
+    extractor = CollectionExtractor(
+        local_db=local_db,
+        src_info=SourceInfo("POSTGRES", "test_user", "test_passwd", "dummy_host", 0),
+        database="dummy",
+        canonical_query_manager=CanonicalQueryManager(connection=local_db),
+        console=get_console(),
+        collection_identifier=None,
+        **kwargs,
+    )
+    extractor.db_version = "16"
+    return extractor
+
+
+def test_collect_db_specific_data_concurrently() -> None:
+    main_thread = threading.get_ident()
+
+    def _collect_database(
+        self: CollectionExtractor, database: str, execution_id: str, completed_queries: set[str] | None = None
+    ) -> tuple[dict[str, Any], set[str]]:
+        assert threading.get_ident() != main_thread
+        return {
+            "collection_postgres_extensions": [
+                {"pkey": execution_id, "extension_name": "plpgsql", "database_name": database}
+            ]
+        }, {"collection_postgres_extensions"}
+
+    with (
+        patch(
+            "dma.collector.workflows.collection_extractor.base.CollectionExtractor.collect_database",
+            _collect_database,
+        ),
+        get_duckdb_connection() as local_db,
+    ):
+        local_db.execute(
+            "create table extended_collection_postgres_all_databases as select * from (values ('db1'), ('db2'), ('db3')) t(database_name)"
+        )
+        local_db.execute(
+            "create table collection_postgres_extensions(pkey varchar, extension_name varchar, database_name varchar)"
+        )
+        local_db.execute(_CHECKPOINT_DDL)
+        extractor = _dummy_collection_extractor(local_db, max_concurrent_databases=2)
+        extractor.execution_id = "exec"
+        extractor.collect_db_specific_data("exec")
+        rows = local_db.sql(
+            "select pkey, database_name from collection_postgres_extensions order by database_name"
+        ).fetchall()
+        assert rows == [("exec", "db1"), ("exec", "db2"), ("exec", "db3")]
+
+
+def test_import_uses_canonical_column_types() -> None:
+    with get_duckdb_connection() as local_db:
+        local_db.execute("create table collection_postgres_sizes(pkey varchar, total_bytes bigint, ratio double)")
+        extractor = _dummy_collection_extractor(local_db)
+        extractor.schemas.load()
+        batch = rows_to_record_batch(
+            [("pkey",), ("total_bytes",), ("ratio",)],
+            [("exec", 10, 1), ("exec", None, 2)],
+            extractor.schemas.get("collection_postgres_sizes"),
+        )
+        assert batch.schema == pa.schema([("pkey", pa.string()), ("total_bytes", pa.int64()), ("ratio", pa.float64())])
+
+        extractor.import_to_table({"collection_postgres_sizes": [{"pkey": "exec", "total_bytes": 1, "ratio": 0.5}]})
+        extractor.append_to_table("collection_postgres_sizes", batch)
+        assert local_db.sql("select sum(total_bytes), sum(ratio) from collection_postgres_sizes").fetchone() == (
+            11,
+            3.5,
+        )
+
+
+def test_record_batch_fallbacks_are_logged(caplog: pytest.LogCaptureFixture) -> None:
+    caplog.set_level(logging.DEBUG, logger="dma.lib.db.query_manager")
+    batch = rows_to_record_batch(
+        [("total_bytes",), ("address",)],
+        [("10 kB", ipaddress.ip_address("10.0.0.1")), (None, None)],
+        pa.schema([("total_bytes", pa.int64())]),
+    )
+
+    assert batch.schema == pa.schema([("total_bytes", pa.string()), ("address", pa.string())])
+    assert [(record.levelname, record.getMessage().split(":")[0]) for record in caplog.records] == [
+        ("WARNING", "Column total_bytes could not be converted to int64, inferring its type instead"),
+        ("DEBUG", "Column address holds IPv4Address values with no Arrow type, converting them to strings"),
+    ]
+
+
+def test_resume_skips_checkpointed_databases() -> None:
+    collected: dict[str, set[str] | None] = {}
+
+    def _collect_database(
+        self: CollectionExtractor, database: str, execution_id: str, completed_queries: set[str] | None = None
+    ) -> tuple[dict[str, Any], set[str]]:
+        collected[database] = completed_queries
+        return {"collection_postgres_extensions": []}, {"collection_postgres_extensions"}
+
+    with (
+        patch(
+            "dma.collector.workflows.collection_extractor.base.CollectionExtractor.collect_database",
+            _collect_database,
+        ),
+        get_duckdb_connection() as local_db,
+    ):
+        local_db.execute(
+            "create table extended_collection_postgres_all_databases as select * from (values ('db1'), ('db2'), ('db3')) t(database_name)"
+        )
+        local_db.execute(_CHECKPOINT_DDL)
+        local_db.executemany(
+            "insert into collection_checkpoint(pkey, database_name, query_name) values ('exec', ?, ?)",
+            [
+                ["db1", "collection_postgres_extensions"],
+                ["db1", "collection_postgres_settings"],
+                ["db2", "collection_postgres_settings"],
+            ],
+        )
+        extractor = _dummy_collection_extractor(local_db, max_concurrent_databases=2, resume=True)
+        extractor.execution_id = "exec"
+        extractor.per_db_queries = {"collection_postgres_extensions", "collection_postgres_settings"}
+        assert extractor.checkpoints.get_latest_execution_id() == "exec"
+
+        extractor.collect_db_specific_data("exec")
+
+        assert collected == {"db2": {"collection_postgres_settings"}, "db3": set()}
+        assert extractor.get_pending_databases() == {"db3"}
+
+
+def test_failed_checkpoint_rolls_back_loaded_rows() -> None:
+    with get_duckdb_connection() as local_db:
+        local_db.execute(_CHECKPOINT_DDL)
+        local_db.execute("create table collection_postgres_extensions(pkey varchar, extension_name varchar)")
+        extractor = _dummy_collection_extractor(local_db)
+        extractor.execution_id = "exec"
+
+        def _load() -> None:
+            extractor.import_to_table({"collection_postgres_extensions": [{"pkey": "exec", "extension_name": "x"}]})
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            extractor.checkpoints.complete("exec", "db1", "collection_postgres_extensions", _load)
+
+        assert local_db.sql("select count(*) from collection_postgres_extensions").fetchone() == (0,)
+        assert extractor.checkpoints.get_completed("exec", "db1") == set()
+
+
+def test_interrupted_collection_keeps_completed_queries() -> None:
+    queries = SimpleNamespace(
+        collection_a=SimpleNamespace(
+            sql="select $PKEY as pkey, $DMA_SOURCE_ID as dma_source_id, $DMA_MANUAL_ID as dma_manual_id, 1 as i"
+        ),
+        collection_b=SimpleNamespace(
+            sql="select $PKEY as pkey, $DMA_SOURCE_ID as dma_source_id, $DMA_MANUAL_ID as dma_manual_id, i from range(25) t(i)"
+        ),
+        collection_c=SimpleNamespace(
+            sql="select $PKEY as pkey, $DMA_SOURCE_ID as dma_source_id, $DMA_MANUAL_ID as dma_manual_id, error('connection lost') as i"
+        ),
+        available_queries=["collection_a", "collection_b", "collection_c"],
+    )
+    with get_duckdb_connection() as local_db:
+        local_db.execute(_CHECKPOINT_DDL)
+        local_db.execute("""
+            create table collection_a(pkey varchar, dma_source_id varchar, dma_manual_id varchar, i bigint);
+            create table collection_b as from collection_a;
+            create table collection_c as from collection_a;
+        """)
+        extractor = _dummy_collection_extractor(local_db, batch_size=10)
+        extractor.execution_id = "exec"
+        manager = CollectionQueryManager(
+            connection=local_db.cursor(),
+            queries=cast("Queries", queries),
+            execution_id="exec",
+            source_id="src",
+            db_version="16",
+        )
+        extractor.prepare_collection_manager(manager)
+
+        with pytest.raises(duckdb.InvalidInputException), extractor._checkpoint_queries(manager, "dummy"):
+            manager.execute_collection_queries()
+
+        assert extractor.checkpoints.get_completed("exec", "dummy") == {"collection_a", "collection_b"}
+        assert local_db.sql("select count(*) from collection_b").fetchone() == (25,)
+
+        extractor.checkpoints.load("collection_c", partial(extractor.import_to_table, {"collection_c": [{"i": 1}]}))
+        extractor.checkpoints.discard()
+        assert local_db.sql("select count(*) from collection_c").fetchone() == (0,)
+
+
+def test_counter_rates_between_samples() -> None:
+    with get_duckdb_connection(working_path=None) as local_db:
+        local_db.execute("""
+            create table collection_postgres_counter_rates(
+                pkey varchar, dma_source_id varchar, dma_manual_id varchar, metric_category varchar,
+                object_name varchar, metric_name varchar, sample_id integer, sampled_at timestamptz,
+                elapsed_seconds double, metric_delta double, rate_per_second double
+            )
+        """)
+        local_db.execute("""
+            create table collection_postgres_replication_stats_samples as
+            select * from (values
+                (1, '2024-01-01 00:00:00+00'::timestamptz, 'p', 's', 'm', '10', 'replica', '0/1000', '0/800'),
+                (2, '2024-01-01 00:00:10+00'::timestamptz, 'p', 's', 'm', '10', 'replica', '1/1000', '0/A00'),
+                (3, '2024-01-01 00:00:20+00'::timestamptz, 'p', 's', 'm', '10', 'replica', '0/2000', '0/C00')
+            ) t(sample_id, sampled_at, pkey, dma_source_id, dma_manual_id, pid, application_name, sent_lsn, replay_lsn)
+        """)
+
+        calculate_counter_rates_postgres(local_db)
+
+        rates = local_db.sql("""
+            select metric_name, sample_id, elapsed_seconds, rate_per_second
+            from collection_postgres_counter_rates
+            where object_name = 'replica'
+            order by metric_name, sample_id
+        """).fetchall()
+    assert rates == [
+        ("wal_replayed_bytes", 2, 10.0, 51.2),
+        ("wal_replayed_bytes", 3, 10.0, 51.2),
+        ("wal_sent_bytes", 2, 10.0, 429496729.6),
+        ("wal_sent_bytes", 3, 10.0, None),
+    ]
+
+
+def test_wal_rate_from_sampled_wal_position() -> None:
+    with get_duckdb_connection(working_path=None) as local_db:
+        CanonicalQueryManager(connection=local_db).execute_ddl_scripts()
+        local_db.execute("insert into collection_postgres_counter_rates(pkey) values ('previous run')")
+        local_db.execute("""
+            insert into collection_postgres_wal_position_samples values
+                (1, '2024-01-01 00:00:00+00'::timestamptz, 'p', 's', 'm', false, '0/1000'),
+                (2, '2024-01-01 00:00:10+00'::timestamptz, 'p', 's', 'm', false, '0/1A00')
+        """)
+
+        calculate_counter_rates_postgres(local_db)
+        rates = local_db.sql("""
+            select object_name, metric_name, sample_id, rate_per_second
+            from collection_postgres_counter_rates
+            where pkey = 'p'
+        """).fetchall()
+        clear_counter_samples_postgres(local_db)
+        remaining = local_db.sql("""
+            select count(*) from collection_postgres_counter_rates
+            union all
+            select count(*) from collection_postgres_wal_position_samples
+        """).fetchall()
+    assert rates == [("instance", "wal_bytes", 2, 256.0)]
+    assert remaining == [(0,), (0,)]
+
+
+def test_query_load_timings_are_printed() -> None:
+    output = io.StringIO()
+    get_queries("canonical", "duckdb")
+    with get_duckdb_connection(working_path=None) as local_db:
+        extractor = _dummy_collection_extractor(local_db)
+        extractor.console = Console(file=output, width=200)
+        extractor._print_query_load_timings()
+    assert "`canonical` queries for `duckdb`" in output.getvalue()
+
+
+class _FakeAsyncPool:
+    closed = False
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        self.closed = True
+
+    def get_stats(self) -> dict[str, int]:
+        return {"connections_num": 2, "requests_num": 5}
+
+
+def test_async_collection_reports_connections_when_it_fails() -> None:
+    output = io.StringIO()
+    connection_pool = _FakeAsyncPool()
+    with get_duckdb_connection(working_path=None) as local_db:
+        extractor = AsyncCollectionExtractor(
+            local_db=local_db,
+            src_info=SourceInfo("POSTGRES", "test_user", "test_passwd", "dummy_host", 0),
+            database="dummy",
+            canonical_query_manager=CanonicalQueryManager(connection=local_db),
+            console=Console(file=output, width=200),
+            collection_identifier=None,
+        )
+        with (
+            patch(
+                "dma.collector.workflows.collection_extractor.base.get_async_connection_pool",
+                return_value=connection_pool,
+            ),
+            patch(
+                "dma.collector.workflows.collection_extractor.base.provide_async_collection_query_manager",
+                side_effect=RuntimeError("source unavailable"),
+            ),
+            pytest.raises(RuntimeError, match="source unavailable"),
+        ):
+            extractor.collect("exec")
+
+    assert connection_pool.closed
+    assert "Opened 2 connections to 1 databases for 5 requests." in output.getvalue()
@@ -0,0 +1,143 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from rich import get_console
+
+from dma.collector.workflows.fleet import FleetCollection, FleetInstance, FleetResult, load_inventory
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _fake_collect_instance(
+    instance: FleetInstance,
+    export_path: Path,
+    working_path: Path | None = None,
+    readiness_check: bool = True,
+    options: dict[str, Any] | None = None,
+) -> FleetResult:
+    started = time.time()
+    time.sleep(0.5)
+    (export_path / f"{instance.name}.span").write_text(f"{instance.host},{started},{time.time()}")
+    if instance.name == "broken":
+        msg = "collection failed"
+        raise RuntimeError(msg)
+    return FleetResult(name=instance.name, status="SUCCESS", elapsed_seconds=0.2, database_path=export_path)
+
+
+def test_load_csv_inventory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("DMA_TEST_PASSWORD", "secret")
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        "# name is optional\n"
+        "name,db_type,hostname,port,database,username,password,password_env\n"
+        "primary,postgres,db1.example.com,5432,postgres,dma,passwd,\n"
+        ",mysql, DB2.example.com ,3306,mysql,dma,,DMA_TEST_PASSWORD\n"
+    )
+
+    instances = load_inventory(inventory)
+
+    assert [(i.name, i.host, i.src_info.db_type, i.src_info.password) for i in instances] == [
+        ("primary", "db1.example.com", "POSTGRES", "passwd"),
+        ("DB2.example.com_3306_mysql", "db2.example.com", "MYSQL", "secret"),
+    ]
+
+
+def test_load_toml_inventory(tmp_path: Path) -> None:
+    inventory = tmp_path / "inventory.toml"
+    inventory.write_text(
+        "[defaults]\n"
+        'db_type = "postgres"\nusername = "dma"\npassword = "passwd"\nport = 5432\n'
+        "[[instances]]\n"
+        'hostname = "db1"\ndatabase = "postgres"\n'
+        "[[instances]]\n"
+        'hostname = "db1"\ndatabase = "postgres"\nport = 5433\ncollection_identifier = "replica"\n'
+    )
+
+    instances = load_inventory(inventory)
+
+    assert [(i.name, i.src_info.port, i.collection_identifier) for i in instances] == [
+        ("db1_5432_postgres", 5432, None),
+        ("db1_5433_postgres", 5433, "replica"),
+    ]
+
+
+def test_inventory_names_must_be_unique(tmp_path: Path) -> None:
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        "name,db_type,hostname,port,database,username,password\n"
+        "same,postgres,db1,5432,postgres,dma,passwd\n"
+        "same,postgres,db2,5432,postgres,dma,passwd\n"
+    )
+
+    with pytest.raises(ApplicationError, match="same"):
+        load_inventory(inventory)
+
+
+@pytest.mark.parametrize("name", [".", "..", "..."])
+def test_inventory_names_cannot_be_only_dots(tmp_path: Path, name: str) -> None:
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        f"name,db_type,hostname,port,database,username,password\n{name},postgres,db1,5432,postgres,dma,passwd\n"
+    )
+
+    with pytest.raises(ApplicationError, match="cannot be used as a directory"):
+        load_inventory(inventory)
+
+
+def test_inventory_names_drop_leading_dots(tmp_path: Path) -> None:
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        "name,db_type,hostname,port,database,username,password\n"
+        "../../etc,postgres,db1,5432,postgres,dma,passwd\n"
+        ".hidden,postgres,db2,5432,postgres,dma,passwd\n"
+    )
+
+    assert [i.name for i in load_inventory(inventory)] == ["_.._etc", "hidden"]
+
+
+def test_fleet_limits_collections_per_host(tmp_path: Path) -> None:
+    inventory = tmp_path / "inventory.csv"
+    inventory.write_text(
+        "name,db_type,hostname,port,database,username,password\n"
+        "a1,postgres,host-a,5432,postgres,dma,passwd\n"
+        "a2,postgres,host-a,5433,postgres,dma,passwd\n"
+        "b1,postgres,host-b,5432,postgres,dma,passwd\n"
+        "broken,postgres,host-c,5432,postgres,dma,passwd\n"
+    )
+    export_path = tmp_path / "fleet"
+    workflow = FleetCollection(
+        instances=load_inventory(inventory), export_path=export_path, console=get_console(), max_workers=4
+    )
+    workflow.worker = _fake_collect_instance
+
+    results = workflow.execute()
+
+    assert {result.name: result.status for result in results} == {
+        "a1": "SUCCESS",
+        "a2": "SUCCESS",
+        "b1": "SUCCESS",
+        "broken": "FAILED",
+    }
+    spans = {
+        path.stem: [float(value) for value in path.read_text().split(",")[1:]] for path in export_path.glob("*.span")
+    }
+    assert spans["a2"][0] >= spans["a1"][1] or spans["a1"][0] >= spans["a2"][1]
+    assert spans["b1"][0] < spans["a1"][1]
@@ -0,0 +1,112 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+import duckdb
+import pytest
+from rich import get_console
+
+from dma.collector.workflows.fleet import FleetMerge, find_assessment_databases
+from dma.lib.db.local import get_duckdb_connection
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _write_assessment(path: Path, source_id: str, *, with_extensions: bool = True) -> None:
+    path.mkdir(parents=True)
+    with duckdb.connect(str(path / "assessment.db")) as local_db:
+        local_db.execute("create table collection_postgres_settings(pkey varchar, dma_source_id varchar, value int)")
+        local_db.execute(
+            "insert into collection_postgres_settings values ('exec', ?, 1), ('exec', ?, 2)", [source_id] * 2
+        )
+        if with_extensions:
+            local_db.execute("create table collection_postgres_extensions(pkey varchar, extension_name varchar)")
+            local_db.execute("insert into collection_postgres_extensions values ('exec', 'pg_trgm')")
+        local_db.execute("create table readiness_check_summary(severity enum('PASS', 'ERROR'), info varchar)")
+        local_db.execute("insert into readiness_check_summary values ('PASS', ?)", [source_id])
+        local_db.execute("create table unrelated(value int)")
+
+
+def test_merge_assessments(tmp_path: Path) -> None:
+    _write_assessment(tmp_path / "fleet" / "db1", "source1")
+    _write_assessment(tmp_path / "fleet" / "db2", "source2", with_extensions=False)
+    databases = find_assessment_databases([tmp_path / "fleet"])
+    assert sorted(databases) == ["db1", "db2"]
+
+    with get_duckdb_connection(database=str(tmp_path / "fleet.db")) as local_db:
+        FleetMerge(local_db=local_db, console=get_console()).execute(databases)
+        # merging a collection again replaces its rows
+        FleetMerge(local_db=local_db, console=get_console()).execute({"db1": databases["db1"]})
+
+        assert local_db.sql(
+            "select collection_key, dma_source_id, sum(value) from collection_postgres_settings group by all order by 1"
+        ).fetchall() == [("db1", "source1", 3), ("db2", "source2", 3)]
+        assert local_db.sql("select collection_key from collection_postgres_extensions").fetchall() == [("db1",)]
+        assert local_db.sql(
+            "select collection_key, severity, info from readiness_check_summary order by 1"
+        ).fetchall() == [
+            ("db1", "PASS", "source1"),
+            ("db2", "PASS", "source2"),
+        ]
+        assert local_db.sql("select count(*) from fleet_collection").fetchone() == (2,)
+        assert local_db.sql("select count(*) from duckdb_tables() where table_name = 'unrelated'").fetchone() == (0,)
+
+
+def _write_settings(path: Path, value_type: str, value: object) -> None:
+    path.mkdir(parents=True)
+    with duckdb.connect(str(path / "assessment.db")) as local_db:
+        local_db.execute(f"create table collection_postgres_settings(pkey varchar, value {value_type})")
+        local_db.execute("insert into collection_postgres_settings values ('exec', ?)", [value])
+
+
+def test_merge_widens_column_types(tmp_path: Path) -> None:
+    _write_settings(tmp_path / "fleet" / "db1", "integer", 1)
+    _write_settings(tmp_path / "fleet" / "db2", "smallint", 2)
+    _write_settings(tmp_path / "later" / "db3", "bigint", 5000000000)
+
+    with get_duckdb_connection(database=str(tmp_path / "fleet.db")) as local_db:
+        FleetMerge(local_db=local_db, console=get_console()).execute(find_assessment_databases([tmp_path / "fleet"]))
+        assert local_db.sql("select typeof(value) from collection_postgres_settings limit 1").fetchone() == ("INTEGER",)
+        FleetMerge(local_db=local_db, console=get_console()).execute(find_assessment_databases([tmp_path / "later"]))
+
+        assert local_db.sql(
+            "select collection_key, value, typeof(value) from collection_postgres_settings order by 1"
+        ).fetchall() == [("db1", 1, "BIGINT"), ("db2", 2, "BIGINT"), ("db3", 5000000000, "BIGINT")]
+
+
+def test_merge_rejects_incompatible_column_types(tmp_path: Path) -> None:
+    _write_settings(tmp_path / "fleet" / "db1", "integer", 1)
+    _write_settings(tmp_path / "fleet" / "db2", "date", date(2024, 1, 1))
+
+    with (
+        get_duckdb_connection(database=str(tmp_path / "fleet.db")) as local_db,
+        pytest.raises(ApplicationError, match="'value' of 'collection_postgres_settings' has incompatible types"),
+    ):
+        FleetMerge(local_db=local_db, console=get_console()).execute(find_assessment_databases([tmp_path / "fleet"]))
+
+
+def test_merge_paths_with_quotes(tmp_path: Path) -> None:
+    _write_assessment(tmp_path / "o'brien" / "db1", "source1")
+
+    with get_duckdb_connection(database=str(tmp_path / "fleet.db")) as local_db:
+        FleetMerge(local_db=local_db, console=get_console()).execute(find_assessment_databases([tmp_path / "o'brien"]))
+
+        assert local_db.sql("select collection_key, source_path from fleet_collection").fetchall() == [
+            ("db1", str(tmp_path / "o'brien" / "db1" / "assessment.db"))
+        ]
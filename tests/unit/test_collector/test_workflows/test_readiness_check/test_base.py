@@ -0,0 +1,47 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from dma.collector.workflows.readiness_check.base import RuleResultBuffer
+from dma.lib.db.local import get_duckdb_connection
+
+
+def test_rule_results_are_written_in_one_flush() -> None:
+    with get_duckdb_connection() as local_db:
+        local_db.execute("""
+            create table readiness_check_summary(
+                migration_target ENUM ('CLOUDSQL', 'ALLOYDB'),
+                severity ENUM ('INFO', 'PASS', 'WARNING', 'ACTION REQUIRED', 'ERROR'),
+                rule_code varchar,
+                info varchar
+            )
+        """)
+        results = RuleResultBuffer(local_db)
+
+        def _check(worker: int) -> None:
+            for i in range(50):
+                results.append("CLOUDSQL" if worker % 2 else "ALLOYDB", f"RULE_{worker}_{i}", "PASS", "passed")
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_check, range(8)))
+        assert len(results) == 400
+        assert local_db.execute("select count(*) from readiness_check_summary").fetchone() == (0,)
+
+        assert results.flush() == 400
+        assert results.flush() == 0
+        assert local_db.execute(
+            "select migration_target, count(*) from readiness_check_summary group by all order by all"
+        ).fetchall() == [("CLOUDSQL", 200), ("ALLOYDB", 200)]
@@ -73,6 +73,7 @@ def test_collation(collations, expected_severity):
         executor = _dummy_postgres_readiness_executor(local_db)
         _create_readiness_check_summary_table(local_db)
         executor._check_collation()
+        executor.flush_results()
         rows = local_db.sql(
             "select severity, migration_target, info from readiness_check_summary WHERE rule_code = 'COLLATION'",
         ).fetchall()
@@ -99,6 +100,7 @@ def test_rds_logical_replication(rds_logical_replication, expected_severity):
         executor = _dummy_postgres_readiness_executor(local_db)
         _create_readiness_check_summary_table(local_db)
         executor._check_rds_logical_replication()
+        executor.flush_results()
         rows = local_db.sql(
             "select severity, migration_target, info from readiness_check_summary WHERE rule_code = 'RDS_LOGICAL_REPLICATION'",
         ).fetchall()
@@ -124,6 +126,7 @@ def test_unsupported_extensions(installed_extensions, expected_severity):
         executor = _dummy_postgres_readiness_executor(local_db)
         _create_readiness_check_summary_table(local_db)
         executor._check_extensions()
+        executor.flush_results()
         rows = local_db.sql(
             "select severity, migration_target, info from readiness_check_summary WHERE rule_code = 'UNSUPPORTED_EXTENSIONS_NOT_MIGRATED'",
         ).fetchall()
@@ -149,6 +152,7 @@ def test_unmigrated_extensions(installed_extensions, expected_severity):
         executor = _dummy_postgres_readiness_executor(local_db)
         _create_readiness_check_summary_table(local_db)
         executor._check_extensions()
+        executor.flush_results()
         rows = local_db.sql(
             "select severity, migration_target, info from readiness_check_summary WHERE rule_code = 'EXTENSIONS_NOT_MIGRATED'",
         ).fetchall()
@@ -171,8 +175,97 @@ def test_rds_db_version(database_version, expected_severity):
         executor = _dummy_postgres_readiness_executor(local_db, database_version)
         _create_readiness_check_summary_table(local_db)
         executor._check_version()
+        executor.flush_results()
         rows = local_db.sql(
             "select severity, migration_target, info from readiness_check_summary WHERE rule_code = 'DATABASE_VERSION'",
         ).fetchall()
         for row in rows:
             assert row[0] == expected_severity
+
+
+# One database per outcome of the per database rules.
+per_database_collection = """
+    create table extended_collection_postgres_all_databases(database_name varchar);
+    insert into extended_collection_postgres_all_databases values ('app'), ('billing'), ('no_usage'), ('plain'), ('replicated');
+    create table collection_postgres_extensions(extension_name varchar, extension_owner varchar, database_name varchar);
+    insert into collection_postgres_extensions values
+        ('pglogical', 'postgres', 'app'), ('pglogical', 'postgres', 'billing'), ('pglogical', 'postgres', 'no_usage'),
+        ('pglogical', 'postgres', 'replicated'), ('plpgsql', 'postgres', 'plain');
+    create table collection_postgres_pglogical_schema_usage_privilege(database_name varchar, has_schema_usage_privilege boolean);
+    insert into collection_postgres_pglogical_schema_usage_privilege values
+        ('app', true), ('billing', true), ('no_usage', false), ('replicated', true);
+    create table collection_postgres_pglogical_privileges(
+        database_name varchar,
+        has_tables_select_privilege boolean,
+        has_local_node_select_privilege boolean,
+        has_node_select_privilege boolean,
+        has_node_interface_select_privilege boolean
+    );
+    insert into collection_postgres_pglogical_privileges values
+        ('app', true, true, true, true), ('billing', true, false, true, false), ('replicated', true, true, true, true);
+    create table collection_postgres_pglogical_provider_node(database_name varchar);
+    insert into collection_postgres_pglogical_provider_node values ('replicated');
+    create table collection_postgres_user_schemas_without_privilege(database_name varchar, namespace_name varchar);
+    create table collection_postgres_user_tables_without_privilege(database_name varchar, schema_name varchar, table_name varchar);
+    insert into collection_postgres_user_tables_without_privilege values ('billing', 'public', 'invoices');
+    create table collection_postgres_user_views_without_privilege(database_name varchar, schema_name varchar, view_name varchar);
+    create table collection_postgres_user_sequences_without_privilege(database_name varchar, namespace_name varchar, rel_name varchar);
+    create table collection_postgres_tables_with_no_primary_key(database_name varchar, nspname varchar, relname varchar);
+    insert into collection_postgres_tables_with_no_primary_key values ('app', 'public', 'events'), ('plain', 'public', 'logs');
+    create table collection_postgres_tables_with_primary_key_replica_identity(database_name varchar, nspname varchar, relname varchar);
+    insert into collection_postgres_tables_with_primary_key_replica_identity values ('replicated', 'public', 'orders');
+"""
+
+
+def test_per_database_rules():
+    with get_duckdb_connection() as local_db:
+        executor = _dummy_postgres_readiness_executor(local_db)
+        _create_readiness_check_summary_table(local_db)
+        local_db.execute(per_database_collection)
+        db_check_results = executor._check_databases()
+        for config in executor.rule_config:
+            executor._save_results(config.db_variant, db_check_results)
+        executor.flush_results()
+        rows = local_db.sql(
+            "select rule_code, severity, info from readiness_check_summary where migration_target = 'ALLOYDB' order by rule_code, severity",
+        ).fetchall()
+
+    assert rows == [
+        ("PGLOGICAL_INSTALLED", "PASS", "`pglogical` is installed on the databases: app,billing,no_usage,replicated."),
+        (
+            "PGLOGICAL_INSTALLED",
+            "ACTION REQUIRED",
+            "`pglogical` extension is not installed on the databases: plain.",
+        ),
+        ("PGLOGICAL_NODE_ALREADY_EXISTS", "PASS", "No existing pglogical provider node on the database: app"),
+        (
+            "PGLOGICAL_NODE_ALREADY_EXISTS",
+            "ACTION REQUIRED",
+            "pglogical provider node already exists on databases: replicated",
+        ),
+        (
+            "PRIVILEGES",
+            "PASS",
+            "User has all privileges required for migration for the database app;\nUser has all privileges required for migration for the database replicated",
+        ),
+        (
+            "PRIVILEGES",
+            "ACTION REQUIRED",
+            (
+                "user doesn't have SELECT privilege on table pglogical.local_node\n"
+                "user doesn't have SELECT privilege on table pglogical.node_interface\n"
+                "user doesn't have SELECT privilege on table public.invoices in database billing;\n\n"
+                "user doesn't have USAGE privilege on schema pglogical in database no_usage"
+            ),
+        ),
+        (
+            "TABLES_WITH_NO_PK",
+            "WARNING",
+            "Some tables have limited support. Tables without primary keys were identified and only INSERT statements will be replicated for these tables: In database app, public.events don't have primary keys;In database plain, public.logs don't have primary keys",
+        ),
+        (
+            "UNSUPPORTED_TABLES_WITH_REPLICA_IDENTITY",
+            "ACTION REQUIRED",
+            "Source has table(s) with both primary key and replica identity FULL or NOTHING. Please remove replica identity or change it to DEFAULT to migrate: public.orders in database replicated",
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import hashlib
+import zipfile
+from typing import TYPE_CHECKING
+
+import duckdb
+import pytest
+
+from dma.lib.db.archive import MANIFEST_NAME, export_archive, import_archive
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_database() -> duckdb.DuckDBPyConnection:
+    local_db = duckdb.connect()
+    local_db.execute("""
+        create table collection_postgres_tables(pkey VARCHAR, table_name VARCHAR, row_count BIGINT);
+        insert into collection_postgres_tables values ('POSTGRES_1', 'orders', 10), ('POSTGRES_1', 'lines', 12);
+        create view collection_postgres_large_tables as select * from collection_postgres_tables where row_count > 10;
+    """)
+    return local_db
+
+
+@pytest.mark.parametrize("export_format", ["csv", "parquet"])
+def test_zip_archive_round_trip(tmp_path: Path, export_format: str) -> None:
+    archive_path = tmp_path / "assessment.zip"
+
+    manifest = export_archive(_create_database(), archive_path, export_format=export_format)  # type: ignore[arg-type]
+
+    with zipfile.ZipFile(archive_path) as archive:
+        assert sorted(archive.namelist()) == sorted([MANIFEST_NAME, *(member.name for member in manifest.members)])
+        assert all(hashlib.sha256(archive.read(m.name)).hexdigest() == m.sha256 for m in manifest.members)
+    # the scratch files of the tables are removed
+    assert [path.name for path in tmp_path.iterdir()] == ["assessment.zip"]
+    imported_db = duckdb.connect()
+    import_archive(imported_db, archive_path, working_path=tmp_path)
+    assert imported_db.execute("select table_name from collection_postgres_large_tables").fetchall() == [("lines",)]
+
+
+def test_tar_zst_archive_round_trip(tmp_path: Path) -> None:
+    pytest.importorskip("zstandard")
+    archive_path = tmp_path / "assessment.tar.zst"
+
+    export_archive(_create_database(), archive_path, archive_format="tar.zst")
+
+    imported_db = duckdb.connect()
+    import_archive(imported_db, archive_path, working_path=tmp_path)
+    assert imported_db.execute("select count(*) from collection_postgres_tables").fetchall() == [(2,)]
+
+
+def test_altered_archive_is_rejected(tmp_path: Path) -> None:
+    archive_path = tmp_path / "assessment.zip"
+    export_archive(_create_database(), archive_path)
+    altered_path = tmp_path / "altered.zip"
+    with zipfile.ZipFile(archive_path) as archive, zipfile.ZipFile(altered_path, "w") as altered:
+        for name in archive.namelist():
+            content = archive.read(name)
+            altered.writestr(name, content.replace(b"orders", b"ordres"))
+
+    with pytest.raises(ApplicationError, match=r"collection_postgres_tables\.csv"):
+        import_archive(duckdb.connect(), altered_path, working_path=tmp_path)
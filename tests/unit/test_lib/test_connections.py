@@ -0,0 +1,44 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import sqlite3
+from unittest.mock import patch
+
+from dma.lib.db.base import SourceInfo
+from dma.lib.db.connections import ConnectionManager
+
+
+def _sqlite_connection(src_info: SourceInfo, database: str) -> sqlite3.Connection:
+    return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+def test_connections_are_reused_across_phases() -> None:
+    connections = ConnectionManager(SourceInfo("POSTGRES", "user", "passwd", "host", 5432), "postgres")
+    with patch("dma.lib.db.connections.get_connection", _sqlite_connection):
+        opened = []
+        for database in ("postgres", "postgres", "app", "postgres"):
+            with connections.connection(database) as connection:
+                assert connection.execute("select 1").fetchone() == (1,)
+                opened.append(connection)
+            connections.release(database)
+
+        assert opened[0] is opened[1] is opened[3]
+        assert set(connections.connections) == {"postgres"}
+        assert [(s.database, s.connections_opened, s.checkouts) for s in connections.get_stats()] == [
+            ("app", 1, 1),
+            ("postgres", 1, 3),
+        ]
+        connections.close()
+        assert connections.connections == {}
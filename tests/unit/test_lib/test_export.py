@@ -0,0 +1,81 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import duckdb
+import pytest
+
+from dma.lib.db.export import export_database, import_database
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _create_database() -> duckdb.DuckDBPyConnection:
+    local_db = duckdb.connect()
+    local_db.execute("""
+        create table collection_postgres_tables(pkey VARCHAR, table_name VARCHAR, row_count BIGINT);
+        insert into collection_postgres_tables values ('007', 'orders', 10), ('POSTGRES_1', 'orders', 12), (null, 'x', 1);
+        create table collection_postgres_empty(pkey VARCHAR, name VARCHAR);
+        create table readiness_check_summary(severity ENUM ('PASS', 'ERROR'), rule_code VARCHAR);
+        insert into readiness_check_summary values ('PASS', 'RULE_1');
+        create view collection_postgres_large_tables as select * from collection_postgres_tables where row_count > 10;
+    """)
+    return local_db
+
+
+def _read_database(local_db: duckdb.DuckDBPyConnection) -> list[list[tuple]]:
+    return [
+        local_db.execute("select * from collection_postgres_tables order by row_count").fetchall(),
+        local_db.execute("select count(*) from collection_postgres_empty").fetchall(),
+        local_db.execute("select * from readiness_check_summary").fetchall(),
+        local_db.execute("select table_name from collection_postgres_large_tables").fetchall(),
+    ]
+
+
+@pytest.mark.parametrize(
+    ("export_format", "partition_by_collection"), [("csv", False), ("parquet", False), ("parquet", True)]
+)
+def test_export_round_trip(tmp_path: Path, export_format: str, partition_by_collection: bool) -> None:
+    local_db = _create_database()
+    export_database(
+        local_db,
+        tmp_path / "export",
+        export_format=export_format,  # type: ignore[arg-type]
+        row_group_size=1000,
+        partition_by_collection=partition_by_collection,
+    )
+    # exports are loaded back from wherever they are moved to
+    export_path = (tmp_path / "export").rename(tmp_path / "moved")
+    imported_db = duckdb.connect()
+
+    import_database(imported_db, export_path)
+
+    assert _read_database(imported_db) == _read_database(local_db)
+
+
+def test_export_partitions_by_collection_key(tmp_path: Path) -> None:
+    export_database(
+        _create_database(), tmp_path, export_format="parquet", compression="snappy", partition_by_collection=True
+    )
+
+    assert sorted(path.name for path in (tmp_path / "collection_postgres_tables").iterdir()) == [
+        "pkey=007",
+        "pkey=POSTGRES_1",
+        "pkey=__HIVE_DEFAULT_PARTITION__",
+    ]
+    assert (tmp_path / "collection_postgres_empty.parquet").exists()
+    assert (tmp_path / "readiness_check_summary.parquet").exists()
@@ -0,0 +1,112 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from dma.lib.db import resources
+from dma.lib.db.local import get_duckdb_connection
+from dma.lib.db.resources import get_resource_profile
+from dma.lib.exceptions import ApplicationError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def cgroup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    cgroup_path = tmp_path / "cgroup"
+    cgroup_path.mkdir()
+    monkeypatch.setattr(resources, "_CGROUP_PATH", cgroup_path)
+    monkeypatch.setattr(resources.os, "sched_getaffinity", lambda _: set(range(8)), raising=False)
+    # 64GB of physical memory
+    monkeypatch.setattr(resources.os, "sysconf", {"SC_PAGE_SIZE": 4096, "SC_PHYS_PAGES": 16 * 1024 * 1024}.get)
+    for env in (resources.THREADS_ENV, resources.MEMORY_LIMIT_ENV, resources.MAX_TEMP_DIRECTORY_SIZE_ENV):
+        monkeypatch.delenv(env, raising=False)
+    return cgroup_path
+
+
+def test_profile_follows_cgroup_limits(cgroup: Path, tmp_path: Path) -> None:
+    (cgroup / "cpu.max").write_text("200000 100000\n")
+    (cgroup / "memory.max").write_text(f"{4096 * 1024 * 1024}\n")
+
+    profile = get_resource_profile(tmp_path)
+
+    assert (profile.detected_cores, profile.detected_memory_mb) == (2, 4096)
+    assert (profile.threads, profile.memory_limit) == (2, "3072MB")
+    assert profile.max_temp_directory_size.endswith("MB")
+    assert profile.overrides == ""
+
+
+def test_profile_is_shared_between_workers(cgroup: Path, tmp_path: Path) -> None:
+    (cgroup / "memory.max").write_text(f"{2048 * 1024 * 1024}\n")
+
+    profile = get_resource_profile(tmp_path, share=4)
+
+    assert (profile.threads, profile.memory_limit, profile.share) == (2, "384MB", 4)
+
+
+def test_explicit_settings_override_the_environment(
+    cgroup: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(resources.THREADS_ENV, "3")
+    monkeypatch.setenv(resources.MEMORY_LIMIT_ENV, "2GB")
+    monkeypatch.setenv(resources.MAX_TEMP_DIRECTORY_SIZE_ENV, "10GB")
+
+    profile = get_resource_profile(tmp_path, memory_limit="512MB")
+
+    assert (profile.threads, profile.memory_limit, profile.max_temp_directory_size) == (3, "512MB", "10GB")
+    assert profile.overrides == "threads,memory_limit,max_temp_directory_size"
+
+    monkeypatch.setenv(resources.THREADS_ENV, "many")
+    with pytest.raises(ApplicationError, match=resources.THREADS_ENV):
+        get_resource_profile(tmp_path)
+
+
+def test_connection_records_the_profile(cgroup: Path, tmp_path: Path) -> None:
+    with get_duckdb_connection(working_path=tmp_path, threads=3, memory_limit="512MB") as local_db:
+        settings = local_db.execute(
+            "select current_setting('threads'), current_setting('memory_limit'), current_setting('temp_directory')"
+        ).fetchone()
+        recorded = local_db.execute(
+            "select threads, memory_limit, detected_cores, overrides from dma_resource_profile"
+        ).fetchall()
+
+    assert settings == (3, "488.2 MiB", str(tmp_path))
+    assert recorded == [(3, "512MB", 8, "threads,memory_limit")]
+
+
+@pytest.mark.parametrize("cpu_controller", ["cpu", "cpu,cpuacct"])
+def test_profile_follows_cgroup_v1_cpu_quota(cgroup: Path, tmp_path: Path, cpu_controller: str) -> None:
+    (cgroup / cpu_controller).mkdir()
+    (cgroup / cpu_controller / "cpu.cfs_quota_us").write_text("150000\n")
+    (cgroup / cpu_controller / "cpu.cfs_period_us").write_text("100000\n")
+
+    assert get_resource_profile(tmp_path).detected_cores == 2
+
+    (cgroup / cpu_controller / "cpu.cfs_quota_us").write_text("-1\n")
+    assert get_resource_profile(tmp_path).detected_cores == 8
+
+
+def test_connection_accepts_the_free_disk_fallback(
+    cgroup: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(resources, "detect_free_disk_mb", lambda _: None)
+
+    with get_duckdb_connection(working_path=tmp_path) as local_db:
+        setting = local_db.execute("select current_setting('max_temp_directory_size')").fetchone()
+
+    assert setting == ("90% of available disk space",)
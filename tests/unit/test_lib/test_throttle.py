@@ -0,0 +1,60 @@
+# Copyright 2024 Google LLC
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     https://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import threading
+import time
+
+from dma.lib.db.throttle import AdaptiveLimiter
+
+
+def test_limit_follows_source_load() -> None:
+    loads = iter([4, 12, 11, 2, 2, 2, None])
+    limiter = AdaptiveLimiter(max_limit=8, load_ceiling=10, sample_load=lambda: next(loads), sample_interval=0)
+
+    # sized to the headroom, then halved while above the ceiling, then grown back one query at a time
+    assert [limiter.adjust() for _ in range(7)] == [6, 3, 1, 2, 3, 4, 4]
+    assert limiter.last_load == 2
+
+
+def test_samples_are_rate_limited() -> None:
+    samples: list[int] = []
+
+    def sample_load() -> int:
+        samples.append(1)
+        return 0
+
+    limiter = AdaptiveLimiter(max_limit=4, load_ceiling=10, sample_load=sample_load, sample_interval=60)
+    limiter.adjust()
+    limiter.adjust()
+    assert samples == [1]
+
+
+def test_slots_wait_for_the_limit() -> None:
+    limiter = AdaptiveLimiter(max_limit=4, load_ceiling=10, sample_load=lambda: 9)
+    limiter.adjust()
+    in_flight: list[int] = []
+
+    def _run() -> None:
+        with limiter.slot():
+            in_flight.append(limiter.in_flight)
+            time.sleep(0.05)
+
+    threads = [threading.Thread(target=_run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert limiter.limit == 1
+    assert in_flight == [1, 1, 1, 1]
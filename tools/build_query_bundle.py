@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""Pre-parse the collection queries into the query bundle shipped with the package."""
+
+from __future__ import annotations
+
+from dma.collector.query_managers.bundle import write_query_bundle
+from dma.collector.query_managers.registry import QUERY_BUNDLE_PATH, get_query_paths
+
+
+def main() -> None:
+    bundle = write_query_bundle(QUERY_BUNDLE_PATH, get_query_paths())
+    for engine, bundled in bundle.engines.items():
+        print(f"=> Bundled {len(bundled.queries)} {engine} queries ({bundled.content_hash[:12]})")
+    print(f"=> Wrote {QUERY_BUNDLE_PATH}")
+
+
+if __name__ == "__main__":
+    main()